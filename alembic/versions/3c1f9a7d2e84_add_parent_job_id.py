@@ -0,0 +1,35 @@
+"""Add parent_job_id to processing_jobs
+
+Revision ID: 3c1f9a7d2e84
+Revises: b648752192e5
+Create Date: 2025-12-08 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op  # type: ignore[import-not-found]
+import sqlalchemy as sa  # type: ignore[import-not-found]
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f9a7d2e84'  # type: ignore[assignment]
+down_revision: Union[str, Sequence[str], None] = 'b648752192e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('processing_jobs', sa.Column('parent_job_id', sa.String(length=100), nullable=True))
+    op.create_index(op.f('ix_processing_jobs_parent_job_id'), 'processing_jobs', ['parent_job_id'], unique=False)
+    op.create_foreign_key(
+        'fk_processing_jobs_parent_job_id', 'processing_jobs', 'processing_jobs',
+        ['parent_job_id'], ['job_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_processing_jobs_parent_job_id', 'processing_jobs', type_='foreignkey')
+    op.drop_index(op.f('ix_processing_jobs_parent_job_id'), table_name='processing_jobs')
+    op.drop_column('processing_jobs', 'parent_job_id')
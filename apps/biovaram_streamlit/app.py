@@ -2,6 +2,7 @@
 
 import streamlit as st
 import os
+import sys
 import io
 import time
 import numpy as np
@@ -20,6 +21,20 @@ try:
 except Exception:
     use_pymiescatt = False
 
+# Shared physics package (src/physics) - same sizing model as the API and scripts
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+MIE_CACHE_DIR = os.environ.get("CRMIT_MIE_CACHE_DIR", os.path.join(PROJECT_ROOT, "data", "cache", "mie"))
+use_physics_model = False
+try:
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    from src.physics.detector_scatter import DetectorScatterModel, DetectorGeometry  # type: ignore[import-not-found]
+    from src.physics.mie_cache import MieTableCache  # type: ignore[import-not-found]
+    from src.physics.ratio_index import RatioSizingIndex  # type: ignore[import-not-found]
+    use_physics_model = True
+except Exception:
+    use_physics_model = False
+
 use_fcsparser = False
 try:
     import fcsparser  # type: ignore[import-not-found]
@@ -1123,6 +1138,25 @@ def load_dataframe_from_uploaded(uploaded_file_or_path):
 def build_theoretical_lookup(lambda_nm, n_particle, n_medium, fsc_range, ssc_range, diameters):  # type: ignore[no-untyped-def]
     angles = np.linspace(0, 180, 1000)
     ratios = np.zeros_like(diameters, dtype=float)
+    if use_physics_model:
+        # Detector-angle-integrated model, tables persisted on disk across processes
+        try:
+            model = DetectorScatterModel(
+                wavelength_nm=float(lambda_nm),
+                n_particle=float(n_particle),
+                n_medium=float(n_medium),
+                geometry=DetectorGeometry(
+                    fsc_angle_range=(float(fsc_range[0]), float(fsc_range[1])),
+                    ssc_angle_range=(float(ssc_range[0]), float(ssc_range[1]))
+                ),
+                table_cache=MieTableCache(MIE_CACHE_DIR)
+            )
+            ratios = model.fsc_ssc_ratio(np.asarray(diameters, dtype=float))
+            if np.any(np.isfinite(ratios)):
+                ratios = np.nan_to_num(ratios, nan=np.nanmax(ratios[np.isfinite(ratios)]))
+                return angles, ratios
+        except Exception:
+            pass  # Fall through to PyMieScatt / approximation
     if use_pymiescatt:
         for i, D in enumerate(diameters):
             try:
@@ -1147,36 +1181,41 @@ def build_theoretical_lookup(lambda_nm, n_particle, n_medium, fsc_range, ssc_ran
 def estimate_diameters_vectorized(measured_ratios, theoretical_ratios, diameters):
     """
     Vectorized particle size estimation - much faster than row-by-row iteration.
-    Uses NumPy broadcasting to find the closest theoretical ratio for each measured ratio.
+    Finds the closest theoretical ratio for each measured ratio via a sorted
+    index (O(N log M) time, O(N) memory) instead of an N x M difference matrix.
     """
     # Convert to numpy arrays
-    measured = np.asarray(measured_ratios)
-    theoretical = np.asarray(theoretical_ratios)
-    diams = np.asarray(diameters)
-    
+    measured = np.asarray(measured_ratios, dtype=float)
+    theoretical = np.asarray(theoretical_ratios, dtype=float)
+    diams = np.asarray(diameters, dtype=float)
+
+    if use_physics_model and np.any(np.isfinite(theoretical)):
+        return RatioSizingIndex(diams, theoretical).nearest(measured)
+
     # Create output arrays
     n = len(measured)
     estimated_diameters = np.full(n, np.nan)
     matched_ratios = np.full(n, np.nan)
     matched_indices = np.full(n, np.nan)
-    
+
     # Find valid (non-NaN) measurements
     valid_mask = np.isfinite(measured)
     valid_measured = measured[valid_mask]
-    
+
     if len(valid_measured) > 0:
-        # Broadcasting: compute absolute differences for all valid measurements at once
-        # Shape: (n_valid, n_theoretical)
-        diffs = np.abs(valid_measured[:, np.newaxis] - theoretical[np.newaxis, :])
-        
-        # Find best match index for each measurement
-        best_indices = np.argmin(diffs, axis=1)
-        
+        # Fallback: broadcast in blocks so memory stays bounded
+        best_indices = np.empty(len(valid_measured), dtype=int)
+        block = max(1, 2_000_000 // max(len(theoretical), 1))
+        for start in range(0, len(valid_measured), block):
+            chunk = valid_measured[start:start + block]
+            diffs = np.abs(chunk[:, np.newaxis] - theoretical[np.newaxis, :])
+            best_indices[start:start + block] = np.argmin(diffs, axis=1)
+
         # Assign results
         estimated_diameters[valid_mask] = diams[best_indices]
         matched_ratios[valid_mask] = theoretical[best_indices]
         matched_indices[valid_mask] = best_indices
-    
+
     return estimated_diameters, matched_ratios, matched_indices
 
 
@@ -1701,7 +1740,9 @@ with tab2:
         ignore_negative = st.checkbox("Ignore negative -H values (replace with NaN)", value=True)
         drop_na = st.checkbox("Drop rows missing FSC/SSC after cleaning", value=True)
         st.markdown("---")
-        if use_pymiescatt:
+        if use_physics_model:
+            st.success("Detector-integrated Mie model (src/physics) used")
+        elif use_pymiescatt:
             st.success("PyMieScatt detected - full Mie used")
         else:
             st.warning("PyMieScatt not found - running fallback (approximate)")
@@ -24,7 +24,7 @@ KEY FEATURES:
 - Memory Efficient: Processes files in batches, releases memory after each
 - Progress Tracking: Real-time tqdm progress bars for user feedback
 - Error Handling: Continues processing even if individual files fail
-- Skip Existing: Can resume interrupted batches without reprocessing
+- Incremental: Content-hash manifest skips unchanged files; interrupted batches resume
 - Comprehensive Logging: Detailed logs saved for debugging and auditing
 - Quality Reports: Aggregate statistics across all processed files
 
@@ -88,6 +88,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import FCS parser for reading .fcs files
 from src.parsers.fcs_parser import FCSParser
+from src.parsers.fcs_scan import scan_fcs_headers
+from src.parsers.conversion_manifest import ConversionManifest
 
 # Import configuration settings (paths, processing parameters)
 from src.config.settings import (
@@ -150,7 +152,8 @@ class BatchFCSProcessor:
         input_dir: Path,
         output_dir: Path,
         max_workers: int = MAX_WORKERS,
-        skip_existing: bool = True
+        skip_existing: bool = True,
+        manifest_path: Optional[Path] = None
     ):
         """
         Initialize batch processor with configuration and setup logging.
@@ -169,8 +172,11 @@ class BatchFCSProcessor:
             max_workers: Number of parallel worker processes
                         Recommended: CPU_count - 1 (leave one core for OS)
                         Set to 1 for sequential processing (debugging)
-            skip_existing: If True, skip files that already have .parquet output
+            skip_existing: If True, skip files whose current content was already
+                          converted by this parser version (see manifest_path)
                           If False, reprocess all files (overwrite existing)
+            manifest_path: SQLite conversion manifest
+                          (default: output_dir/_conversion_manifest.sqlite)
         
         Creates:
             - output_dir/: Main output directory for parquet files
@@ -203,6 +209,15 @@ class BatchFCSProcessor:
         # errors: only failed files (subset of results)
         self.results: List[Dict[str, Any]] = []
         self.errors: List[Dict[str, Any]] = []
+        # Header-only scan of the files to process (see find_fcs_files)
+        self.catalog: List[Dict[str, Any]] = []
+        
+        # Content hash + parser version of every converted file; results are
+        # recorded as each file finishes, so a crashed run resumes where it stopped
+        self.manifest = ConversionManifest(
+            manifest_path or self.output_dir / '_conversion_manifest.sqlite',
+            version=f"FCSParser-{FCSParser.PARSER_VERSION}"
+        )
         
         # Configure logging to file
         # Creates timestamped log file for this processing session
@@ -231,10 +246,12 @@ class BatchFCSProcessor:
         
         SKIP EXISTING LOGIC:
         --------------------
-        If skip_existing=True:
-            - For each input.fcs, check if output.parquet exists
-            - If exists: skip (log and exclude from processing list)
-            - If not exists: include in processing list
+        If skip_existing=True, the conversion manifest decides:
+            - Content hash + parser version already converted and the
+              output still exists: skip
+            - New file, modified content, new parser version, failed or
+              interrupted conversion: include in processing list
+        Hashes are cached by size + mtime, so unchanged files are not re-read.
         This enables resuming interrupted batch processing without reprocessing.
         
         FILE MATCHING:
@@ -242,21 +259,27 @@ class BatchFCSProcessor:
         Output path: output_dir / "{input_stem}.parquet"
         Example: "sample1.fcs" → "sample1.parquet"
         
+        WORK SIZING:
+        ------------
+        Files needing processing get a header-only scan (HEADER + TEXT
+        segments, thread pool) stored in self.catalog, and are returned
+        largest first by event count so the biggest files start early and
+        don't end up as stragglers on a single worker.
+        
         LOGGING:
         --------
         - Logs total files found
-        - Logs each skipped file (if skip_existing=True)
+        - Logs how many files are new or changed (if skip_existing=True)
         - Logs final count of files needing processing
         
         Returns:
-            List[Path]: Paths to .fcs files that need processing
+            List[Path]: Paths to .fcs files that need processing, largest first
         
         Example:
             >>> processor.input_dir = Path("data/raw/fcs")
             >>> files = processor.find_fcs_files()
             >>> # Found 100 FCS files
-            >>> # Skipping sample1.fcs (already processed)
-            >>> # ...
+            >>> # 85/100 files new or changed since last conversion (version FCSParser-2.0)
             >>> # 85 files need processing
         """
         # Recursively find all .fcs files
@@ -266,23 +289,47 @@ class BatchFCSProcessor:
         
         # Filter out already-processed files if requested
         if self.skip_existing:
-            # files_to_process will contain only unprocessed files
-            files_to_process = []
-            for fcs_file in fcs_files:
-                # Check if corresponding parquet file exists
-                parquet_file = self.output_dir / f"{fcs_file.stem}.parquet"
-                if not parquet_file.exists():
-                    # No parquet output → needs processing
-                    files_to_process.append(fcs_file)
-                else:
-                    # Parquet exists → skip
-                    logger.info(f"Skipping {fcs_file.name} (already processed)")
-            
-            logger.info(f"{len(files_to_process)} files need processing")
-            return files_to_process
+            # Only new or modified files (or all, after a parser version bump)
+            fcs_files = self.manifest.pending(fcs_files, output_for=self._output_path)
+            logger.info(f"{len(fcs_files)} files need processing")
+        
+        return self._plan_by_event_count(fcs_files)
+    
+    def _output_path(self, fcs_path: Path) -> Path:
+        """Parquet output for an FCS file: output_dir / "{input_stem}.parquet"."""
+        return self.output_dir / f"{fcs_path.stem}.parquet"
+    
+    def _record(self, result: Dict[str, Any]) -> None:
+        """Store a processing result (success or failure) and update the manifest."""
+        self.results.append(result)
+        if result['status'] == 'success':
+            self.manifest.record_success(Path(result['file_path']), Path(result['output_file']))
+            return
+        if result['status'] in ('error', 'exception'):
+            self.errors.append(result)
+        self.manifest.record_failure(Path(result['file_path']), result.get('error') or result['status'])
+    
+    def _plan_by_event_count(self, fcs_files: List[Path]) -> List[Path]:
+        """
+        Scan headers of the files to process and order them largest first.
+        
+        Files whose header cannot be read keep their place at the end (they
+        fail, and are reported, in process_single_file).
         
-        # If not skipping, return all found files
-        return fcs_files
+        Args:
+            fcs_files: Files to process
+            
+        Returns:
+            The same files sorted by descending event count
+        """
+        self.catalog = scan_fcs_headers(fcs_files, max_workers=max(self.max_workers, 8))
+        events = {
+            Path(entry['file_path']): entry.get('total_events', -1) if not entry['error'] else -1
+            for entry in self.catalog
+        }
+        total_events = sum(n for n in events.values() if n > 0)
+        logger.info(f"Planned {len(fcs_files)} files, {total_events:,} events total")
+        return sorted(fcs_files, key=lambda path: events.get(path, -1), reverse=True)
     
     def process_single_file(self, fcs_path: Path) -> Dict[str, Any]:
         """
@@ -292,11 +339,11 @@ class BatchFCSProcessor:
         --------------------
         1. Initialize FCSParser instance
         2. Validate FCS file format and structure
-        3. Parse binary FCS data to DataFrame
+        3. Open FCS file (memory-maps events, nothing is materialized)
         4. Extract metadata (sample IDs, instrument info, etc.)
         5. Calculate comprehensive statistics
-        6. Run quality control checks
-        7. Save to Parquet format with compression
+        6. Run quality control checks (streamed in chunks)
+        7. Stream events to Parquet format with compression
         8. Calculate performance metrics
         9. Return detailed result dictionary
         
@@ -347,7 +394,11 @@ class BatchFCSProcessor:
         
         MEMORY MANAGEMENT:
         ------------------
-        After processing each file, explicitly calls gc.collect() to
+        Events are streamed in parser.chunk_size blocks for QC, Parquet and
+        statistics. Statistics buffer at most STREAMING_EXACT_LIMIT float32
+        values per channel (exact results) and switch to bounded-memory
+        sketches beyond that, so a worker never holds a whole acquisition in
+        memory. After processing each file, explicitly calls gc.collect() to
         release memory. This prevents memory accumulation during large
         batch processing (100s of files).
         
@@ -384,9 +435,10 @@ class BatchFCSProcessor:
                 result['error'] = 'File validation failed'
                 return result
             
-            # Step 3: Parse FCS binary data
-            # Returns DataFrame with all events (rows) and channels (columns)
-            data = parser.parse()
+            # Step 3: Open FCS file
+            # Memory-maps the event data; later steps stream it in chunks
+            parser.open()
+            n_events = parser.n_events
             
             # Step 4: Extract metadata
             # Gets sample IDs, instrument info, acquisition parameters
@@ -402,7 +454,7 @@ class BatchFCSProcessor:
             
             # Step 7: Save to Parquet format
             # Uses Snappy compression for good balance of speed/size
-            output_path = self.output_dir / f"{fcs_path.stem}.parquet"
+            output_path = self._output_path(fcs_path)
             parser.to_parquet(output_path)
             
             # Step 8: Calculate performance metrics
@@ -421,7 +473,7 @@ class BatchFCSProcessor:
                 'output_size_mb': output_size_mb,
                 'input_size_mb': input_size_mb,
                 'compression_ratio': compression_ratio,
-                'events_parsed': len(data),
+                'events_parsed': n_events,
                 'channels': len(parser.channel_names),
                 'sample_id': parser.sample_id,
                 'biological_sample_id': parser.biological_sample_id,
@@ -438,7 +490,7 @@ class BatchFCSProcessor:
                 result['channel_count'] = summary['channel_count']
             
             # Log success
-            logger.info(f"✅ Processed {fcs_path.name}: {len(data):,} events → {result['output_size_mb']:.2f} MB")
+            logger.info(f"✅ Processed {fcs_path.name}: {n_events:,} events → {result['output_size_mb']:.2f} MB")
             
         except Exception as e:
             # Handle any error during processing
@@ -475,21 +527,15 @@ class BatchFCSProcessor:
                 for future in as_completed(future_to_file):
                     fcs_file = future_to_file[future]
                     try:
-                        result = future.result()
-                        self.results.append(result)
-                        
-                        if result['status'] == 'error':
-                            self.errors.append(result)
+                        self._record(future.result())
                     
                     except Exception as e:
-                        error_result = {
+                        self._record({
                             'file_name': fcs_file.name,
                             'file_path': str(fcs_file),
                             'status': 'exception',
                             'error': str(e)
-                        }
-                        self.errors.append(error_result)
-                        self.results.append(error_result)
+                        })
                         logger.error(f"Exception processing {fcs_file.name}: {e}")
                     
                     pbar.update(1)
@@ -504,11 +550,7 @@ class BatchFCSProcessor:
         logger.info("Starting sequential processing")
         
         for fcs_file in tqdm(fcs_files, desc="Processing FCS files", unit="file"):
-            result = self.process_single_file(fcs_file)
-            self.results.append(result)
-            
-            if result['status'] == 'error':
-                self.errors.append(result)
+            self._record(self.process_single_file(fcs_file))
     
     def generate_summary_report(self) -> pd.DataFrame:
         """
@@ -13,7 +13,7 @@ sys.path.insert(0, str(project_root))
 from typing import List, Dict, Any
 import pandas as pd
 from datetime import datetime
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from loguru import logger
 
 from src.parsers.nta_parser import NTAParser
@@ -163,6 +163,10 @@ def process_batch(
     """
     Process multiple NTA files in parallel.
     
+    Uses a thread pool: the files are small and section parsing runs in
+    pandas' C reader, so threads avoid process start-up and result
+    pickling while sharing the parser's compiled patterns.
+    
     Args:
         nta_files: List of NTA file paths
         output_dir: Output directory for Parquet files
@@ -176,7 +180,7 @@ def process_batch(
     logger.info(f"Processing {len(nta_files)} NTA files...")
     
     # Process files in parallel
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit all tasks
         future_to_file = {
             executor.submit(process_single_file, file_path, output_dir): file_path
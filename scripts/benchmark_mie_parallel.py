@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel Mie batch calculation.
+
+Reports particles/sec of MieBatchExecutor at several worker counts and checks
+that results are identical regardless of the number of workers.
+
+Usage:
+    python scripts/benchmark_mie_parallel.py
+    python scripts/benchmark_mie_parallel.py --particles 1000000 --workers 1 4 16 32
+    python scripts/benchmark_mie_parallel.py --output reports/mie_parallel_benchmark.json
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from loguru import logger
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.physics.mie_scatter import MieScatterCalculator
+from src.physics.parallel import benchmark_workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel Mie batch calculation")
+    parser.add_argument('--particles', type=int, default=200_000, help='Number of synthetic particles')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16, 32], help='Worker counts to test')
+    parser.add_argument('--chunk-size', type=int, default=5000, help='Particles per task')
+    parser.add_argument('--wavelength', type=float, default=488.0, help='Laser wavelength (nm)')
+    parser.add_argument('--n-particle', type=float, default=1.40, help='Particle refractive index')
+    parser.add_argument('--output', type=Path, help='Optional JSON file for the results')
+    args = parser.parse_args()
+
+    calc = MieScatterCalculator(wavelength_nm=args.wavelength, n_particle=args.n_particle, n_medium=1.33)
+
+    logger.info("=" * 60)
+    logger.info(f"⚡ Parallel Mie benchmark: {args.particles:,} particles, chunk={args.chunk_size:,}")
+    logger.info("=" * 60)
+
+    results = benchmark_workers(
+        calc,
+        n_particles=args.particles,
+        worker_counts=args.workers,
+        chunk_size=args.chunk_size
+    )
+
+    logger.info("-" * 60)
+    for row in results:
+        logger.info(
+            f"  {row['workers']:>3} workers: {row['particles_per_sec']:>12,.0f} particles/s "
+            f"(speedup {row['speedup']:.1f}×)"
+        )
+    logger.info("✅ Results identical across all worker counts")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({
+            "particles": args.particles,
+            "chunk_size": args.chunk_size,
+            "results": results
+        }, indent=2))
+        logger.info(f"Saved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark the physics (sizing) module and check for regressions.
+
+Runs the cases in src/physics/benchmark.py on synthetic arrays, compares
+throughput and peak memory with the median of recent runs in the history
+file, appends the run, and exits with status 1 on a regression.
+
+Usage:
+    python scripts/benchmark_physics.py
+    python scripts/benchmark_physics.py --sizes 1000 100000 --threshold 0.15
+    python scripts/benchmark_physics.py --case predict_batch --case diameter_from_scatter_batch
+    python scripts/benchmark_physics.py --no-record     # compare only, don't extend history
+"""
+
+import sys
+import argparse
+from pathlib import Path
+from loguru import logger
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.physics.benchmark import BenchmarkHistory, run_benchmarks, DEFAULT_SIZES
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the physics module with regression thresholds")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='Event array sizes')
+    parser.add_argument('--repeats', type=int, default=3, help='Timed repetitions (best is kept)')
+    parser.add_argument('--case', action='append', dest='cases', help='Run only this case (repeatable)')
+    parser.add_argument('--history', type=Path, default=Path('data/benchmarks/physics_history.json'),
+                        help='JSON history file')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed throughput drop vs baseline (fraction, default 0.25)')
+    parser.add_argument('--memory-threshold', type=float, default=None,
+                        help='Allowed peak-memory growth (fraction, default: --threshold)')
+    parser.add_argument('--window', type=int, default=5, help='Baseline = median of the last N runs')
+    parser.add_argument('--no-record', action='store_true', help="Don't append this run to the history")
+    args = parser.parse_args()
+
+    logger.info("=" * 80)
+    logger.info(f"⏱️  Physics benchmark: sizes={args.sizes}, repeats={args.repeats}")
+    logger.info("=" * 80)
+
+    run = run_benchmarks(sizes=args.sizes, repeats=args.repeats, only=args.cases)
+
+    history = BenchmarkHistory(args.history)
+    regressions = history.compare(
+        run,
+        threshold=args.threshold,
+        memory_threshold=args.memory_threshold,
+        window=args.window
+    )
+
+    if not args.no_record:
+        history.append(run)
+        logger.info(f"Recorded run in {args.history}")
+
+    logger.info("-" * 80)
+    if regressions:
+        logger.error(f"❌ {len(regressions)} regression(s) beyond threshold:")
+        for regression in regressions:
+            logger.error(f"  {regression}")
+        return 1
+
+    logger.success("✅ No regressions against history baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Append FCS files to the partitioned event dataset.
+
+Streams every .fcs file under a directory into a Hive-partitioned Parquet
+dataset (instrument_type / biological_sample_id / acquisition_date) and
+extends its _metadata summary. Existing data files are left untouched, and
+files already in the dataset (same name and content) are skipped, so the
+script can be re-run after new acquisitions.
+
+Usage:
+    python scripts/build_event_dataset.py nanoFACS
+    python scripts/build_event_dataset.py /archive/fcs --output data/parquet/events
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+from loguru import logger
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.parsers.event_dataset import EventDataset
+from src.parsers.fcs_parser import FCSParser
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Append FCS files to the partitioned event dataset")
+    parser.add_argument('input_dir', type=Path, help='Directory searched recursively for .fcs files')
+    parser.add_argument('--output', type=Path, default=Path('data/parquet/events'),
+                        help='Dataset root directory')
+    parser.add_argument('--compression', default='snappy', help='Parquet compression codec')
+    args = parser.parse_args()
+
+    if not args.input_dir.is_dir():
+        logger.error(f"❌ Not a directory: {args.input_dir}")
+        return 1
+
+    fcs_files = sorted(args.input_dir.rglob('*.fcs'))
+    if not fcs_files:
+        logger.warning(f"No FCS files found under {args.input_dir}")
+        return 0
+
+    dataset = EventDataset(args.output)
+    start = time.perf_counter()
+    failed = 0
+    skipped = 0
+    for fcs_path in fcs_files:
+        if dataset.contains(fcs_path):
+            skipped += 1
+            continue
+        try:
+            dataset.append_fcs(FCSParser(fcs_path), skip_existing=False, compression=args.compression)
+        except Exception as e:
+            failed += 1
+            logger.error(f"❌ {fcs_path.name}: {e}")
+
+    logger.success(
+        f"✅ Appended {len(fcs_files) - failed - skipped}/{len(fcs_files)} files "
+        f"({skipped} already in dataset) in {time.perf_counter() - start:.2f}s → {args.output}"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
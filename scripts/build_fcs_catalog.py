@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Build a catalog of FCS files from their headers only.
+
+Reads the HEADER and TEXT segments of every .fcs file under a directory
+(no event data) on a thread pool and writes one row per file: event and
+parameter counts, channel names, acquisition date/time and instrument
+keywords. Unreadable files are kept with their error message.
+
+Usage:
+    python scripts/build_fcs_catalog.py nanoFACS
+    python scripts/build_fcs_catalog.py /archive/fcs --output data/catalog/fcs_catalog.csv --workers 32
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+import pandas as pd
+from loguru import logger
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.parsers.fcs_scan import scan_fcs_headers
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Catalog FCS files from HEADER/TEXT segments only")
+    parser.add_argument('input_dir', type=Path, help='Directory searched recursively for .fcs files')
+    parser.add_argument('--output', type=Path, default=Path('data/catalog/fcs_catalog.csv'),
+                        help='Output CSV (or .parquet) file')
+    parser.add_argument('--workers', type=int, default=None, help='Thread pool size')
+    args = parser.parse_args()
+
+    if not args.input_dir.is_dir():
+        logger.error(f"❌ Not a directory: {args.input_dir}")
+        return 1
+
+    start = time.perf_counter()
+    catalog = scan_fcs_headers(args.input_dir, max_workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    if not catalog:
+        logger.warning(f"No FCS files found under {args.input_dir}")
+        return 0
+
+    df = pd.DataFrame(catalog)
+    for column in ('channel_names', 'channel_labels'):
+        if column in df:
+            df[column] = df[column].map(lambda names: ';'.join(names) if isinstance(names, list) else None)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    if args.output.suffix == '.parquet':
+        df.to_parquet(args.output, index=False)
+    else:
+        df.to_csv(args.output, index=False)
+
+    logger.success(f"✅ Cataloged {len(df)} files in {elapsed:.2f}s → {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,8 @@ Features:
 - Save as Parquet for efficient storage/processing
 - Preserve all metadata and channel data
 - Generate processing summary
+- Incremental: files already converted (same content hash and converter
+  version, see CONVERTER_VERSION) are skipped; interrupted runs resume
 
 Author: CRMIT Backend Team
 Date: November 18, 2025
@@ -18,7 +20,7 @@ Date: November 18, 2025
 
 import sys
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import pandas as pd
 from loguru import logger
 from concurrent.futures import ProcessPoolExecutor, as_completed
@@ -28,12 +30,17 @@ import time
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.parsers.fcs_parser import FCSParser
+from src.parsers.conversion_manifest import ConversionManifest
 from src.visualization.fcs_plots import calculate_particle_size
 
 # Configure logger
 logger.remove()
 logger.add(sys.stdout, format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>")
 
+# Parser version plus this script's particle-size step; bump the suffix when
+# calculate_particle_size() output changes so every file is reconverted
+CONVERTER_VERSION = f"FCSParser-{FCSParser.PARSER_VERSION}+size-1"
+
 
 def process_single_fcs(fcs_path: Path, output_dir: Path) -> Dict[str, Any]:
     """
@@ -109,11 +116,22 @@ def process_single_fcs(fcs_path: Path, output_dir: Path) -> Dict[str, Any]:
         }
 
 
+def _record(manifest: Optional[ConversionManifest], fcs_path: Path, result: Dict[str, Any]) -> None:
+    """Store one conversion result in the manifest (if any)."""
+    if manifest is None:
+        return
+    if result['status'] == 'SUCCESS':
+        manifest.record_success(fcs_path, result['output_file'])
+    else:
+        manifest.record_failure(fcs_path, result.get('reason', 'Unknown error'))
+
+
 def convert_fcs_directory(
     fcs_dir: Path,
     output_dir: Path,
     parallel: bool = True,
-    max_workers: int = 4
+    max_workers: int = 4,
+    manifest: Optional[ConversionManifest] = None
 ) -> pd.DataFrame:
     """
     Convert all FCS files in a directory to Parquet.
@@ -123,6 +141,9 @@ def convert_fcs_directory(
         output_dir: Output directory for Parquet files
         parallel: Use parallel processing
         max_workers: Number of parallel workers
+        manifest: Conversion manifest; files it lists as converted (same
+                  content and version, output present) are skipped and each
+                  result is recorded as soon as it completes
         
     Returns:
         DataFrame with conversion results
@@ -135,8 +156,11 @@ def convert_fcs_directory(
     
     logger.info(f"Found {len(fcs_files)} FCS files to convert")
     
+    if manifest is not None:
+        fcs_files = manifest.pending(fcs_files, output_for=lambda p: output_dir / f"{p.stem}.parquet")
+    
     if len(fcs_files) == 0:
-        logger.warning("No FCS files found!")
+        logger.warning("No FCS files to convert!")
         return pd.DataFrame()
     
     # Create output directory
@@ -158,6 +182,7 @@ def convert_fcs_directory(
             for i, future in enumerate(as_completed(futures), 1):
                 result = future.result()
                 results.append(result)
+                _record(manifest, futures[future], result)
                 
                 if result['status'] == 'SUCCESS':
                     logger.info(f"[{i}/{len(fcs_files)}] ✅ {result['file']}: "
@@ -171,6 +196,7 @@ def convert_fcs_directory(
             logger.info(f"[{i}/{len(fcs_files)}] Processing: {fcs_file.name}")
             result = process_single_fcs(fcs_file, output_dir)
             results.append(result)
+            _record(manifest, fcs_file, result)
             
             if result['status'] == 'SUCCESS':
                 logger.info(f"  ✅ {result['events']:,} events, {result['compression_ratio']:.1f}x compression")
@@ -223,6 +249,10 @@ def main():
     ]
     
     all_results = []
+    manifest = ConversionManifest(
+        project_root / "data" / "parquet" / "nanofacs" / "_conversion_manifest.sqlite",
+        version=CONVERTER_VERSION
+    )
     
     for fcs_dir in fcs_directories:
         if not fcs_dir.exists():
@@ -240,7 +270,8 @@ def main():
             fcs_dir=fcs_dir,
             output_dir=output_dir,
             parallel=True,
-            max_workers=4
+            max_workers=4,
+            manifest=manifest
         )
         
         if len(results_df) > 0:
@@ -13,6 +13,13 @@ Usage:
     
     # Dry run (no changes):
     python scripts/reprocess_parquet_with_mie.py --dry-run
+    
+    # Stored instrument calibration (fitted once per bead run, then reused):
+    python scripts/reprocess_parquet_with_mie.py --instrument ZE5-01 --beads beads_2025-11-18.json --bead-date 2025-11-18
+    python scripts/reprocess_parquet_with_mie.py --instrument ZE5-01
+    
+    # Size-sorted event store for fast size-range reads (loses event/Time order):
+    python scripts/reprocess_parquet_with_mie.py --sort-by-size
 """
 
 import sys
@@ -22,6 +29,7 @@ import numpy as np
 from typing import List, Dict, Optional, Any
 from loguru import logger
 import argparse
+import json
 from datetime import datetime
 
 # Add project root to path
@@ -29,6 +37,10 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.visualization.fcs_plots import calculate_particle_size
+from src.physics.calibration_store import CalibrationStore
+from src.physics.mie_scatter import FCMPASSCalibrator
+from src.physics.mie_cache import MieTableCache
+from src.parsers.parquet_writer import ParquetWriter
 
 
 def find_parquet_files(directory: Path, recursive: bool = True) -> List[Path]:
@@ -46,12 +58,19 @@ def reprocess_file(
     input_file: Path,
     output_file: Path,
     use_mie: bool = True,
+    wavelength_nm: float = 488.0,
     calibration_beads: Optional[Dict[float, float]] = None,
-    dry_run: bool = False
+    dry_run: bool = False,
+    calibrator: Optional[FCMPASSCalibrator] = None,
+    sort_by_size: bool = False
 ) -> Dict[str, Any]:
     """
     Reprocess single parquet file with Mie-based sizing.
     
+    Events keep their acquisition order unless `sort_by_size` is set, which
+    sorts them by particle_size_nm so size-range reads
+    (ParquetWriter.read_events) skip most row groups.
+    
     Returns:
         Dict with processing statistics
     """
@@ -71,7 +90,9 @@ def reprocess_file(
         df = calculate_particle_size(
             df,
             use_mie_theory=use_mie,
-            calibration_beads=calibration_beads
+            wavelength_nm=wavelength_nm,
+            calibration_beads=calibration_beads,
+            calibrator=calibrator
         )
         
         # Statistics
@@ -96,7 +117,9 @@ def reprocess_file(
         # Save if not dry run
         if not dry_run:
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            df.to_parquet(output_file, index=False)
+            ParquetWriter.write_events(
+                df, output_file, sort_by='particle_size_nm' if sort_by_size else None
+            )
             logger.info(f"✅ Saved to: {output_file}")
         else:
             logger.info(f"🔍 DRY RUN - would save to: {output_file}")
@@ -142,6 +165,35 @@ def main():
         default=488.0,
         help="Laser wavelength in nm (default: 488)"
     )
+    parser.add_argument(
+        "--instrument",
+        type=str,
+        default=None,
+        help="Instrument ID - use its stored bead calibration instead of refitting per file"
+    )
+    parser.add_argument(
+        "--beads",
+        type=str,
+        default=None,
+        help="JSON file of {diameter_nm: measured_fsc} for a new bead run (requires --instrument)"
+    )
+    parser.add_argument(
+        "--bead-date",
+        type=str,
+        default=None,
+        help="Bead run date YYYY-MM-DD (default: today with --beads, latest stored otherwise)"
+    )
+    parser.add_argument(
+        "--calibration-dir",
+        type=str,
+        default=None,
+        help="Calibration store directory (default: $CRMIT_CALIBRATION_DIR or data/calibrations)"
+    )
+    parser.add_argument(
+        "--sort-by-size",
+        action="store_true",
+        help="Sort events by particle size for fast size-range reads (loses acquisition/Time order)"
+    )
     parser.add_argument(
         "--recursive",
         action="store_true",
@@ -178,6 +230,28 @@ def main():
     logger.info(f"Dry run: {args.dry_run}")
     logger.info("=" * 80)
     
+    # Load (or fit once) the instrument calibration, shared by every file
+    calibrator = None
+    if args.beads and not args.instrument:
+        logger.error("--beads requires --instrument")
+        return
+    if args.instrument and not args.no_mie:
+        store = CalibrationStore(
+            Path(args.calibration_dir) if args.calibration_dir else None,
+            table_cache=MieTableCache.default()
+        )
+        if args.beads:
+            beads = {float(d): float(f) for d, f in json.loads(Path(args.beads).read_text()).items()}
+            calibrator = store.get_or_fit(
+                args.instrument, beads, run_date=args.bead_date, wavelength_nm=args.wavelength
+            )
+        else:
+            calibrator = store.load(args.instrument, run_date=args.bead_date)
+            if calibrator is None:
+                logger.error(f"No stored calibration for instrument {args.instrument} - pass --beads to create one")
+                return
+        logger.info(f"Calibration: {args.instrument} (λ={calibrator.wavelength_nm:.0f}nm)")
+    
     # Find files
     files = find_parquet_files(input_dir, recursive=args.recursive)
     
@@ -198,7 +272,10 @@ def main():
             input_file=input_file,
             output_file=output_file,
             use_mie=not args.no_mie,
-            dry_run=args.dry_run
+            wavelength_nm=args.wavelength,
+            dry_run=args.dry_run,
+            calibrator=calibrator,
+            sort_by_size=args.sort_by_size
         )
         all_stats.append(stats)
     
@@ -24,6 +24,8 @@ class Settings(BaseSettings):
     - CRMIT_DB_URL: Database connection string
     - CRMIT_UPLOAD_DIR: File upload directory
     - CRMIT_PARQUET_DIR: Parquet storage directory
+    - CRMIT_MIE_CACHE_DIR: Precomputed Mie lookup table cache directory
+    - CRMIT_CALIBRATION_DIR: Stored bead calibrations (per instrument/date)
     - CRMIT_MAX_UPLOAD_SIZE: Max file size in MB
     - CRMIT_CORS_ORIGINS: Comma-separated allowed origins
     """
@@ -44,11 +46,17 @@ class Settings(BaseSettings):
     db_echo: bool = False  # Log SQL queries
     db_pool_size: int = 10
     db_max_overflow: int = 20
+    db_pool_timeout_seconds: float = 30.0  # Max wait for a free connection
+    db_pool_recycle_seconds: int = 3600  # Replace connections older than this
+    db_pool_pre_ping: bool = False  # Ping on every checkout (one extra round trip)
+    db_statement_cache_size: int = 100  # asyncpg prepared statements per connection
     
     # File Storage
     upload_dir: Path = Path("data/uploads")
     parquet_dir: Path = Path("data/parquet")
     temp_dir: Path = Path("data/temp")
+    mie_cache_dir: Path = Path("data/cache/mie")
+    calibration_dir: Path = Path("data/calibrations")
     max_upload_size_mb: int = 100
     
     # CORS
@@ -70,6 +78,7 @@ class Settings(BaseSettings):
     # Processing
     max_workers: int = 4
     task_timeout_seconds: int = 300
+    batch_max_concurrency: int = 4  # Files of one batch upload processed at once
     
     # Quality Control
     qc_min_events_fcs: int = 1000
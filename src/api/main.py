@@ -38,6 +38,10 @@ import time
 
 from src.api.config import get_settings
 from src.api.routers import upload, samples, jobs  # type: ignore[import-not-found]
+from src.api.workers import get_worker_pool, shutdown_worker_pool
+from src.database.connection import close_connections, get_pool_status
+from src.physics.calibration_store import CalibrationStore
+from src.physics.mie_cache import MieTableCache
 # from src.database.connection import get_db_engine, close_db_connections
 
 settings = get_settings()
@@ -59,6 +63,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # type: ignore[
     logger.info(f"   Upload directory: {settings.upload_dir}")
     logger.info(f"   Parquet directory: {settings.parquet_dir}")
     
+    # Stored bead calibrations: loaded on demand, never refitted by the API
+    app.state.calibrations = CalibrationStore(
+        settings.calibration_dir,
+        table_cache=MieTableCache(settings.mie_cache_dir)
+    )
+    n_calibrations = len(app.state.calibrations.list_calibrations())
+    logger.info(f"   Calibrations: {n_calibrations} stored in {settings.calibration_dir}")
+    
     # TODO: Initialize database connection pool
     # engine = get_db_engine()
     # logger.info(f"   Database: {settings.database_url}")
@@ -69,8 +81,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # type: ignore[
     
     # Shutdown
     logger.info("🛑 CRMIT API shutting down...")
-    # TODO: Close database connections
-    # await close_db_connections()
+    # Let queued and running processing jobs finish
+    await shutdown_worker_pool()
+    # Close pooled database connections
+    await close_connections()
     logger.success("✅ Cleanup complete")
 
 
@@ -210,6 +224,10 @@ async def system_status():
     upload_dir_exists = settings.upload_dir.exists()
     parquet_dir_exists = settings.parquet_dir.exists()
     
+    # Stored bead calibrations (set up in lifespan)
+    store = getattr(app.state, "calibrations", None)
+    calibrations = store.list_calibrations() if store is not None else []
+    
     return {
         "success": True,
         "service": settings.app_name,
@@ -218,6 +236,7 @@ async def system_status():
         "database": {
             "status": db_status,
             # "url": settings.database_url.split("@")[-1],  # Hide credentials
+            "pool": get_pool_status(),
         },
         "storage": {
             "upload_dir": str(settings.upload_dir),
@@ -225,10 +244,14 @@ async def system_status():
             "parquet_dir": str(settings.parquet_dir),
             "parquet_dir_exists": parquet_dir_exists,
         },
+        "calibrations": calibrations,
         "configuration": {
             "max_upload_size_mb": settings.max_upload_size_mb,
             "max_workers": settings.max_workers,
             "task_timeout_seconds": settings.task_timeout_seconds,
+        },
+        "workers": {
+            "active_jobs": get_worker_pool().active_jobs,
         }
     }
 
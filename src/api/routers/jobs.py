@@ -20,7 +20,9 @@ from sqlalchemy import select, func  # type: ignore[import-not-found]
 from loguru import logger
 
 from src.database.connection import get_session
+from src.database.crud import get_child_jobs
 from src.database.models import ProcessingJob, Sample  # type: ignore[import-not-found]
+from src.api.workers import batch_summary
 
 router = APIRouter()
 
@@ -29,6 +31,16 @@ router = APIRouter()
 # List Jobs Endpoint
 # ============================================================================
 
+def _job_filters(status_filter: Optional[str], job_type: Optional[str]) -> list:
+    """WHERE clauses shared by the job list and its count query."""
+    filters = []
+    if status_filter:
+        filters.append(ProcessingJob.status == status_filter)
+    if job_type:
+        filters.append(ProcessingJob.job_type == job_type)
+    return filters
+
+
 @router.get("/", response_model=dict)
 async def list_jobs(
     skip: int = Query(0, ge=0),
@@ -69,53 +81,51 @@ async def list_jobs(
     ```
     """
     try:
-        # Build query
-        query = select(ProcessingJob)
-        
-        # Apply filters
-        if status_filter:
-            query = query.where(ProcessingJob.status == status_filter)
-        if job_type:
-            query = query.where(ProcessingJob.job_type == job_type)
+        filters = _job_filters(status_filter, job_type)
         
         # Get total count
-        count_query = select(func.count()).select_from(ProcessingJob)
-        if status_filter:
-            count_query = count_query.where(ProcessingJob.status == status_filter)
-        if job_type:
-            count_query = count_query.where(ProcessingJob.job_type == job_type)
-        
+        count_query = select(func.count()).select_from(ProcessingJob).where(*filters)
         total = (await db.execute(count_query)).scalar()
         
-        # Apply pagination and ordering
-        query = query.order_by(ProcessingJob.created_at.desc()).offset(skip).limit(limit)
-        
-        # Execute query
-        result = await db.execute(query)
-        jobs = result.scalars().all()
+        # One query for the page: job columns plus the sample name via outer join
+        query = (
+            select(
+                ProcessingJob.id,
+                ProcessingJob.job_id,
+                ProcessingJob.job_type,
+                ProcessingJob.status,
+                ProcessingJob.progress_percent,
+                ProcessingJob.current_step,
+                ProcessingJob.created_at,
+                ProcessingJob.started_at,
+                ProcessingJob.completed_at,
+                ProcessingJob.error_message,
+                Sample.sample_id,
+            )
+            .outerjoin(Sample, Sample.id == ProcessingJob.sample_id)
+            .where(*filters)
+            .order_by(ProcessingJob.created_at.desc(), ProcessingJob.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = (await db.execute(query)).all()
         
-        # Get sample_id for each job
-        jobs_data = []
-        for job in jobs:
-            sample_id = None
-            if job.sample_id:
-                sample_query = select(Sample.sample_id).where(Sample.id == job.sample_id)
-                sample_result = await db.execute(sample_query)
-                sample_id = sample_result.scalar_one_or_none()
-            
-            jobs_data.append({
-                "id": job.id,
-                "job_id": job.job_id,
-                "job_type": job.job_type,
-                "status": job.status,
-                "progress_percent": job.progress_percent,
-                "current_step": job.current_step,
-                "created_at": job.created_at.isoformat() if job.created_at else None,
-                "started_at": job.started_at.isoformat() if job.started_at else None,
-                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                "sample_id": sample_id,
-                "error_message": job.error_message if job.status == "failed" else None,
-            })
+        jobs_data = [
+            {
+                "id": row.id,
+                "job_id": row.job_id,
+                "job_type": row.job_type,
+                "status": row.status,
+                "progress_percent": row.progress_percent,
+                "current_step": row.current_step,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+                "started_at": row.started_at.isoformat() if row.started_at else None,
+                "completed_at": row.completed_at.isoformat() if row.completed_at else None,
+                "sample_id": row.sample_id,
+                "error_message": row.error_message if row.status == "failed" else None,
+            }
+            for row in rows
+        ]
         
         return {
             "total": total,
@@ -165,6 +175,10 @@ async def get_job_status(
     }
     ```
     
+    For `batch_process` jobs the response adds `summary` (per-status
+    counts) and `children` (one job per file); while the batch is running,
+    `status` and `progress_percent` are aggregated from the children.
+    
     **Job Statuses:**
     - `pending`: Job queued, not yet started
     - `running`: Job currently processing
@@ -191,7 +205,7 @@ async def get_job_status(
             sample_result = await db.execute(sample_query)
             sample_id = sample_result.scalar_one_or_none()
         
-        return {
+        response = {
             "id": job.id,
             "job_id": job.job_id,
             "job_type": job.job_type,
@@ -207,6 +221,29 @@ async def get_job_status(
             "error_traceback": job.error_traceback if job.status == "failed" else None,
         }
         
+        # Batch jobs: aggregate progress and per-file jobs
+        if job.job_type == "batch_process":
+            children = await get_child_jobs(db, job.job_id)
+            summary = batch_summary(children)
+            if job.status not in ["completed", "failed", "cancelled"]:
+                response["status"] = summary["status"]
+                response["progress_percent"] = summary["progress_percent"]
+            response["summary"] = summary
+            response["children"] = [
+                {
+                    "job_id": child.job_id,
+                    "job_type": child.job_type,
+                    "status": child.status,
+                    "progress_percent": child.progress_percent,
+                    "current_step": child.current_step,
+                    "file_name": (child.result_data or {}).get("file_name"),
+                    "error_message": child.error_message,
+                }
+                for child in children
+            ]
+        
+        return response
+        
     except HTTPException:
         raise
     except Exception as e:
@@ -246,6 +283,7 @@ async def cancel_job(
     - Only jobs with status `pending` or `running` can be cancelled
     - Completed or failed jobs cannot be cancelled
     - Cancellation may not be immediate for running jobs
+    - Cancelling a batch job also cancels its files that have not started
     """
     try:
         # Query job
@@ -271,6 +309,13 @@ async def cancel_job(
         # Update job status
         job.status = "cancelled"
         job.current_step = "Cancelled by user"
+        
+        # Batch jobs: cancel files not yet started
+        if job.job_type == "batch_process":
+            for child in await get_child_jobs(db, job.job_id):
+                if child.status == "pending":
+                    child.status = "cancelled"
+                    child.current_step = "Batch cancelled by user"
         await db.commit()
         
         logger.warning(f"🚫 Job cancelled: {job_id} (was: {previous_status})")
@@ -31,6 +31,22 @@ router = APIRouter()
 # List Samples Endpoint
 # ============================================================================
 
+def _sample_filters(
+    treatment: Optional[str],
+    qc_status: Optional[str],
+    processing_status: Optional[str]
+) -> list:
+    """WHERE clauses shared by the sample list and its count query."""
+    filters = []
+    if treatment:
+        filters.append(Sample.treatment == treatment)
+    if qc_status:
+        filters.append(Sample.qc_status == qc_status)
+    if processing_status:
+        filters.append(Sample.processing_status == processing_status)
+    return filters
+
+
 @router.get("/", response_model=dict)
 async def list_samples(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
@@ -74,51 +90,49 @@ async def list_samples(
     ```
     """
     try:
-        # Build query
-        query = select(Sample)
-        
-        # Apply filters
-        if treatment:
-            query = query.where(Sample.treatment == treatment)
-        if qc_status:
-            query = query.where(Sample.qc_status == qc_status)
-        if processing_status:
-            query = query.where(Sample.processing_status == processing_status)
+        filters = _sample_filters(treatment, qc_status, processing_status)
         
         # Get total count
-        count_query = select(func.count()).select_from(Sample)
-        if treatment:
-            count_query = count_query.where(Sample.treatment == treatment)
-        if qc_status:
-            count_query = count_query.where(Sample.qc_status == qc_status)
-        if processing_status:
-            count_query = count_query.where(Sample.processing_status == processing_status)
-        
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-        
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-        
-        # Execute query
-        result = await db.execute(query)
-        samples = result.scalars().all()
+        count_query = select(func.count()).select_from(Sample).where(*filters)
+        total = (await db.execute(count_query)).scalar()
+        
+        # One query for the page, projecting only the listed columns
+        query = (
+            select(
+                Sample.id,
+                Sample.sample_id,
+                Sample.biological_sample_id,
+                Sample.treatment,
+                Sample.qc_status,
+                Sample.processing_status,
+                Sample.upload_timestamp,
+                Sample.file_path_fcs.is_not(None).label("has_fcs"),
+                Sample.file_path_nta.is_not(None).label("has_nta"),
+                Sample.file_path_tem.is_not(None).label("has_tem"),
+            )
+            .where(*filters)
+            .order_by(Sample.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = (await db.execute(query)).all()
         
         # Format response
-        samples_data = []
-        for sample in samples:
-            samples_data.append({
-                "id": sample.id,
-                "sample_id": sample.sample_id,
-                "biological_sample_id": sample.biological_sample_id,
-                "treatment": sample.treatment,
-                "qc_status": sample.qc_status,
-                "processing_status": sample.processing_status,
-                "upload_timestamp": sample.upload_timestamp.isoformat() if sample.upload_timestamp else None,
-                "has_fcs": sample.file_path_fcs is not None,
-                "has_nta": sample.file_path_nta is not None,
-                "has_tem": sample.file_path_tem is not None,
-            })
+        samples_data = [
+            {
+                "id": row.id,
+                "sample_id": row.sample_id,
+                "biological_sample_id": row.biological_sample_id,
+                "treatment": row.treatment,
+                "qc_status": row.qc_status,
+                "processing_status": row.processing_status,
+                "upload_timestamp": row.upload_timestamp.isoformat() if row.upload_timestamp else None,
+                "has_fcs": bool(row.has_fcs),
+                "has_nta": bool(row.has_nta),
+                "has_tem": bool(row.has_tem),
+            }
+            for row in rows
+        ]
         
         return {
             "total": total,
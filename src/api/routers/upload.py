@@ -5,33 +5,40 @@ File Upload Router
 Endpoints for uploading and processing FCS, NTA, and TEM files.
 
 Endpoints:
-- POST /upload/fcs  - Upload and process FCS file
-- POST /upload/nta  - Upload and process NTA file
+- POST /upload/fcs         - Upload and process FCS file
+- POST /upload/fcs/stream  - Upload FCS file as a raw request body (no spooling)
+- POST /upload/nta         - Upload and process NTA file
+- POST /upload/batch       - Upload many FCS/NTA files as one batch job
 - POST /upload/tem  - Upload and process TEM file (future)
 
 Author: CRMIT Backend Team
 Date: November 21, 2025
 """
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-import shutil
+from typing import Any, AsyncIterator, Callable, Optional, Tuple
+import asyncio
+import hashlib
 import uuid
 from datetime import datetime
-import sys
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, status
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, Query, Request, status
 from fastapi.responses import JSONResponse  # noqa: F401
 from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore[import-not-found]
 from loguru import logger
 
 from src.api.config import get_settings
 from src.database.connection import get_session
-from src.database.models import Sample, FCSResult, NTAResult, ProcessingJob  # type: ignore[import-not-found]
-# Import professional parsers
-from src.parsers.fcs_parser import FCSParser
-from src.parsers.nta_parser import NTAParser
-# from src.database.crud import create_sample, create_fcs_result, create_processing_job
+from src.database.crud import create_sample, get_sample_by_id, create_processing_job, update_job_status
+from src.api.workers import (
+    finish_batch,
+    get_worker_pool,
+    run_fcs_job,
+    run_nta_job,
+    store_fcs_result,
+    store_nta_result,
+)
 
 settings = get_settings()
 router = APIRouter()
@@ -41,42 +48,146 @@ router = APIRouter()
 # Helper Functions
 # ============================================================================
 
-async def save_uploaded_file(upload_file: UploadFile, destination: Path) -> Path:
+# Bytes read from the request per chunk
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Bytes buffered before the file header is checked
+HEADER_CHECK_BYTES = 64
+
+
+@dataclass
+class StoredUpload:
+    """A file persisted by stream_to_disk()."""
+    path: Path
+    size_bytes: int
+    content_hash: str  # BLAKE2b-128, as ConversionManifest's content_hash()
+    
+    @property
+    def size_mb(self) -> float:
+        return self.size_bytes / 1024 / 1024
+
+
+def fcs_header_ok(head: bytes) -> bool:
+    """FCS files start with 'FCS' and a version, e.g. b'FCS3.1'."""
+    return head[:3] == b"FCS" and head[3:6].replace(b".", b"").isdigit()
+
+
+def text_header_ok(head: bytes) -> bool:
+    """NTA exports are text: reject binary content (NUL bytes)."""
+    return b"\x00" not in head
+
+
+def _write_chunk(f, digest, chunk: bytes) -> None:
+    """Hash and write one chunk (runs in a worker thread)."""
+    digest.update(chunk)
+    f.write(chunk)
+
+
+async def stream_to_disk(
+    chunks: AsyncIterator[bytes],
+    destination: Path,
+    header_check: Optional[Callable[[bytes], bool]] = None
+) -> StoredUpload:
     """
-    Save uploaded file to disk.
+    Write an upload to disk chunk by chunk, hashing as it goes.
+    
+    The size limit is enforced as bytes arrive and the file header is
+    checked on the first bytes, so oversized or invalid uploads are rejected
+    without being stored. Data goes to `<destination>.part` and is renamed
+    on success. File I/O and hashing run in worker threads, never on the
+    event loop.
     
     Args:
-        upload_file: FastAPI UploadFile object
-        destination: Destination file path
+        chunks: Async iterator of upload bytes
+        destination: Final file path
+        header_check: Optional predicate on the first HEADER_CHECK_BYTES bytes
     
     Returns:
-        Path to saved file
+        StoredUpload with path, size and content hash
     
     Raises:
-        HTTPException: If file size exceeds limit or save fails
+        HTTPException: 413 if the size limit is exceeded, 400 for an empty
+                       file or an invalid header
     """
     destination.parent.mkdir(parents=True, exist_ok=True)
+    partial = destination.with_name(destination.name + ".part")
+    max_size_bytes = settings.max_upload_size_mb * 1024 * 1024
+    digest = hashlib.blake2b(digest_size=16)
+    size = 0
+    head = b""
     
+    f = await asyncio.to_thread(partial.open, "wb")
     try:
-        # Check file size
-        upload_file.file.seek(0, 2)  # Seek to end
-        file_size = upload_file.file.tell()
-        upload_file.file.seek(0)  # Reset to start
+        async for chunk in chunks:
+            if not chunk:
+                continue
+            size += len(chunk)
+            if size > max_size_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"File exceeds limit of {settings.max_upload_size_mb}MB"
+                )
+            if header_check is not None and len(head) < HEADER_CHECK_BYTES:
+                head += chunk[:HEADER_CHECK_BYTES - len(head)]
+                if len(head) >= HEADER_CHECK_BYTES and not header_check(head):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Invalid file header"
+                    )
+            await asyncio.to_thread(_write_chunk, f, digest, chunk)
         
-        max_size_bytes = settings.max_upload_size_mb * 1024 * 1024
-        if file_size > max_size_bytes:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File size {file_size / 1024 / 1024:.1f}MB exceeds limit of {settings.max_upload_size_mb}MB"
-            )
-        
-        # Save file
-        with destination.open("wb") as buffer:
-            shutil.copyfileobj(upload_file.file, buffer)
-        
-        logger.info(f"✅ Saved uploaded file: {destination.name} ({file_size / 1024:.1f}KB)")
-        return destination
+        if size == 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Empty file")
+        if header_check is not None and len(head) < HEADER_CHECK_BYTES and not header_check(head):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file header")
         
+        await asyncio.to_thread(f.close)
+        await asyncio.to_thread(partial.replace, destination)
+    except BaseException:
+        await asyncio.to_thread(f.close)
+        partial.unlink(missing_ok=True)
+        raise
+    
+    logger.info(f"✅ Saved uploaded file: {destination.name} ({size / 1024:.1f}KB)")
+    return StoredUpload(path=destination, size_bytes=size, content_hash=digest.hexdigest())
+
+
+async def _upload_chunks(upload_file: UploadFile) -> AsyncIterator[bytes]:
+    """Read an UploadFile in UPLOAD_CHUNK_BYTES chunks."""
+    while True:
+        chunk = await upload_file.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def save_uploaded_file(
+    upload_file: UploadFile,
+    destination: Path,
+    header_check: Optional[Callable[[bytes], bool]] = None
+) -> StoredUpload:
+    """
+    Save uploaded file to disk.
+    
+    Streams the upload in chunks through stream_to_disk(); no seek to
+    measure the size, no whole-file copy.
+    
+    Args:
+        upload_file: FastAPI UploadFile object
+        destination: Destination file path
+        header_check: Optional predicate on the first bytes of the file
+    
+    Returns:
+        StoredUpload with path, size and content hash
+    
+    Raises:
+        HTTPException: If file size exceeds limit, the header is invalid or
+                       save fails
+    """
+    try:
+        return await stream_to_disk(_upload_chunks(upload_file), destination, header_check)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ Failed to save file: {e}")
         raise HTTPException(
@@ -112,6 +223,121 @@ def generate_sample_id(filename: str) -> str:
     return name
 
 
+# Upload kind -> (Sample file path column, job type, worker function, completion handler)
+UPLOAD_KINDS = {
+    'fcs': ('file_path_fcs', 'fcs_parse', run_fcs_job, store_fcs_result),
+    'nta': ('file_path_nta', 'nta_parse', run_nta_job, store_nta_result),
+}
+
+
+async def _queue_processing(
+    db: AsyncSession,
+    kind: str,
+    filename: str,
+    stored: StoredUpload,
+    treatment: Optional[str] = None,
+    parent_job_id: Optional[str] = None,
+    gate: Optional[asyncio.Semaphore] = None,
+    **sample_fields: Any
+) -> Tuple[Any, str, asyncio.Task]:
+    """
+    Record a stored upload and queue its processing job.
+    
+    Creates (or updates) the sample record, creates the processing job and
+    submits it to the worker pool, which parses the stored file in place.
+    
+    Args:
+        db: Database session
+        kind: 'fcs' or 'nta'
+        filename: Original file name (used for the sample ID)
+        stored: The persisted upload
+        treatment: Treatment name for new samples
+        parent_job_id: Batch job UUID for per-file jobs of a batch
+        gate: Optional per-batch concurrency limit
+        **sample_fields: Further create_sample() fields for new samples
+    
+    Returns:
+        Tuple of (sample, job_id, task finishing with the job)
+    """
+    path_column, job_type, job_fn, on_complete = UPLOAD_KINDS[kind]
+    
+    # Generate sample ID
+    sample_id = generate_sample_id(filename)
+    
+    # Create or update sample record
+    sample = await get_sample_by_id(db, sample_id)
+    if sample is None:
+        sample = await create_sample(
+            db=db,
+            sample_id=sample_id,
+            treatment=treatment or "unknown",
+            **{path_column: str(stored.path)},
+            **sample_fields
+        )
+    else:
+        setattr(sample, path_column, str(stored.path))
+        sample.processing_status = "pending"
+        await db.commit()
+    
+    # Create processing job; parsing runs in the worker pool
+    job_id = str(uuid.uuid4())
+    await create_processing_job(
+        db=db,
+        job_id=job_id,
+        job_type=job_type,
+        sample_id=sample.id,
+        parent_job_id=parent_job_id
+    )
+    task = await get_worker_pool().submit(
+        job_id, job_fn, str(stored.path), str(settings.parquet_dir),
+        on_complete=on_complete, gate=gate
+    )
+    
+    logger.success(f"✅ {kind.upper()} file uploaded: {sample_id} (job: {job_id})")
+    return sample, job_id, task
+
+
+async def _register_fcs_upload(
+    db: AsyncSession,
+    filename: str,
+    stored: StoredUpload,
+    treatment: Optional[str] = None,
+    concentration_ug: Optional[float] = None,
+    preparation_method: Optional[str] = None,
+    operator: Optional[str] = None,
+    notes: Optional[str] = None
+) -> dict:
+    """
+    Queue processing of a stored FCS upload and build the upload response.
+    """
+    sample, job_id, _ = await _queue_processing(
+        db, 'fcs', filename, stored,
+        treatment=treatment,
+        concentration_ug=concentration_ug,
+        preparation_method=preparation_method,
+        operator=operator,
+        notes=notes
+    )
+    
+    return {
+        "success": True,
+        "id": sample.id,  # Numeric database ID
+        "sample_id": sample.sample_id,  # String display name
+        "treatment": treatment,
+        "concentration_ug": concentration_ug,
+        "preparation_method": preparation_method,
+        "operator": operator,
+        "notes": notes,
+        "job_id": job_id,
+        "status": "uploaded",
+        "processing_status": "pending",
+        "message": "File uploaded successfully, processing started",
+        "file_size_mb": stored.size_mb,
+        "content_hash": stored.content_hash,
+        "upload_timestamp": datetime.now().isoformat(),
+    }
+
+
 # ============================================================================
 # FCS Upload Endpoint
 # ============================================================================
@@ -155,6 +381,9 @@ async def upload_fcs_file(
     4. Return immediately with job ID
     5. Background worker parses FCS file
     6. Background worker saves results to database and Parquet
+    
+    Poll `GET /jobs/{job_id}` for progress (`progress_percent`,
+    `current_step`) and the parsed results (`result_data`).
     """
     logger.info(f"📤 Uploading FCS file: {file.filename}")
     
@@ -166,93 +395,87 @@ async def upload_fcs_file(
                 detail="Invalid file type. Only .fcs files are accepted."
             )
         
-        # Generate sample ID
-        sample_id = generate_sample_id(file.filename)
-        
-        # Save uploaded file
+        # Save uploaded file (streamed, header checked on the first bytes)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         file_path = settings.upload_dir / f"{timestamp}_{file.filename}"
-        await save_uploaded_file(file, file_path)
-        
-        # Parse FCS file using professional parser
-        fcs_results = None
-        try:
-            logger.info(f"🔬 Parsing FCS file with professional parser...")
-            parser = FCSParser(file_path)
-            
-            # Validate file
-            if not parser.validate():
-                logger.warning(f"⚠️ FCS file validation failed, continuing anyway...")
-            
-            # Parse and get results
-            parsed_data = parser.parse()
-            
-            if parsed_data is not None and len(parsed_data) > 0:
-                # Extract key metrics
-                fcs_results = {
-                    "event_count": len(parsed_data) if hasattr(parsed_data, '__len__') else parsed_data.get('event_count', 0),
-                    "channels": list(parsed_data.columns) if hasattr(parsed_data, 'columns') else [],
-                    "mean_fsc": float(parsed_data[parsed_data.columns[0]].mean()) if hasattr(parsed_data, 'columns') and len(parsed_data.columns) > 0 else None,
-                    "mean_ssc": float(parsed_data[parsed_data.columns[1]].mean()) if hasattr(parsed_data, 'columns') and len(parsed_data.columns) > 1 else None,
-                }
-                logger.success(f"✅ Parsed {fcs_results['event_count']} events with {len(fcs_results['channels'])} channels")
-        except Exception as parse_error:
-            logger.error(f"⚠️ Parser failed: {parse_error}, continuing with upload...")
-            fcs_results = None
-        
-        # TODO: Create sample record in database
-        # sample = await create_sample(
-        #     db=db,
-        #     sample_id=sample_id,
-        #     file_path_fcs=str(file_path.relative_to(Path.cwd())),
-        #     treatment=treatment,
-        #     concentration_ug=concentration_ug,
-        #     preparation_method=preparation_method,
-        #     operator=operator,
-        #     notes=notes
-        # )
-        
-        # TODO: Create processing job
-        # job_id = str(uuid.uuid4())
-        # job = await create_processing_job(
-        #     db=db,
-        #     job_id=job_id,
-        #     job_type="fcs_parse",
-        #     sample_id=sample.id
-        # )
-        
-        # For now, return mock response
-        job_id = str(uuid.uuid4())
+        stored = await save_uploaded_file(file, file_path, header_check=fcs_header_ok)
         
-        logger.success(f"✅ FCS file uploaded: {sample_id} (job: {job_id})")
-        
-        # TODO: Replace with actual database ID once database is connected
-        # For now, use a hash of the sample_id as a temporary numeric ID
-        temp_id = abs(hash(sample_id)) % 1000000
-        
-        # Build response with parsed results
-        response_data = {
-            "success": True,
-            "id": temp_id,  # Numeric database ID (temporary)
-            "sample_id": sample_id,  # String display name
-            "treatment": treatment,
-            "concentration_ug": concentration_ug,
-            "preparation_method": preparation_method,
-            "operator": operator,
-            "notes": notes,
-            "job_id": job_id,
-            "status": "uploaded",
-            "processing_status": "completed" if fcs_results else "pending",
-            "message": "File uploaded successfully, processing started",
-            "file_size_mb": file_path.stat().st_size / 1024 / 1024,
-            "upload_timestamp": datetime.now().isoformat(),
-        }
+        return await _register_fcs_upload(
+            db, file.filename, stored,
+            treatment=treatment,
+            concentration_ug=concentration_ug,
+            preparation_method=preparation_method,
+            operator=operator,
+            notes=notes
+        )
         
-        # Add parsed FCS results if available
-        if fcs_results:
-            response_data["fcs_results"] = fcs_results
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception(f"❌ Failed to upload FCS file: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to process upload: {str(e)}"
+        )
+
+
+@router.post("/fcs/stream", response_model=dict)
+async def upload_fcs_stream(
+    request: Request,
+    filename: str = Query(..., description="Original file name (must end in .fcs)"),
+    treatment: Optional[str] = Query(None),
+    concentration_ug: Optional[float] = Query(None),
+    preparation_method: Optional[str] = Query(None),
+    operator: Optional[str] = Query(None),
+    notes: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_session)
+):
+    """
+    Upload an FCS file sent as the raw request body.
+    
+    Unlike the multipart endpoint, the body is written to its final
+    location as it arrives - no spooled temporary file and no second copy -
+    which suits multi-GB files. Sample fields are query parameters.
+    
+    **Request:**
+    ```
+    POST /upload/fcs/stream?filename=P5+F10+CD81.fcs&treatment=CD81
+    Content-Type: application/octet-stream
+    
+    <FCS file bytes>
+    ```
+    
+    **Response:** Same as `POST /upload/fcs`.
+    """
+    logger.info(f"📤 Streaming FCS upload: {filename}")
+    
+    if not filename.lower().endswith('.fcs'):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid file type. Only .fcs files are accepted."
+        )
+    
+    # Reject declared oversize bodies before reading anything
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > settings.max_upload_size_mb * 1024 * 1024:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds limit of {settings.max_upload_size_mb}MB"
+        )
+    
+    try:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_path = settings.upload_dir / f"{timestamp}_{Path(filename).name}"
+        stored = await stream_to_disk(request.stream(), file_path, header_check=fcs_header_ok)
         
-        return response_data
+        return await _register_fcs_upload(
+            db, Path(filename).name, stored,
+            treatment=treatment,
+            concentration_ug=concentration_ug,
+            preparation_method=preparation_method,
+            operator=operator,
+            notes=notes
+        )
         
     except HTTPException:
         raise
@@ -304,6 +527,8 @@ async def upload_nta_file(
     3. Create processing job (async)
     4. Background worker parses NTA file
     5. Background worker saves results to database and Parquet
+    
+    Poll `GET /jobs/{job_id}` for progress and results.
     """
     logger.info(f"📤 Uploading NTA file: {file.filename}")
     
@@ -315,30 +540,23 @@ async def upload_nta_file(
                 detail="Invalid file type. Only .txt and .csv files are accepted."
             )
         
-        # Generate sample ID
-        sample_id = generate_sample_id(file.filename)
-        
         # Save uploaded file
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         file_path = settings.upload_dir / f"{timestamp}_{file.filename}"
-        await save_uploaded_file(file, file_path)
+        stored = await save_uploaded_file(file, file_path, header_check=text_header_ok)
         
-        # TODO: Create or update sample record
-        # TODO: Create processing job
-        
-        job_id = str(uuid.uuid4())
-        
-        logger.success(f"✅ NTA file uploaded: {sample_id} (job: {job_id})")
-        
-        # TODO: Replace with actual database ID once database is connected
-        # For now, use a hash of the sample_id as a temporary numeric ID
-        temp_id = abs(hash(sample_id)) % 1000000
+        sample, job_id, _ = await _queue_processing(
+            db, 'nta', file.filename, stored,
+            treatment=treatment,
+            operator=operator,
+            notes=notes
+        )
         
         # Return complete sample data to avoid additional API calls
         return {
             "success": True,
-            "id": temp_id,  # Numeric database ID (temporary)
-            "sample_id": sample_id,  # String display name
+            "id": sample.id,  # Numeric database ID
+            "sample_id": sample.sample_id,  # String display name
             "treatment": treatment,
             "temperature_celsius": temperature_celsius,
             "operator": operator,
@@ -347,7 +565,8 @@ async def upload_nta_file(
             "status": "uploaded",
             "processing_status": "pending",
             "message": "File uploaded successfully, processing started",
-            "file_size_mb": file_path.stat().st_size / 1024 / 1024,
+            "file_size_mb": stored.size_mb,
+            "content_hash": stored.content_hash,
             "upload_timestamp": datetime.now().isoformat(),
         }
         
@@ -368,68 +587,116 @@ async def upload_nta_file(
 @router.post("/batch", response_model=dict)
 async def upload_batch(
     files: list[UploadFile] = File(...),
+    max_concurrency: Optional[int] = Query(
+        None, ge=1, description="Files of this batch processed at once (default: settings.batch_max_concurrency)"
+    ),
     db: AsyncSession = Depends(get_session)
 ):
     """
     Upload multiple files at once.
     
+    Files are saved concurrently and each gets its own processing job
+    (child of one `batch_process` job) on the worker pool; at most
+    `max_concurrency` of the batch's files are processed at the same time.
+    Returns as soon as all jobs are queued.
+    
     **Request:**
     - files: List of FCS and/or NTA files
+    - max_concurrency: Optional per-batch parallelism limit
     
     **Response:**
     ```json
     {
         "success": true,
+        "batch_job_id": "uuid0",
         "uploaded": 5,
         "failed": 0,
         "job_ids": ["uuid1", "uuid2", "uuid3", "uuid4", "uuid5"],
         "details": [
-            {"filename": "file1.fcs", "sample_id": "S001", "status": "success"},
+            {"filename": "file1.fcs", "sample_id": "S001", "job_id": "uuid1", "status": "queued"},
             ...
         ]
     }
     ```
+    
+    Poll `GET /jobs/{batch_job_id}` for aggregate progress and per-file
+    job status.
     """
     logger.info(f"📤 Batch upload: {len(files)} files")
     
+    limit = max_concurrency or settings.batch_max_concurrency
+    batch_job_id = str(uuid.uuid4())
+    await create_processing_job(db=db, job_id=batch_job_id, job_type="batch_process")
+    
     results = {
         "success": True,
+        "batch_job_id": batch_job_id,
+        "max_concurrency": limit,
         "uploaded": 0,
         "failed": 0,
         "job_ids": [],
         "details": []
     }
     
-    for file in files:
+    # Save all files concurrently (index in the name keeps duplicates apart)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    save_slots = asyncio.Semaphore(limit)
+    
+    async def save(index: int, file: UploadFile) -> Tuple[str, StoredUpload]:
+        # Determine file type
+        name = file.filename.lower()
+        if name.endswith('.fcs'):
+            kind, header_check = 'fcs', fcs_header_ok
+        elif name.endswith(('.txt', '.csv')):
+            kind, header_check = 'nta', text_header_ok
+        else:
+            raise ValueError(f"Unsupported file type: {file.filename}")
+        async with save_slots:
+            destination = settings.upload_dir / f"{timestamp}_{index:03d}_{file.filename}"
+            return kind, await save_uploaded_file(file, destination, header_check=header_check)
+    
+    saved = await asyncio.gather(*(save(i, f) for i, f in enumerate(files)), return_exceptions=True)
+    
+    # Register samples and child jobs; processing starts as each is queued
+    gate = asyncio.Semaphore(limit)
+    child_tasks = []
+    for file, outcome in zip(files, saved):
         try:
-            # Determine file type
-            if file.filename.lower().endswith('.fcs'):
-                result = await upload_fcs_file(file=file, db=db)
-            elif file.filename.lower().endswith(('.txt', '.csv')):
-                result = await upload_nta_file(file=file, db=db)
-            else:
-                raise ValueError(f"Unsupported file type: {file.filename}")
+            if isinstance(outcome, BaseException):
+                raise outcome
+            kind, stored = outcome
+            sample, job_id, task = await _queue_processing(
+                db, kind, file.filename, stored, parent_job_id=batch_job_id, gate=gate
+            )
+            child_tasks.append(task)
             
             results["uploaded"] += 1
-            results["job_ids"].append(result["job_id"])
+            results["job_ids"].append(job_id)
             results["details"].append({
                 "filename": file.filename,
-                "sample_id": result["sample_id"],
-                "status": "success"
+                "sample_id": sample.sample_id,
+                "job_id": job_id,
+                "status": "queued"
             })
             
         except Exception as e:
-            logger.error(f"❌ Failed to upload {file.filename}: {e}")
+            error = e.detail if isinstance(e, HTTPException) else str(e)
+            logger.error(f"❌ Failed to upload {file.filename}: {error}")
             results["failed"] += 1
             results["details"].append({
                 "filename": file.filename,
                 "status": "failed",
-                "error": str(e)
+                "error": error
             })
     
     if results["failed"] > 0:
         results["success"] = False
     
-    logger.info(f"✅ Batch upload complete: {results['uploaded']} succeeded, {results['failed']} failed")
+    if child_tasks:
+        get_worker_pool().track(finish_batch(batch_job_id, child_tasks))
+    else:
+        await update_job_status(db, batch_job_id, "failed", error_message="No files could be queued")
+    
+    logger.info(f"✅ Batch upload queued: {results['uploaded']} succeeded, {results['failed']} failed")
     
     return results
@@ -0,0 +1,611 @@
+"""
+Background Processing Workers
+=============================
+
+Process-pool execution of upload processing jobs, so request handlers
+return as soon as the file and its ProcessingJob row are stored.
+
+Design:
+- Job functions (e.g. run_fcs_job) run in worker processes: parsing,
+  statistics and Parquet writing never block the API event loop
+- At most `max_workers` jobs are handed to the pool at once; the per-job
+  timeout (settings.task_timeout_seconds) counts running time, not time
+  spent waiting for a free worker. A timed-out job's worker processes are
+  terminated so its slot is really freed; jobs sharing those processes are
+  run once more on fresh workers
+- Workers report progress through a multiprocessing queue; the API process
+  writes it to ProcessingJob.progress_percent / current_step
+- Job status, results and errors are written with the CRUD helpers in
+  short-lived sessions, one per update
+- Batch uploads create one child job per file (parent_job_id); an optional
+  per-batch gate bounds how many of them hold a worker at once, and the
+  batch job's progress is aggregated from its children
+
+Usage:
+    from src.api.workers import get_worker_pool, run_fcs_job, store_fcs_result
+
+    await get_worker_pool().submit(
+        job_id, run_fcs_job, str(file_path), str(settings.parquet_dir),
+        on_complete=store_fcs_result,
+    )
+
+Author: CRMIT Backend Team
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+import asyncio
+import math
+import multiprocessing
+import traceback
+import weakref
+
+from loguru import logger
+
+from src.api.config import get_settings
+from src.parsers.fcs_parser import FCSParser
+from src.parsers.nta_parser import NTAParser
+
+# Called in the API process with a session, the job and the job function's result
+CompletionHandler = Callable[[Any, Any, Dict[str, Any]], Awaitable[None]]
+
+
+# ============================================================================
+# Worker-side helpers (run in pool processes)
+# ============================================================================
+
+_progress_queue: Optional[Any] = None
+
+
+def _init_worker(queue: Any) -> None:
+    """
+    Pool initializer: keep the progress queue for report_progress() and
+    drop (without closing) pooled DB connections inherited from the API
+    process, so a forked worker never shares the parent's sockets.
+    """
+    global _progress_queue
+    _progress_queue = queue
+
+    from src.database import connection
+    if connection._engine is not None:
+        connection._engine.sync_engine.dispose(close=False)
+
+
+def report_progress(job_id: str, percent: int, step: str) -> None:
+    """
+    Send a progress update for `job_id` to the API process.
+
+    No-op outside a JobWorkerPool worker, so job functions can also be
+    called directly (tests, scripts).
+    """
+    if _progress_queue is not None:
+        _progress_queue.put((job_id, int(percent), step))
+
+
+def _finite(value: Any) -> Any:
+    """Replace NaN/inf (not valid JSON) with None and NumPy scalars with Python ones, recursively."""
+    if hasattr(value, 'item') and not isinstance(value, (dict, list, tuple, str)):
+        value = value.item()
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+def _scatter_channel(channels: List[str], kind: str) -> Optional[str]:
+    """First `kind` ('FSC'/'SSC') channel, preferring area (-A) channels."""
+    matches = [c for c in channels if kind in c.upper()]
+    return next((c for c in matches if c.upper().endswith('-A')), matches[0] if matches else None)
+
+
+def run_fcs_job(job_id: str, file_path: str, parquet_dir: str) -> Dict[str, Any]:
+    """
+    Worker task: parse an uploaded FCS file, compute statistics and QC,
+    and write its events to Parquet.
+
+    Events are streamed from the memory-mapped file where possible, so
+    large uploads are never fully loaded.
+
+    Args:
+        job_id: ProcessingJob UUID (for progress reports)
+        file_path: Uploaded FCS file
+        parquet_dir: Parquet storage root; output goes to <parquet_dir>/fcs/
+
+    Returns:
+        JSON-serializable result (events, channels, statistics, QC, output path)
+    """
+    path = Path(file_path)
+    parser = FCSParser(path)
+
+    report_progress(job_id, 5, "Validating FCS file")
+    if not parser.validate():
+        raise ValueError(f"Invalid FCS file: {path.name}")
+
+    report_progress(job_id, 15, "Reading FCS events")
+    if parser.open() is None:
+        parser.parse()
+
+    report_progress(job_id, 35, "Calculating channel statistics")
+    statistics = parser.get_statistics()
+    summary = statistics.pop('_summary')
+
+    report_progress(job_id, 60, "Running quality checks")
+    qc = parser.validate_quality()
+
+    report_progress(job_id, 75, "Writing Parquet")
+    output_path = Path(parquet_dir) / "fcs" / f"{path.stem}.parquet"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    parser.to_parquet(output_path)
+
+    channels = list(summary['channels'])
+    return _finite({
+        'file_name': path.name,
+        'total_events': int(summary['total_events']),
+        'channels': channels,
+        'fsc_channel': _scatter_channel(channels, 'FSC'),
+        'ssc_channel': _scatter_channel(channels, 'SSC'),
+        'statistics': statistics,
+        'qc': qc,
+        'parquet_file_path': str(output_path),
+    })
+
+
+def run_nta_job(job_id: str, file_path: str, parquet_dir: str) -> Dict[str, Any]:
+    """
+    Worker task: parse an uploaded NTA export, compute size statistics and
+    write its data to Parquet.
+
+    Args:
+        job_id: ProcessingJob UUID (for progress reports)
+        file_path: Uploaded NTA text file
+        parquet_dir: Parquet storage root; output goes to <parquet_dir>/nta/
+
+    Returns:
+        JSON-serializable result (rows, statistics, parameters, output path)
+    """
+    path = Path(file_path)
+    parser = NTAParser(path)
+
+    report_progress(job_id, 10, "Validating NTA file")
+    if not parser.validate():
+        raise ValueError(f"Invalid NTA file: {path.name}")
+
+    report_progress(job_id, 30, "Parsing NTA file")
+    data = parser.parse()
+
+    report_progress(job_id, 60, "Calculating size statistics")
+    statistics = parser.get_summary_statistics()
+
+    report_progress(job_id, 80, "Writing Parquet")
+    output_path = Path(parquet_dir) / "nta" / f"{path.stem}.parquet"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    parser.to_parquet(output_path)
+
+    return _finite({
+        'file_name': path.name,
+        'measurement_type': parser.measurement_type,
+        'rows': len(data),
+        'statistics': statistics,
+        'measurement_params': parser.measurement_params,
+        'parquet_file_path': str(output_path),
+    })
+
+
+# ============================================================================
+# Result persistence (API process)
+# ============================================================================
+
+async def store_fcs_result(db: Any, job: Any, result: Dict[str, Any]) -> None:
+    """
+    Completion handler for run_fcs_job: create the FCSResult row and mark
+    the sample processed.
+    """
+    from src.database.crud import create_fcs_result
+    from src.database.models import Sample  # type: ignore[import-not-found]
+
+    stats = result['statistics']
+    fields: Dict[str, Any] = {}
+    for prefix, channel in (('fsc', result['fsc_channel']), ('ssc', result['ssc_channel'])):
+        if channel in stats:
+            for stat in ('mean', 'median', 'std', 'cv'):
+                fields[f'{prefix}_{stat}'] = stats[channel][stat]
+    scatter = {result['fsc_channel'], result['ssc_channel']}
+
+    if job.sample_id is not None:
+        await create_fcs_result(
+            db,
+            sample_id=job.sample_id,
+            total_events=result['total_events'],
+            fluorescence_stats={c: s for c, s in stats.items() if c not in scatter and c.lower() != 'time'},
+            parquet_file_path=result['parquet_file_path'],
+            **fields,
+        )
+        sample = await db.get(Sample, job.sample_id)
+        if sample is not None:
+            sample.processing_status = "completed"
+            sample.qc_status = "pass" if result['qc']['passed'] else "fail"
+            await db.commit()
+
+
+async def store_nta_result(db: Any, job: Any, result: Dict[str, Any]) -> None:
+    """
+    Completion handler for run_nta_job: create the NTAResult row (size
+    distributions only) and mark the sample processed.
+    """
+    from src.database.crud import create_nta_result
+    from src.database.models import Sample  # type: ignore[import-not-found]
+
+    if job.sample_id is None:
+        return
+
+    stats = result['statistics']
+    params = result['measurement_params']
+    if stats.get('mean_size_nm') is not None and stats.get('median_size_nm') is not None:
+        await create_nta_result(
+            db,
+            sample_id=job.sample_id,
+            mean_size_nm=stats['mean_size_nm'],
+            median_size_nm=stats['median_size_nm'],
+            d50_nm=stats['median_size_nm'],
+            concentration_particles_ml=stats.get('total_concentration'),
+            temperature_celsius=params.get('temperature'),
+            ph=params.get('ph'),
+            conductivity=params.get('conductivity'),
+            parquet_file_path=result['parquet_file_path'],
+        )
+    sample = await db.get(Sample, job.sample_id)
+    if sample is not None:
+        sample.processing_status = "completed"
+        await db.commit()
+
+
+def batch_summary(children: List[Any]) -> Dict[str, Any]:
+    """
+    Aggregate status and progress of a batch job's child jobs.
+
+    Progress is the mean of the children's progress (finished children
+    count as 100%). The batch is 'running' while any child is pending or
+    running, then 'completed' - or 'failed' if every child failed, or
+    'cancelled' if none completed and some were cancelled.
+
+    Args:
+        children: ProcessingJob rows of the batch
+
+    Returns:
+        Dict with 'status', 'progress_percent', 'total' and per-status counts
+    """
+    counts = {key: 0 for key in ('pending', 'running', 'completed', 'failed', 'cancelled')}
+    progress = 0
+    for child in children:
+        counts[child.status] = counts.get(child.status, 0) + 1
+        progress += 100 if child.status in ('completed', 'failed', 'cancelled') else (child.progress_percent or 0)
+
+    total = len(children)
+    if counts['pending'] + counts['running'] > 0:
+        batch_status = 'running' if counts['pending'] < total else 'pending'
+    elif total and counts['failed'] == total:
+        batch_status = 'failed'
+    elif counts['completed'] == 0 and counts['cancelled'] > 0:
+        batch_status = 'cancelled'
+    else:
+        batch_status = 'completed'
+
+    return {
+        'status': batch_status,
+        'progress_percent': int(progress / total) if total else 100,
+        'total': total,
+        **counts,
+    }
+
+
+async def finish_batch(batch_job_id: str, tasks: List[asyncio.Task]) -> None:
+    """
+    Wait for a batch's child jobs, then record the batch job's final status
+    with a per-status summary in result_data. A batch cancelled by the user
+    stays cancelled.
+    """
+    from src.database.connection import DatabaseSession
+    from src.database.crud import get_child_jobs, get_job_by_id, update_job_status
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        async with DatabaseSession() as db:
+            batch = await get_job_by_id(db, batch_job_id)
+            if batch is None or batch.status == "cancelled":
+                logger.info(f"⏭️ Batch {batch_job_id} was cancelled, status left unchanged")
+                return
+            summary = batch_summary(await get_child_jobs(db, batch_job_id))
+            await update_job_status(
+                db, batch_job_id, summary['status'],
+                result_data=summary,
+                error_message=f"All {summary['total']} files failed" if summary['status'] == 'failed' else None,
+            )
+        logger.success(f"✅ Batch {batch_job_id}: {summary['completed']}/{summary['total']} files processed")
+    except Exception as e:
+        logger.error(f"❌ Could not record result of batch {batch_job_id}: {e}")
+
+
+# ============================================================================
+# Job Worker Pool
+# ============================================================================
+
+class _WorkerTerminated(Exception):
+    """A job's worker process was killed because another job timed out."""
+
+
+class JobWorkerPool:
+    """
+    Bounded process pool for processing jobs with DB-tracked progress.
+
+    The ProcessPoolExecutor is created on first submit and kept alive until
+    shutdown(). A job that exceeds its timeout is marked failed and the
+    executor's processes are terminated, freeing the slot at once; jobs that
+    were running on them are retried once on a new executor.
+
+    Example:
+        >>> pool = JobWorkerPool(max_workers=4, timeout_seconds=300)
+        >>> await pool.submit(job_id, run_fcs_job, path, parquet_dir, on_complete=store_fcs_result)
+        >>> await pool.shutdown()
+    """
+
+    def __init__(self, max_workers: int = 4, timeout_seconds: float = 300):
+        """
+        Args:
+            max_workers: Worker processes (and jobs running at once)
+            timeout_seconds: Per-job running time limit
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._queue: Optional[Any] = None
+        self._pump: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._tasks: Set[asyncio.Task] = set()
+        # Executors terminated after a timeout (their other jobs are retried)
+        self._terminated: "weakref.WeakSet[ProcessPoolExecutor]" = weakref.WeakSet()
+
+    @property
+    def active_jobs(self) -> int:
+        """Jobs (and tracked follow-ups) submitted and not yet finished."""
+        return len(self._tasks)
+
+    def _ensure_started(self) -> None:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        if self._queue is None:
+            self._queue = multiprocessing.Queue()
+            self._pump = asyncio.get_running_loop().create_task(self._pump_progress())
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self._queue,),
+            )
+            logger.info(f"⚙️ Job worker pool started ({self.max_workers} workers)")
+
+    async def submit(
+        self,
+        job_id: str,
+        fn: Callable[..., Dict[str, Any]],
+        *args: Any,
+        on_complete: Optional[CompletionHandler] = None,
+        gate: Optional[asyncio.Semaphore] = None
+    ) -> asyncio.Task:
+        """
+        Schedule `fn(job_id, *args)` on the pool and return immediately.
+
+        Args:
+            job_id: ProcessingJob UUID (the row must already be committed)
+            fn: Picklable module-level job function returning a JSON-
+                serializable dict
+            *args: Further picklable arguments for `fn`
+            on_complete: Optional coroutine called with (session, job, result)
+                         before the job is marked completed
+            gate: Optional semaphore shared by related jobs (e.g. one batch)
+                  to cap how many of them run at once
+
+        Returns:
+            asyncio.Task that finishes when the job reaches a final status
+        """
+        self._ensure_started()
+        task = asyncio.get_running_loop().create_task(self._gated(gate, self._run(job_id, fn, args, on_complete)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        logger.info(f"📥 Queued job {job_id} ({fn.__name__})")
+        return task
+
+    @staticmethod
+    async def _gated(gate: Optional[asyncio.Semaphore], job: Awaitable[None]) -> None:
+        if gate is None:
+            await job
+            return
+        async with gate:
+            await job
+
+    def track(self, coro: Awaitable[None]) -> asyncio.Task:
+        """
+        Run a follow-up coroutine (e.g. finish_batch) as a task that
+        shutdown() waits for like a job.
+        """
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _run(
+        self,
+        job_id: str,
+        fn: Callable[..., Dict[str, Any]],
+        args: tuple,
+        on_complete: Optional[CompletionHandler]
+    ) -> None:
+        from src.database.connection import DatabaseSession
+        from src.database.crud import get_job_by_id, update_job_status
+
+        await self._slots.acquire()  # type: ignore[union-attr]
+        released = False
+        try:
+            async with DatabaseSession() as db:
+                job = await get_job_by_id(db, job_id)
+                if job is None or job.status == "cancelled":
+                    logger.info(f"⏭️ Skipping job {job_id} ({'missing' if job is None else 'cancelled'})")
+                    return
+                await update_job_status(db, job_id, "running")
+
+            released = True
+            try:
+                result = await self._execute(job_id, fn, args)
+            except _WorkerTerminated:
+                logger.warning(f"🔁 Retrying job {job_id} on a fresh worker")
+                await self._slots.acquire()  # type: ignore[union-attr]
+                result = await self._execute(job_id, fn, args)
+
+            async with DatabaseSession() as db:
+                job = await get_job_by_id(db, job_id)
+                if job is None or job.status == "cancelled":
+                    return
+                if on_complete is not None:
+                    await on_complete(db, job, result)
+                job.current_step = "Completed"
+                await update_job_status(db, job_id, "completed", result_data=result)
+            logger.success(f"✅ Job {job_id} completed")
+
+        except asyncio.TimeoutError:
+            await self._fail(job_id, f"Timed out after {self.timeout_seconds}s", None)
+        except Exception as e:
+            await self._fail(job_id, str(e), traceback.format_exc())
+        finally:
+            if not released:
+                self._slots.release()  # type: ignore[union-attr]
+
+    async def _execute(self, job_id: str, fn: Callable[..., Dict[str, Any]], args: tuple) -> Dict[str, Any]:
+        """Run one attempt of a job; the caller holds a slot, released when the worker finishes."""
+        self._ensure_started()
+        executor = self._executor
+        future = asyncio.get_running_loop().run_in_executor(executor, fn, job_id, *args)
+        future.add_done_callback(self._release_slot)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=self.timeout_seconds)
+        except asyncio.TimeoutError:
+            self._terminate_executor(executor)
+            raise
+        except BrokenProcessPool:
+            if executor in self._terminated:
+                raise _WorkerTerminated("Worker terminated after another job timed out") from None
+            if self._executor is executor:
+                self._executor = None  # recreated on next job
+            raise
+
+    def _release_slot(self, future: "asyncio.Future[Any]") -> None:
+        # The slot belongs to the worker process until it really finishes
+        self._slots.release()  # type: ignore[union-attr]
+        if not future.cancelled():
+            future.exception()  # retrieved: timed-out results are discarded
+
+    def _terminate_executor(self, executor: Optional[ProcessPoolExecutor]) -> None:
+        """Kill an executor's worker processes; the next job starts a new one."""
+        if executor is None or executor in self._terminated:
+            return
+        if self._executor is executor:
+            self._executor = None
+        self._terminated.add(executor)
+        # ProcessPoolExecutor has no public API to stop a running call
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False)
+        logger.warning("🛑 Terminated worker processes after a job timeout")
+
+    @staticmethod
+    async def _fail(job_id: str, message: str, tb: Optional[str]) -> None:
+        from src.database.connection import DatabaseSession
+        from src.database.crud import get_job_by_id, update_job_status
+
+        try:
+            async with DatabaseSession() as db:
+                job = await get_job_by_id(db, job_id)
+                if job is None or job.status in ("completed", "failed", "cancelled"):
+                    logger.info(f"⏭️ Job {job_id} already {job.status if job else 'gone'}, not marking failed")
+                    return
+                logger.error(f"❌ Job {job_id} failed: {message}")
+                await update_job_status(db, job_id, "failed", error_message=message, error_traceback=tb)
+        except Exception as e:
+            logger.error(f"❌ Could not record failure of job {job_id}: {e}")
+
+    async def _pump_progress(self) -> None:
+        """Write worker progress reports to ProcessingJob rows."""
+        from src.database.connection import DatabaseSession
+        from src.database.crud import update_job_progress
+
+        loop = asyncio.get_running_loop()
+        while True:
+            message = await loop.run_in_executor(None, self._queue.get)  # type: ignore[union-attr]
+            if message is None:
+                return
+            job_id, percent, step = message
+            try:
+                async with DatabaseSession() as db:
+                    await update_job_progress(db, job_id, percent, step)
+            except Exception as e:
+                logger.warning(f"⚠️ Progress update for job {job_id} failed: {e}")
+
+    async def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the pool.
+
+        Args:
+            wait: Let submitted jobs finish first (otherwise they are cancelled
+                  and left in their current status)
+        """
+        if wait and self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        for task in list(self._tasks):
+            task.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+        if self._queue is not None:
+            self._queue.put(None)
+            if self._pump is not None:
+                await self._pump
+            self._queue.close()
+            self._queue = None
+            self._pump = None
+        logger.info("🛑 Job worker pool stopped")
+
+
+# ============================================================================
+# Global pool
+# ============================================================================
+
+_pool: Optional[JobWorkerPool] = None
+
+
+def get_worker_pool() -> JobWorkerPool:
+    """
+    Get or create the application's job worker pool.
+
+    Sized by settings.max_workers, with settings.task_timeout_seconds as
+    the per-job limit.
+    """
+    global _pool
+
+    if _pool is None:
+        settings = get_settings()
+        _pool = JobWorkerPool(settings.max_workers, settings.task_timeout_seconds)
+    return _pool
+
+
+async def shutdown_worker_pool(wait: bool = True) -> None:
+    """Stop the global job worker pool (call during application shutdown)."""
+    global _pool
+
+    if _pool is not None:
+        await _pool.shutdown(wait=wait)
+        _pool = None
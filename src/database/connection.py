@@ -8,26 +8,90 @@ Provides:
 - Async database engine
 - Session factory
 - Dependency injection for FastAPI
-- Connection pool management
+- Connection pool management (AsyncAdaptedQueuePool sized from Settings,
+  with checkout metrics)
 
 Author: CRMIT Backend Team
 Date: November 21, 2025
 """
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict, Optional
+import threading
+import time
+from sqlalchemy import exc  # type: ignore[import-not-found]
 from sqlalchemy.ext.asyncio import (  # type: ignore[import-not-found]
     create_async_engine,
     AsyncSession,
     async_sessionmaker,
     AsyncEngine
 )
-from sqlalchemy.pool import NullPool, QueuePool  # type: ignore[import-not-found]
+from sqlalchemy.pool import AsyncAdaptedQueuePool  # type: ignore[import-not-found]
 from loguru import logger
 
 from src.api.config import get_settings
 
 settings = get_settings()
 
+# ============================================================================
+# Connection Pool
+# ============================================================================
+
+class PoolMetrics:
+    """
+    Checkout statistics of the engine's connection pool.
+    
+    Checkout time is measured around Pool.connect(): waiting for a free
+    connection, opening a new one when the pool grows, and the pre-ping
+    if enabled.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+    
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.total_wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": 1000 * self.total_wait_seconds / self.checkouts if self.checkouts else 0.0,
+                "max_wait_ms": 1000 * self.max_wait_seconds,
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class MeteredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout time in pool_metrics."""
+    
+    def connect(self):  # type: ignore[no-untyped-def]
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_metrics.record(time.perf_counter() - start)
+        return connection
+
+
 # ============================================================================
 # Database Engine
 # ============================================================================
@@ -44,10 +108,14 @@ def get_engine() -> AsyncEngine:
     Returns:
         AsyncEngine instance
     
-    Configuration:
-    - Pool size: Configurable via settings
+    Configuration (all from Settings):
+    - Pool: db_pool_size persistent connections plus up to db_max_overflow
+      extra ones under load; a checkout waits at most db_pool_timeout_seconds
+    - Connection recycling: db_pool_recycle_seconds
+    - Pre-ping: db_pool_pre_ping (off by default - recycling already
+      replaces stale connections and a ping costs a round trip per checkout)
+    - asyncpg prepared statement cache: db_statement_cache_size per connection
     - Echo SQL: Controlled by settings.db_echo
-    - Connection recycling: 3600 seconds (1 hour)
     
     Usage:
         from src.database.connection import get_engine
@@ -58,16 +126,25 @@ def get_engine() -> AsyncEngine:
     if _engine is None:
         logger.info("🔌 Creating database engine...")
         logger.info(f"   Database URL: {settings.database_url.split('@')[-1]}")  # Hide credentials
+        logger.info(
+            f"   Pool: AsyncAdaptedQueuePool (size={settings.db_pool_size}, "
+            f"overflow={settings.db_max_overflow}, recycle={settings.db_pool_recycle_seconds}s)"
+        )
         
-        # Use NullPool for async engines (required for asyncpg)
-        poolclass = NullPool
-        logger.info("   Pool: NullPool (async engine)")
+        connect_args: Dict[str, Any] = {}
+        if "+asyncpg" in settings.database_url:
+            connect_args["prepared_statement_cache_size"] = settings.db_statement_cache_size
         
         _engine = create_async_engine(
             settings.database_url,
             echo=settings.db_echo,
-            poolclass=poolclass,
-            pool_pre_ping=True,  # Verify connections before using
+            poolclass=MeteredAsyncQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            connect_args=connect_args,
         )
         
         logger.success("✅ Database engine created")
@@ -75,6 +152,32 @@ def get_engine() -> AsyncEngine:
     return _engine
 
 
+def get_pool_status() -> Optional[Dict[str, Any]]:
+    """
+    Connection pool gauges and checkout metrics.
+    
+    Returns:
+        Dict with pool size, checked-out / checked-in connections, current
+        overflow and pool_metrics counters, or None before the engine exists
+    
+    Usage:
+        from src.database.connection import get_pool_status
+        print(get_pool_status())
+    """
+    if _engine is None:
+        return None
+    
+    pool = _engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.db_max_overflow,
+        **pool_metrics.to_dict(),
+    }
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """
     Get or create the async session factory.
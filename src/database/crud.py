@@ -40,6 +40,7 @@ async def create_sample(
     db: AsyncSession,
     sample_id: str,
     treatment: Optional[str] = None,
+    biological_sample_id: Optional[str] = None,
     concentration_ug: Optional[float] = None,
     preparation_method: Optional[str] = None,
     file_path_fcs: Optional[str] = None,
@@ -55,6 +56,7 @@ async def create_sample(
         db: Database session
         sample_id: Unique sample identifier (e.g., "P5_F10_CD81")
         treatment: Treatment/condition name
+        biological_sample_id: Biological sample (e.g., "P5_F10"); defaults to sample_id
         concentration_ug: Concentration in µg
         preparation_method: Preparation method (SEC, centrifugation, etc.)
         file_path_fcs: Path to FCS file
@@ -69,6 +71,7 @@ async def create_sample(
     try:
         sample = Sample(
             sample_id=sample_id,
+            biological_sample_id=biological_sample_id or sample_id,
             treatment=treatment,
             concentration_ug=concentration_ug,
             preparation_method=preparation_method,
@@ -78,7 +81,7 @@ async def create_sample(
             operator=operator,
             notes=notes,
             processing_status=ProcessingStatus.PENDING,
-            qc_status=QCStatus.PENDING,
+            qc_status=None,  # Set once results are QC-checked
         )
         
         db.add(sample)
@@ -352,6 +355,7 @@ async def create_processing_job(
     job_id: str,
     job_type: str,
     sample_id: Optional[int] = None,
+    parent_job_id: Optional[str] = None,
 ) -> ProcessingJob:
     """
     Create a new processing job.
@@ -361,6 +365,7 @@ async def create_processing_job(
         job_id: UUID for the job
         job_type: Type of job (fcs_parse, nta_parse, batch_process)
         sample_id: Database ID of associated sample (optional)
+        parent_job_id: UUID of the batch job this job belongs to (optional)
         
     Returns:
         Created ProcessingJob object
@@ -370,6 +375,7 @@ async def create_processing_job(
             job_id=job_id,
             job_type=job_type,
             sample_id=sample_id,
+            parent_job_id=parent_job_id,
             status="pending",
             progress_percent=0,
         )
@@ -412,6 +418,8 @@ async def update_job_progress(
     """
     Update job progress.
     
+    Jobs already completed, failed or cancelled are left unchanged.
+    
     Args:
         db: Database session
         job_id: Job UUID
@@ -427,6 +435,10 @@ async def update_job_progress(
             logger.warning(f"⚠️ Job not found for progress update: {job_id}")
             return None
         
+        # Late reports must not reopen finished jobs
+        if job.status in ["completed", "failed", "cancelled"]:
+            return job
+        
         job.progress_percent = progress_percent
         if current_step:
             job.current_step = current_step
@@ -529,6 +541,27 @@ async def get_jobs_by_sample(
     return result.scalars().all()
 
 
+async def get_child_jobs(
+    db: AsyncSession,
+    parent_job_id: str
+) -> List[ProcessingJob]:
+    """
+    Get the per-file jobs of a batch job.
+    
+    Args:
+        db: Database session
+        parent_job_id: UUID of the batch job
+        
+    Returns:
+        List of ProcessingJob objects in creation order
+    """
+    query = select(ProcessingJob).where(ProcessingJob.parent_job_id == parent_job_id).order_by(
+        ProcessingJob.id
+    )
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
 # ============================================================================
 # QC Report CRUD Operations
 # ============================================================================
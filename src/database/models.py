@@ -264,6 +264,9 @@ class ProcessingJob(Base):
     # Foreign Key (optional - not all jobs are sample-specific)
     sample_id = Column(Integer, ForeignKey("samples.id"), nullable=True, index=True)
     
+    # Parent batch job (per-file jobs of a batch upload)
+    parent_job_id = Column(String(100), ForeignKey("processing_jobs.job_id"), nullable=True, index=True)
+    
     # Job Details
     job_type = Column(String(50), nullable=False, index=True)  # "fcs_parse", "nta_parse", "batch_process"
     status = Column(String(20), nullable=False, default="pending", index=True)
@@ -4,6 +4,15 @@ Data parsers for different instrument types.
 
 from .base_parser import BaseParser
 from .fcs_parser import FCSParser
+from .fcs_reader import FCSReader, UnsupportedFCSFormat
+from .fcs_scan import scan_fcs_header, scan_fcs_headers
+from .nta_parser import NTAParser, parse_nta_files
 from .parquet_writer import ParquetWriter
+from .event_dataset import EventDataset, acquisition_date
+from .conversion_manifest import ConversionManifest, content_hash
+from .streaming_stats import StreamingStatistics, ChannelAccumulator, QuantileSketch
 
-__all__ = ['BaseParser', 'FCSParser', 'ParquetWriter']
+__all__ = ['BaseParser', 'FCSParser', 'FCSReader', 'UnsupportedFCSFormat', 'ParquetWriter',
+           'scan_fcs_header', 'scan_fcs_headers', 'NTAParser', 'parse_nta_files', 'EventDataset', 'acquisition_date',
+           'ConversionManifest', 'content_hash',
+           'StreamingStatistics', 'ChannelAccumulator', 'QuantileSketch']
@@ -4,16 +4,21 @@ Base parser class for all instrument data parsers.
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 from loguru import logger
 
+from .parquet_writer import encoding_options
+
 
 class BaseParser(ABC):
     """Abstract base class for all data parsers."""
     
+    # Recorded in Parquet metadata; subclasses bump it when their output changes
+    PARSER_VERSION = '1.0.0'
+    
     def __init__(self, file_path: Path):
         """
         Initialize parser.
@@ -59,7 +64,8 @@ class BaseParser(ABC):
         self, 
         output_path: Path, 
         compression: str = 'snappy',
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        exclude_columns: Optional[List[str]] = None
     ) -> None:
         """
         Convert parsed data to Parquet format with embedded metadata.
@@ -68,6 +74,7 @@ class BaseParser(ABC):
             output_path: Path for output Parquet file
             compression: Compression codec (snappy, gzip, zstd, none)
             metadata: Additional metadata to embed in Parquet file
+            exclude_columns: Columns of self.data not to write
         
         HOW IT WORKS:
         -------------
@@ -107,39 +114,21 @@ class BaseParser(ABC):
         # - Type safety: pandas int64 -> Arrow int64 -> Parquet INT64
         # - Memory efficiency: Zero-copy when possible
         # - Fast conversion: Native C++ implementation
-        table = pa.Table.from_pandas(self.data)
+        data = self.data.drop(columns=exclude_columns) if exclude_columns else self.data
+        table = pa.Table.from_pandas(data)
         
-        # Step 4: Prepare metadata to embed in Parquet file
-        # --------------------------------------------------
+        # Step 4-5: Prepare metadata to embed in Parquet file (as bytes)
+        # ---------------------------------------------------------------
         # Parquet files can store custom key-value metadata in the header
         # This is separate from the data itself (doesn't affect queries)
         # Useful for: provenance, processing history, quality metrics
-        metadata_dict = {
-            'source_file': str(self.file_path),     # Original FCS filename
-            'parser_version': '1.0.0',              # Track parser version
-            **self.metadata                          # Include all parsed metadata
-        }
-        
-        # Add any additional metadata passed by caller
-        # Example: {'qc_passed': 'True', 'analyst': 'John'}
-        if metadata:
-            metadata_dict.update(metadata)
-        
-        # Step 5: Convert metadata to bytes (Parquet requirement)
-        # --------------------------------------------------------
-        # Parquet metadata must be bytes, not strings
-        # Convert: {'key': 'value'} -> {b'key': b'value'}
-        metadata_bytes = {
-            k.encode(): str(v).encode() 
-            for k, v in metadata_dict.items()
-        }
+        metadata_bytes = self._schema_metadata(metadata)
         
         # Step 6: Attach metadata to Arrow Table schema
         # ----------------------------------------------
         # Schema defines column names, types, and file-level metadata
-        # Create new schema with our custom metadata attached
-        schema = table.schema.with_metadata(metadata_bytes)
-        table = table.cast(schema)  # Apply new schema to table
+        # Replacing the schema metadata reuses the column buffers (no copy)
+        table = table.replace_schema_metadata(metadata_bytes)
         
         # Step 7: Write to Parquet file with optimizations
         # -------------------------------------------------
@@ -147,7 +136,7 @@ class BaseParser(ABC):
             table, 
             output_path, 
             compression=compression,       # Compress data (snappy=fast, gzip=small)
-            use_dictionary=True,           # Encode repeated values once (saves space)
+            **encoding_options(table.schema),  # Dictionary for repeated values, byte-split floats
             write_statistics=True,         # Min/max per column (faster queries)
             version='2.6'                  # Latest Parquet format (best features)
         )
@@ -165,6 +154,31 @@ class BaseParser(ABC):
         file_size_mb = output_path.stat().st_size / (1024 * 1024)
         logger.info(f"Saved Parquet file: {output_path} ({file_size_mb:.2f} MB)")
     
+    def _schema_metadata(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[bytes, bytes]:
+        """
+        Key-value metadata embedded in the Parquet schema.
+        
+        Combines provenance (source file, parser version), all parsed file
+        metadata and any caller-supplied entries; Parquet requires bytes.
+        
+        Args:
+            metadata: Additional metadata (e.g. {'qc_passed': 'True'})
+        
+        Returns:
+            Dict mapping encoded keys to encoded values
+        """
+        metadata_dict = {
+            'source_file': str(self.file_path),     # Original FCS filename
+            'parser_version': self.PARSER_VERSION,  # Track parser version
+            **self.metadata                          # Include all parsed metadata
+        }
+        if metadata:
+            metadata_dict.update(metadata)
+        return {
+            k.encode(): str(v).encode()
+            for k, v in metadata_dict.items()
+        }
+    
     def get_file_info(self) -> Dict[str, Any]:
         """
         Get basic file information.
@@ -0,0 +1,260 @@
+"""
+Content-hash manifest for incremental file conversion.
+
+A small SQLite database records, for every converted input, the hash of its
+content, the converter version and the output it produced. Re-runs over an
+archive skip inputs whose (path, content hash, version) was already
+converted successfully and whose output still exists, so only new or
+modified files - or everything, after a converter version bump - are
+reconverted. Keying on the path as well keeps byte-identical copies at
+different paths (common in archives) from overwriting each other's record.
+
+Hashing a large archive on every run would itself take a long time, so
+each path's size and modification time are cached with its hash (like
+git's index): the file is re-hashed only when its stat changes.
+
+Results are committed one file at a time, so a run that crashes half-way
+resumes where it stopped.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Union
+import hashlib
+import os
+import sqlite3
+
+from loguru import logger
+
+
+HASH_CHUNK_BYTES = 8 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS file_hashes (
+    file_path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS conversions (
+    content_hash TEXT NOT NULL,
+    version TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    output_path TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    converted_at TEXT NOT NULL,
+    PRIMARY KEY (file_path, content_hash, version)
+);
+"""
+
+
+def content_hash(file_path: Union[str, Path]) -> str:
+    """
+    BLAKE2b digest of a file's content, read in 8 MB blocks.
+
+    Args:
+        file_path: File to hash
+
+    Returns:
+        Hex digest (32 characters)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(HASH_CHUNK_BYTES)
+            if not block:
+                break
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ConversionManifest:
+    """
+    SQLite manifest of converted files keyed by path, content hash and version.
+
+    Each method opens its own short-lived connection, so the manifest can be
+    pickled into worker processes; record results from one process only.
+
+    Example:
+        >>> manifest = ConversionManifest(Path("data/parquet/_manifest.sqlite"), version="fcs-2.0")
+        >>> todo = manifest.pending(fcs_files, output_for=lambda p: out_dir / f"{p.stem}.parquet")
+        >>> for path in todo:
+        ...     convert(path)
+        ...     manifest.record_success(path, out_dir / f"{path.stem}.parquet")
+    """
+
+    def __init__(self, db_path: Union[str, Path], version: str):
+        """
+        Args:
+            db_path: SQLite file (created if missing)
+            version: Converter version; bump it to force reconversion
+        """
+        self.db_path = Path(db_path)
+        self.version = str(version)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            self._migrate(conn)
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Re-key a manifest written before file_path joined the primary key."""
+        columns = conn.execute('PRAGMA table_info(conversions)').fetchall()
+        primary_key = {row['name'] for row in columns if row['pk']}
+        if not columns or 'file_path' in primary_key:
+            return
+        conn.execute('ALTER TABLE conversions RENAME TO conversions_old')
+        conn.executescript(_SCHEMA)
+        rows = conn.execute('SELECT * FROM conversions_old').fetchall()
+        conn.executemany(
+            'INSERT OR REPLACE INTO conversions VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [
+                (row['content_hash'], row['version'], ConversionManifest._key(row['file_path']),
+                 row['output_path'], row['status'], row['error'], row['converted_at'])
+                for row in rows
+            ],
+        )
+        conn.execute('DROP TABLE conversions_old')
+        logger.info(f"Migrated {len(rows)} conversion records to per-path keys")
+
+    @staticmethod
+    def _key(file_path: Union[str, Path]) -> str:
+        return str(Path(file_path).resolve())
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
+
+    def fingerprints(
+        self,
+        paths: Iterable[Union[str, Path]],
+        max_workers: Optional[int] = None
+    ) -> Dict[Path, str]:
+        """
+        Content hashes of `paths`, re-hashing only files whose size or
+        modification time changed since they were last hashed.
+
+        Args:
+            paths: Input files
+            max_workers: Threads used to hash changed files
+
+        Returns:
+            Dict mapping each path to its content hash
+        """
+        files = [Path(p) for p in paths]
+        with closing(self._connect()) as conn:
+            cached = {row['file_path']: row for row in conn.execute('SELECT * FROM file_hashes')}
+
+        hashes: Dict[Path, str] = {}
+        stale: List[tuple] = []
+        for path in files:
+            stat = path.stat()
+            row = cached.get(self._key(path))
+            if row is not None and row['size'] == stat.st_size and row['mtime_ns'] == stat.st_mtime_ns:
+                hashes[path] = row['content_hash']
+            else:
+                stale.append((path, stat))
+
+        if stale:
+            workers = max_workers or min(8, (os.cpu_count() or 1) + 4)
+            with ThreadPoolExecutor(max_workers=min(workers, len(stale))) as executor:
+                digests = list(executor.map(lambda item: content_hash(item[0]), stale))
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?)',
+                    [(self._key(p), s.st_size, s.st_mtime_ns, d) for (p, s), d in zip(stale, digests)],
+                )
+            hashes.update({p: d for (p, _), d in zip(stale, digests)})
+
+        logger.debug(f"Fingerprinted {len(files)} files ({len(stale)} hashed, {len(files) - len(stale)} cached)")
+        return hashes
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def pending(
+        self,
+        paths: Iterable[Union[str, Path]],
+        output_for: Optional[Any] = None,
+        max_workers: Optional[int] = None
+    ) -> List[Path]:
+        """
+        Inputs that still need converting, in input order.
+
+        A file is up to date when its (path, content hash, version) was
+        recorded as a success and the recorded output still exists - and, if
+        `output_for` is given, is the output this run would write.
+
+        Args:
+            paths: Candidate input files
+            output_for: Optional callable mapping an input path to its
+                        expected output path
+            max_workers: Threads used to hash changed files
+
+        Returns:
+            List of paths to convert
+        """
+        files = [Path(p) for p in paths]
+        hashes = self.fingerprints(files, max_workers=max_workers)
+        with closing(self._connect()) as conn:
+            done = {
+                (row['file_path'], row['content_hash']): row['output_path']
+                for row in conn.execute(
+                    "SELECT file_path, content_hash, output_path FROM conversions "
+                    "WHERE version = ? AND status = 'success'",
+                    (self.version,),
+                )
+            }
+
+        todo = []
+        for path in files:
+            output = done.get((self._key(path), hashes[path]))
+            up_to_date = (
+                output is not None
+                and Path(output).exists()
+                and (output_for is None or Path(output) == Path(output_for(path)))
+            )
+            if not up_to_date:
+                todo.append(path)
+
+        logger.info(f"{len(todo)}/{len(files)} files new or changed since last conversion (version {self.version})")
+        return todo
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _record(self, file_path: Path, status: str, output_path: Optional[Path], error: Optional[str]) -> None:
+        digest = self.fingerprints([file_path])[Path(file_path)]
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO conversions VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (
+                    digest, self.version, self._key(file_path),
+                    str(output_path) if output_path is not None else None,
+                    status, error, datetime.now().isoformat(timespec='seconds'),
+                ),
+            )
+
+    def record_success(self, file_path: Union[str, Path], output_path: Union[str, Path]) -> None:
+        """Mark `file_path` (at its current content) as converted to `output_path`."""
+        self._record(Path(file_path), 'success', Path(output_path), None)
+
+    def record_failure(self, file_path: Union[str, Path], error: str) -> None:
+        """Record a failed conversion; the file stays pending for the next run."""
+        self._record(Path(file_path), 'error', None, str(error))
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """All conversion records for this version."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute('SELECT * FROM conversions WHERE version = ?', (self.version,)).fetchall()
+        return [dict(row) for row in rows]
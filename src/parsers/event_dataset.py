@@ -0,0 +1,466 @@
+"""
+Hive-partitioned Parquet dataset of events across many files.
+
+Instead of one flat Parquet file per measurement, events are appended to a
+single dataset directory partitioned by instrument type, biological sample
+and acquisition date:
+
+    root/
+        _common_metadata
+        _metadata
+        instrument_type=flow_cytometry/
+            biological_sample_id=P5_F10/
+                acquisition_date=2025-11-04/
+                    P5_F10_CD81_0.25ug-3f2a9c1e-0.parquet
+
+Appending writes new files only; existing data files are never rewritten.
+append_fcs() records each source file's name and content hash in
+`_sources.json`, so appending the same acquisition again is a no-op.
+The `_metadata` summary (the footers of every data file, with their
+relative paths) is extended on each append, so opening the dataset reads
+one small file instead of listing directories and every footer. Queries
+prune partitions from the directory names before any data file is opened.
+
+The dataset expects a single writer at a time (appends update `_metadata`).
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Union
+import json
+import os
+import re
+import uuid
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from loguru import logger
+
+from .conversion_manifest import content_hash
+from .parquet_writer import Filters, encoding_options, statistics_columns
+
+
+# Partition keys (directory levels), outermost first
+PARTITION_COLS = ['instrument_type', 'biological_sample_id', 'acquisition_date']
+
+# Partition value used when a key is missing or unparseable
+UNKNOWN_PARTITION = 'unknown'
+
+SUMMARY_FILE = '_metadata'
+COMMON_METADATA_FILE = '_common_metadata'
+SOURCES_FILE = '_sources.json'
+
+# Date formats seen in FCS $DATE (spec: dd-mmm-yyyy) and NTA exports
+_DATE_FORMATS = ('%d-%b-%Y', '%Y-%m-%d', '%d-%m-%Y', '%d.%m.%Y', '%m/%d/%Y', '%Y%m%d')
+
+
+def acquisition_date(value: Any) -> str:
+    """
+    Normalize an acquisition date to an ISO 'YYYY-MM-DD' partition value.
+
+    ISO dates sort and compare as strings, so date ranges can be expressed
+    as partition filters, e.g. [('acquisition_date', '>=', '2025-11-01')].
+
+    Args:
+        value: FCS $DATE string ('04-NOV-2025'), date/datetime or Timestamp
+
+    Returns:
+        'YYYY-MM-DD', or UNKNOWN_PARTITION if the value cannot be parsed
+    """
+    if value is None:
+        return UNKNOWN_PARTITION
+    if hasattr(value, 'strftime'):
+        return value.strftime('%Y-%m-%d')
+    text = str(value).strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text.title(), fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return UNKNOWN_PARTITION
+
+
+def _filter_expression(filters: Optional[Filters]) -> Optional[pc.Expression]:
+    """pyarrow DNF filters (or an Expression) as a dataset Expression."""
+    if filters is None or isinstance(filters, pc.Expression):
+        return filters
+    return pq.filters_to_expression(filters)
+
+
+class EventDataset:
+    """
+    Append-only, Hive-partitioned Parquet dataset of event tables.
+
+    Example:
+        >>> dataset = EventDataset(Path("data/parquet/events"))
+        >>> dataset.append_fcs(FCSParser(Path("P5_F10_CD81_0.25ug.fcs")))
+        >>> # All CD81 runs in November - only November partitions are opened
+        >>> df = dataset.read(
+        ...     columns=['VFSC-H', 'VSSC1-H', 'file_name'],
+        ...     filters=(pc.field('acquisition_date') >= '2025-11-01')
+        ...             & (pc.field('acquisition_date') < '2025-12-01')
+        ...             & pc.match_substring(pc.field('file_name'), 'CD81'),
+        ... )
+    """
+
+    def __init__(self, root: Union[str, Path], partition_cols: Optional[List[str]] = None):
+        """
+        Args:
+            root: Dataset directory (created on first append)
+            partition_cols: Partition keys, outermost first (default: PARTITION_COLS)
+        """
+        self.root = Path(root)
+        self.partition_cols = list(partition_cols or PARTITION_COLS)
+        self.partitioning = ds.partitioning(
+            pa.schema([(c, pa.string()) for c in self.partition_cols]), flavor='hive'
+        )
+
+    @property
+    def summary_path(self) -> Path:
+        return self.root / SUMMARY_FILE
+
+    @property
+    def sources_path(self) -> Path:
+        return self.root / SOURCES_FILE
+
+    @property
+    def schema(self) -> Optional[pa.Schema]:
+        """Schema of the data files (without partition keys), None if empty."""
+        path = self.root / COMMON_METADATA_FILE
+        if not path.exists():
+            return None
+        return pq.read_schema(path)
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(
+        self,
+        data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+        name: str = 'part',
+        partition_values: Optional[Dict[str, Any]] = None,
+        compression: str = 'snappy',
+        row_group_mb: float = 8.0
+    ) -> List[Path]:
+        """
+        Append event rows as new files in their partitions.
+
+        Partition keys come from the data's columns, overridden by
+        `partition_values`; missing values go to UNKNOWN_PARTITION. The
+        first append fixes the dataset schema: later appends may lack
+        columns (filled with nulls) but may not add new ones.
+
+        Args:
+            data: DataFrame, or an iterable of DataFrame chunks (streamed,
+                  e.g. FCSParser.iter_chunks())
+            name: Prefix of the new file names (e.g. the source file stem)
+            partition_values: Constant partition values for all rows
+            compression: Compression codec ('snappy', 'gzip', 'zstd', 'none')
+            row_group_mb: Target uncompressed size per row group (MB)
+
+        Returns:
+            Paths of the files written (empty if `data` had no rows)
+
+        Raises:
+            ValueError: If the data has columns the dataset schema lacks
+        """
+        chunks = iter([data] if isinstance(data, pd.DataFrame) else data)
+        first = next(chunks, None)
+        if first is None:
+            return []
+
+        first_table = self._to_table(first, partition_values)
+        file_schema = self.schema
+        if file_schema is None:
+            file_schema = first_table.drop_columns(self.partition_cols).schema
+        extra = set(first_table.column_names) - set(file_schema.names) - set(self.partition_cols)
+        if extra:
+            raise ValueError(
+                f"Columns not in dataset schema of {self.root}: {sorted(extra)} "
+                f"(use a separate dataset for a different channel panel)"
+            )
+        full_schema = pa.schema(list(file_schema) + [pa.field(c, pa.string()) for c in self.partition_cols])
+
+        def batches() -> Iterator[pa.RecordBatch]:
+            yield from self._conform(first_table, full_schema).to_batches()
+            for chunk in chunks:
+                yield from self._conform(self._to_table(chunk, partition_values), full_schema).to_batches()
+
+        bytes_per_row = max(1.0, first_table.nbytes / max(first_table.num_rows, 1))
+        rows_per_group = max(10_000, int(row_group_mb * 1e6 / bytes_per_row))
+        file_format = ds.ParquetFileFormat()
+        write_options = file_format.make_write_options(
+            compression=compression,
+            write_statistics=statistics_columns(file_schema.names) or True,
+            version='2.6',
+            **encoding_options(file_schema),
+        )
+
+        written: List[Any] = []
+        stem = re.sub(r'[^\w.-]+', '_', name).strip('_') or 'part'
+        self.root.mkdir(parents=True, exist_ok=True)
+        ds.write_dataset(
+            batches(),
+            self.root,
+            schema=full_schema,
+            format=file_format,
+            file_options=write_options,
+            partitioning=self.partitioning,
+            basename_template=f"{stem}-{uuid.uuid4().hex[:8]}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+            max_rows_per_group=rows_per_group,
+            min_rows_per_group=min(rows_per_group, 10_000),
+            file_visitor=written.append,
+        )
+
+        if not written:
+            return []
+        paths = [Path(w.path) for w in written]
+        self._update_summary(written, file_schema)
+        logger.info(
+            f"✅ Appended {sum(w.metadata.num_rows for w in written):,} rows to {self.root.name} "
+            f"({len(paths)} files)"
+        )
+        return paths
+
+    def _sources(self) -> Dict[str, List[str]]:
+        """Source key ('<file name>:<content hash>') -> relative data file paths."""
+        if not self.sources_path.exists():
+            return {}
+        with open(self.sources_path, encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _source_key(file_path: Path, digest: Optional[str] = None) -> str:
+        return f"{file_path.name}:{digest or content_hash(file_path)}"
+
+    def contains(self, file_path: Union[str, Path]) -> bool:
+        """
+        Whether a source file (same name and content) was already appended
+        and its data files are still present.
+
+        Args:
+            file_path: Source file (e.g. an FCS file)
+
+        Returns:
+            True if append_fcs() would skip the file
+        """
+        files = self._sources().get(self._source_key(Path(file_path)))
+        return bool(files) and all((self.root / f).exists() for f in files)
+
+    def _record_source(self, key: str, paths: List[Path]) -> None:
+        """Add a source's data files to `_sources.json` (written atomically)."""
+        sources = self._sources()
+        sources[key] = [self._relative(str(p)) for p in paths]
+        tmp = self.sources_path.with_name(f"{SOURCES_FILE}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(sources, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.sources_path)
+
+    def append_fcs(self, parser: Any, skip_existing: bool = True, **kwargs: Any) -> List[Path]:
+        """
+        Stream an FCS file into the dataset without loading it whole.
+
+        The acquisition date partition comes from the file's $DATE keyword.
+        A file whose name and content were already appended is skipped, so
+        the same directory can be appended again after new acquisitions.
+
+        Args:
+            parser: FCSParser (parse() need not have been called)
+            skip_existing: Skip files already in the dataset (see contains())
+            **kwargs: Passed to append() (compression, row_group_mb)
+
+        Returns:
+            Paths of the files written (empty if the file was skipped)
+        """
+        file_path = Path(parser.file_path)
+        key = self._source_key(file_path)
+        existing = self._sources().get(key)
+        if skip_existing and existing and all((self.root / f).exists() for f in existing):
+            logger.info(f"⏭️ {file_path.name} already in {self.root.name}, skipping")
+            return []
+
+        if parser.data is None and parser.open() is None:
+            parser.parse()  # Layout only fcsparser can read
+        paths = self.append(
+            parser.iter_chunks(),
+            name=file_path.stem,
+            partition_values={'acquisition_date': acquisition_date(parser.metadata.get('$DATE'))},
+            **kwargs,
+        )
+        if paths:
+            self._record_source(key, paths)
+        return paths
+
+    def _to_table(self, chunk: pd.DataFrame, partition_values: Optional[Dict[str, Any]]) -> pa.Table:
+        """
+        Arrow table of a chunk with string partition columns.
+
+        Categorical (per-file) columns are decoded to plain values so that
+        string kernels such as match_substring work in filters; Parquet
+        still stores them dictionary-encoded.
+        """
+        table = pa.Table.from_pandas(chunk, preserve_index=False).replace_schema_metadata(None)
+        for i, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                value_type = field.type.value_type
+                if pa.types.is_large_string(value_type):
+                    value_type = pa.string()
+                table = table.set_column(i, field.name, table[field.name].cast(value_type))
+        for column in self.partition_cols:
+            if partition_values and column in partition_values:
+                value = partition_values[column]
+                values = pa.array([UNKNOWN_PARTITION if value is None else str(value)] * table.num_rows, pa.string())
+            elif column in table.column_names:
+                values = table[column].cast(pa.string()).fill_null(UNKNOWN_PARTITION)
+            else:
+                values = pa.array([UNKNOWN_PARTITION] * table.num_rows, pa.string())
+            if column in table.column_names:
+                table = table.set_column(table.schema.get_field_index(column), column, values)
+            else:
+                table = table.append_column(column, values)
+        return table
+
+    @staticmethod
+    def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+        """Reorder/cast columns to `schema`, adding missing ones as nulls."""
+        columns = [
+            table[f.name].cast(f.type) if f.name in table.column_names else pa.nulls(table.num_rows, f.type)
+            for f in schema
+        ]
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    def _update_summary(self, written: List[Any], file_schema: pa.Schema) -> None:
+        """Add the new files' footers to `_metadata` (written atomically)."""
+        common = self.root / COMMON_METADATA_FILE
+        if not common.exists():
+            pq.write_metadata(file_schema, common)
+
+        if self.summary_path.exists():
+            summary = pq.read_metadata(self.summary_path)
+            new = written
+        else:
+            summary, new = written[0].metadata, written[1:]
+            summary.set_file_path(self._relative(written[0].path))
+        for w in new:
+            w.metadata.set_file_path(self._relative(w.path))
+            summary.append_row_groups(w.metadata)
+
+        tmp = self.summary_path.with_name(f"{SUMMARY_FILE}.tmp")
+        summary.write_metadata_file(str(tmp))
+        os.replace(tmp, self.summary_path)
+
+    def _relative(self, path: str) -> str:
+        return Path(path).relative_to(self.root).as_posix()
+
+    def rebuild_summary(self) -> None:
+        """
+        Recreate `_metadata` from the data files' footers.
+
+        Needed only if the summary was lost or an append was interrupted
+        after writing its data files.
+        """
+        self.summary_path.unlink(missing_ok=True)
+        fragments = list(self._discovered().get_fragments())
+        summary = None
+        for fragment in fragments:
+            metadata = fragment.metadata
+            metadata.set_file_path(self._relative(fragment.path))
+            if summary is None:
+                summary = metadata
+            else:
+                summary.append_row_groups(metadata)
+        if summary is not None:
+            summary.write_metadata_file(str(self.summary_path))
+        logger.info(f"Rebuilt {SUMMARY_FILE} of {self.root.name} from {len(fragments)} files")
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _discovered(self) -> ds.Dataset:
+        return ds.dataset(self.root, format='parquet', partitioning=self.partitioning)
+
+    def dataset(self) -> ds.Dataset:
+        """
+        The pyarrow Dataset, opened from `_metadata` when present.
+
+        Without a summary the directory tree is listed instead (files and
+        directories starting with '_' or '.' are ignored).
+        """
+        if not self.root.exists():
+            raise FileNotFoundError(f"Event dataset not found: {self.root}")
+        if self.summary_path.exists():
+            return ds.parquet_dataset(self.summary_path, partitioning=self.partitioning)
+        return self._discovered()
+
+    def files(self, filters: Optional[Filters] = None) -> List[Path]:
+        """
+        Data files whose partitions can match `filters`.
+
+        Args:
+            filters: pyarrow DNF filters or a compute Expression
+
+        Returns:
+            List of file paths
+        """
+        expression = _filter_expression(filters)
+        fragments = self.dataset().get_fragments(filter=expression) if expression is not None \
+            else self.dataset().get_fragments()
+        return [Path(f.path) for f in fragments]
+
+    def read(
+        self,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None
+    ) -> pd.DataFrame:
+        """
+        Read selected columns of the events matching `filters`.
+
+        Filters on partition keys skip whole directories; filters on other
+        columns use row-group statistics, then are applied per row. Filter
+        columns need not be in `columns`.
+
+        Args:
+            columns: Columns to return, partition keys included (default: all)
+            filters: pyarrow DNF filters, e.g.
+                     [('biological_sample_id', '==', 'P5_F10'),
+                      ('acquisition_date', '>=', '2025-11-01')],
+                     or a pyarrow.compute Expression
+
+        Returns:
+            DataFrame of matching events
+        """
+        dataset = self.dataset()
+        if columns is not None:
+            missing = [c for c in columns if c not in dataset.schema.names]
+            if missing:
+                raise KeyError(f"Columns not found in event dataset {self.root.name}: {missing}")
+        table = dataset.to_table(columns=columns, filter=_filter_expression(filters))
+        return table.to_pandas()
+
+    def partitions(self) -> pd.DataFrame:
+        """
+        One row per partition with its file and row counts, from `_metadata`
+        (or file footers) only.
+
+        Returns:
+            DataFrame with the partition columns, n_files and n_rows
+        """
+        rows = []
+        for fragment in self.dataset().get_fragments():
+            keys = ds.get_partition_keys(fragment.partition_expression)
+            rows.append({**{c: keys.get(c) for c in self.partition_cols},
+                         'n_rows': fragment.metadata.num_rows})
+        if not rows:
+            return pd.DataFrame(columns=self.partition_cols + ['n_files', 'n_rows'])
+        df = pd.DataFrame(rows)
+        return (
+            df.groupby(self.partition_cols, dropna=False)
+            .agg(n_files=('n_rows', 'size'), n_rows=('n_rows', 'sum'))
+            .reset_index()
+        )
@@ -4,14 +4,19 @@ Supports FCS 2.0, 3.0, and 3.1 formats with memory-efficient chunked processing.
 """
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Union
 import pandas as pd
 import numpy as np
 import fcsparser
+import pyarrow as pa
 from loguru import logger
 import gc
+import json
 
 from .base_parser import BaseParser
+from .fcs_reader import FCSReader, UnsupportedFCSFormat
+from .parquet_writer import FILE_METADATA_KEY, ParquetWriter, constant_array, constant_column
+from .streaming_stats import StreamingStatistics, DEFAULT_EXACT_LIMIT, STREAMING_EXACT_LIMIT
 
 
 class FCSParser(BaseParser):
@@ -33,6 +38,15 @@ class FCSParser(BaseParser):
         ['FSC-H', 'SSC-H'],        # Alternative naming
     ]
     
+    # Bump when parsed output changes (conversion manifests key on it)
+    PARSER_VERSION = '2.0'
+    
+    # Per-file columns attached to every event row by parse() / iter_chunks()
+    METADATA_COLUMNS = [
+        'sample_id', 'biological_sample_id', 'measurement_id', 'is_baseline',
+        'file_name', 'instrument_type', 'parse_timestamp',
+    ]
+    
     def __init__(
         self, 
         file_path: Path, 
@@ -45,7 +59,7 @@ class FCSParser(BaseParser):
         Args:
             file_path: Path to FCS file
             compensate: Whether to apply compensation matrix (if available)
-            chunk_size: Number of events to process at a time
+            chunk_size: Number of events per block yielded by iter_chunks()
         """
         super().__init__(file_path)
         self.compensate = compensate
@@ -55,6 +69,8 @@ class FCSParser(BaseParser):
         self.biological_sample_id: Optional[str] = None
         self.measurement_id: Optional[str] = None
         self.is_baseline: bool = False
+        self.reader: Optional[FCSReader] = None
+        self.parse_timestamp: Optional[pd.Timestamp] = None
         
     def validate(self) -> bool:
         """
@@ -92,10 +108,47 @@ class FCSParser(BaseParser):
             logger.error(f"Validation failed: {e}")
             return False
     
+    def open(self) -> Optional[FCSReader]:
+        """
+        Open the file without materializing any events.
+
+        Memory-maps the DATA segment, reads metadata and channel names and
+        extracts the sample identifiers. Safe to call repeatedly.
+
+        Returns:
+            The FCSReader, or None if the DATA layout can only be read by
+            fcsparser (parse() / iter_chunks() then fall back to it)
+        """
+        if self.reader is None:
+            try:
+                self.reader = FCSReader(self.file_path)
+            except UnsupportedFCSFormat as e:
+                logger.warning(f"Native FCS reader unavailable ({e}) - falling back to fcsparser")
+                return None
+            self.metadata = self.reader.metadata
+            self.channel_names = list(self.reader.channel_names)
+            self.parse_timestamp = pd.Timestamp.now()
+            self._extract_identifiers()
+        return self.reader
+    
+    @property
+    def n_events(self) -> int:
+        """Number of events in the file (without materializing them)."""
+        if self.data is not None:
+            return len(self.data)
+        reader = self.open()
+        if reader is None:
+            return len(self.parse())
+        return reader.n_events
+    
     def parse(self) -> pd.DataFrame:
         """
         Parse FCS file and return event data as DataFrame.
-        Uses memory-efficient chunked processing for large files.
+
+        The DATA segment is memory-mapped by FCSReader (kept as self.reader
+        for zero-copy channel access); only the DataFrame returned here is
+        materialized. Layouts the native reader cannot map fall back to
+        fcsparser. Use iter_chunks() to process large files in bounded memory.
         
         Returns:
             DataFrame with all events and metadata columns
@@ -103,34 +156,25 @@ class FCSParser(BaseParser):
         try:
             logger.info(f"Parsing FCS file: {self.file_path.name}")
             
-            # Parse FCS file using fcsparser
-            meta, data = fcsparser.parse(
-                str(self.file_path),
-                meta_data_only=False,
-                reformat_meta=True
-            )
-            
-            self.metadata = meta
-            self.data = data
-            
-            # Extract identifiers from filename
-            self._extract_identifiers()
+            reader = self.open()
+            if reader is not None:
+                data = reader.to_dataframe(dtype='float32')
+            else:
+                meta, data = fcsparser.parse(
+                    str(self.file_path),
+                    meta_data_only=False,
+                    reformat_meta=True
+                )
+                self.metadata = meta
+                self.parse_timestamp = pd.Timestamp.now()
+                self._extract_identifiers()
             
             # Get channel names
             self.channel_names = list(data.columns)
             logger.info(f"Found {len(self.channel_names)} channels: {self.channel_names[:5]}...")
             
             # Add metadata columns
-            # Type assertion: data is guaranteed to be DataFrame at this point
-            data = self.data  # type: pd.DataFrame
-            data['sample_id'] = self.sample_id
-            data['biological_sample_id'] = self.biological_sample_id
-            data['measurement_id'] = self.measurement_id
-            data['is_baseline'] = self.is_baseline
-            data['file_name'] = self.file_path.name
-            data['instrument_type'] = 'flow_cytometry'
-            data['parse_timestamp'] = pd.Timestamp.now()
-            self.data = data
+            self.data = self._add_metadata_columns(data)
             
             # Apply compensation if requested
             if self.compensate and self._has_compensation_matrix():
@@ -153,6 +197,146 @@ class FCSParser(BaseParser):
             logger.error(f"Failed to parse FCS file: {e}")
             raise
     
+    def iter_chunks(
+        self,
+        chunk_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        metadata_columns: bool = True
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream events in fixed-size blocks.
+
+        Each block is read from the memory-mapped DATA segment and gets the
+        metadata columns (sample_id, file_name, ...) attached only when it
+        is yielded, so at most one block is in memory at a time. If parse()
+        has already run, blocks are slices of self.data instead.
+
+        Args:
+            chunk_size: Events per block (default: self.chunk_size)
+            columns: Channels to include (default: all channels)
+            metadata_columns: Attach the per-file METADATA_COLUMNS
+
+        Yields:
+            DataFrame blocks with the same columns as parse(), indexed by
+            global event number
+
+        Example:
+            >>> parser = FCSParser(Path("sample.fcs"), chunk_size=100_000)
+            >>> for chunk in parser.iter_chunks():
+            ...     process(chunk)
+        """
+        chunk_size = int(self.chunk_size if chunk_size is None else chunk_size)
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        if self.data is not None or self.open() is None:
+            data = self.data if self.data is not None else self.parse()
+            for start in range(0, len(data), chunk_size):
+                block = data.iloc[start:start + chunk_size]
+                if columns is not None or not metadata_columns:
+                    keep = list(columns) if columns is not None else list(self.channel_names)
+                    block = block[keep + (self.METADATA_COLUMNS if metadata_columns else [])]
+                yield block
+            return
+
+        reader = self.reader
+        assert reader is not None
+        for start in range(0, reader.n_events, chunk_size):
+            stop = min(start + chunk_size, reader.n_events)
+            block = reader.to_dataframe(columns, start=start, stop=stop, dtype='float32')
+            block.index = pd.RangeIndex(start, stop)
+            yield self._add_metadata_columns(block) if metadata_columns else block
+    
+    def iter_batches(
+        self,
+        chunk_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        metadata_columns: bool = True
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Stream events as Arrow RecordBatches.
+
+        Batches are built straight from the memory-mapped DATA segment
+        (one copy per channel, no DataFrame in between); the per-file
+        METADATA_COLUMNS are one-entry dictionary arrays. After parse(), or
+        for layouts only fcsparser can read, iter_chunks() blocks are
+        converted instead.
+
+        Args:
+            chunk_size: Events per batch (default: self.chunk_size)
+            columns: Channels to include (default: all channels)
+            metadata_columns: Attach the per-file METADATA_COLUMNS
+
+        Yields:
+            RecordBatches with the same columns as iter_chunks()
+
+        Example:
+            >>> parser = FCSParser(Path("sample.fcs"))
+            >>> ParquetWriter.write_batches(parser.iter_batches(), Path("sample.parquet"))
+        """
+        chunk_size = int(self.chunk_size if chunk_size is None else chunk_size)
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        if self.data is not None or self.open() is None:
+            for block in self.iter_chunks(chunk_size, columns, metadata_columns):
+                yield pa.RecordBatch.from_pandas(block, preserve_index=False)
+            return
+
+        reader = self.reader
+        assert reader is not None
+        for start in range(0, reader.n_events, chunk_size):
+            yield self._record_batch(start, min(start + chunk_size, reader.n_events), columns, metadata_columns)
+
+    def _record_batch(
+        self,
+        start: int,
+        stop: int,
+        columns: Optional[List[str]],
+        metadata_columns: bool
+    ) -> pa.RecordBatch:
+        """Events [start, stop) from the memory map as a float32 RecordBatch."""
+        assert self.reader is not None
+        batch = self.reader.to_record_batch(columns, start=start, stop=stop, dtype='float32')
+        if metadata_columns:
+            for name, value in self.file_metadata().items():
+                batch = batch.append_column(name, constant_array(value, batch.num_rows))
+        return batch
+    
+    def file_metadata(self) -> Dict[str, Any]:
+        """Per-file values of METADATA_COLUMNS (the same for every event)."""
+        return {
+            'sample_id': self.sample_id,
+            'biological_sample_id': self.biological_sample_id,
+            'measurement_id': self.measurement_id,
+            'is_baseline': self.is_baseline,
+            'file_name': self.file_path.name,
+            'instrument_type': 'flow_cytometry',
+            'parse_timestamp': self.parse_timestamp,
+        }
+    
+    def _add_metadata_columns(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Attach per-file identifier columns (see METADATA_COLUMNS) to event rows.
+        
+        String values are single-category Categoricals (1 byte per row instead
+        of a string per row) and are written to Parquet dictionary-encoded;
+        parse_timestamp stays datetime64.
+        """
+        for name, value in self.file_metadata().items():
+            data[name] = constant_column(value, len(data))
+        return data
+    
+    def _schema_metadata(self, metadata: Optional[Dict[str, Any]] = None) -> Dict[bytes, bytes]:
+        """Parquet key-value metadata, plus the per-file values as JSON."""
+        schema_metadata = super()._schema_metadata(metadata)
+        file_metadata = {
+            name: value.isoformat() if isinstance(value, pd.Timestamp) else value
+            for name, value in self.file_metadata().items()
+        }
+        schema_metadata[FILE_METADATA_KEY.encode()] = json.dumps(file_metadata).encode()
+        return schema_metadata
+    
     def _extract_identifiers(self) -> None:
         """
         Extract sample identifiers from filename.
@@ -244,11 +428,17 @@ class FCSParser(BaseParser):
         """
         Extract relevant metadata from FCS file.
         
+        Does not need parse(): if nothing has been loaded yet, only the
+        HEADER and TEXT segments are read.
+        
         Returns:
             Dictionary of metadata
         """
         if not self.metadata:
-            raise ValueError("No metadata available. Call parse() first.")
+            reader = FCSReader(self.file_path, read_data=False)
+            self.metadata = reader.metadata
+            self.channel_names = list(reader.channel_names)
+            self._extract_identifiers()
         
         # Extract key metadata fields
         extracted = {
@@ -306,62 +496,61 @@ class FCSParser(BaseParser):
         logger.warning("Compensation not yet fully implemented")
         return data
     
-    def get_statistics(self) -> Dict[str, Any]:
+    def streaming_statistics(self, exact_limit: Optional[int] = None) -> StreamingStatistics:
+        """
+        Accumulate channel statistics in one pass over the events.
+
+        Uses self.data after parse(); otherwise streams iter_chunks(), so
+        the file is never fully in memory. The result can be merged with
+        partial results from other files or workers before calling
+        to_dict().
+
+        Args:
+            exact_limit: Events per channel up to which statistics are
+                         exact; larger files use a bounded-memory sketch.
+                         Defaults to DEFAULT_EXACT_LIMIT after parse() and
+                         to the smaller STREAMING_EXACT_LIMIT when streaming
+
+        Returns:
+            StreamingStatistics over the numeric channels
+        """
+        if self.data is None and self.reader is None:
+            raise ValueError("No data available. Call parse() or open() first.")
+        
+        if self.data is not None:
+            numeric_cols = self.data.select_dtypes(include=[np.number]).columns
+            channels = [col for col in numeric_cols if col in self.channel_names]
+            chunks: Iterable[pd.DataFrame] = [self.data]
+            default_limit = DEFAULT_EXACT_LIMIT
+        else:
+            channels = list(self.channel_names)
+            chunks = self.iter_chunks(columns=channels)
+            default_limit = STREAMING_EXACT_LIMIT
+        
+        limit = default_limit if exact_limit is None else exact_limit
+        return StreamingStatistics.from_chunks(chunks, channels, limit)
+    
+    def get_statistics(self, exact_limit: Optional[int] = None) -> Dict[str, Any]:
         """
         Calculate comprehensive statistics for each channel.
         Pre-calculates stats to avoid loading raw events for every analysis.
         
+        All statistics come from a single scan (see streaming_statistics())
+        and are exact for files of up to 1M events after parse(), or 100k
+        events after open(); beyond that, quantiles, median and IQR come
+        from a rank-error sketch and memory stays bounded.
+        
+        Args:
+            exact_limit: Override the exact-statistics event limit
+        
         Returns:
             Dictionary of channel statistics
         """
-        if self.data is None:
-            raise ValueError("No data available. Call parse() first.")
-        
-        stats = {}
-        numeric_cols = self.data.select_dtypes(include=[np.number]).columns
-        
-        for col in numeric_cols:
-            if col in self.channel_names:
-                series = self.data[col]
-                mean_val = series.mean()
-                std_val = series.std()
-                
-                # Calculate skewness and kurtosis - handle potential complex numbers
-                skew_val = series.skew()
-                kurt_val = series.kurtosis()
-                
-                # Convert to float, handling complex numbers if they occur
-                if isinstance(skew_val, complex):
-                    skew_float = float(skew_val.real)
-                else:
-                    skew_float = float(skew_val)
-                
-                if isinstance(kurt_val, complex):
-                    kurt_float = float(kurt_val.real)
-                else:
-                    kurt_float = float(kurt_val)
-                
-                stats[col] = {
-                    'mean': float(mean_val),
-                    'median': float(series.median()),
-                    'std': float(std_val),
-                    'min': float(series.min()),
-                    'max': float(series.max()),
-                    'q10': float(series.quantile(0.10)),
-                    'q25': float(series.quantile(0.25)),
-                    'q50': float(series.quantile(0.50)),
-                    'q75': float(series.quantile(0.75)),
-                    'q90': float(series.quantile(0.90)),
-                    'q95': float(series.quantile(0.95)),
-                    'cv': float(std_val / mean_val) if mean_val != 0 else 0,
-                    'iqr': float(series.quantile(0.75) - series.quantile(0.25)),
-                    'skewness': skew_float,
-                    'kurtosis': kurt_float,
-                }
+        stats: Dict[str, Any] = self.streaming_statistics(exact_limit).to_dict()
         
         # Add overall statistics
         stats['_summary'] = {
-            'total_events': len(self.data),
+            'total_events': self.n_events,
             'sample_id': self.sample_id,
             'biological_sample_id': self.biological_sample_id,
             'measurement_id': self.measurement_id,
@@ -376,11 +565,14 @@ class FCSParser(BaseParser):
         """
         Perform quality validation checks on parsed data.
         
+        Works after parse(), or after open() by streaming iter_chunks()
+        (counts, minima/maxima and NaNs are accumulated block by block).
+        
         Returns:
             Dictionary with QC results
         """
-        if self.data is None:
-            raise ValueError("No data available. Call parse() first.")
+        if self.data is None and self.reader is None:
+            raise ValueError("No data available. Call parse() or open() first.")
         
         qc_results = {
             'passed': True,
@@ -388,8 +580,30 @@ class FCSParser(BaseParser):
             'errors': [],
         }
         
+        chunks = [self.data] if self.data is not None else self.iter_chunks()
+        columns: List[str] = []
+        event_count = 0
+        nan_count = 0
+        neg_counts: Dict[str, int] = {}
+        max_vals: Dict[str, float] = {}
+        
+        for chunk in chunks:
+            if not columns:
+                columns = list(chunk.columns)
+                # FSC/SSC area channels checked for negative values
+                neg_counts = {
+                    col: 0 for col in columns
+                    if ('FSC' in col or 'SSC' in col) and '-A' in col
+                }
+            event_count += len(chunk)
+            for col in neg_counts:
+                neg_counts[col] += int((chunk[col] < 0).sum())
+            nan_count += int(chunk.isnull().sum().sum())
+            for col in self.channel_names:
+                if col in chunk.columns and len(chunk):
+                    max_vals[col] = max(max_vals.get(col, -np.inf), float(chunk[col].max()))
+        
         # Check 1: Minimum event count
-        event_count = len(self.data)
         if event_count < 1000:
             qc_results['passed'] = False
             qc_results['errors'].append(
@@ -399,7 +613,7 @@ class FCSParser(BaseParser):
         # Check 2: Required channels present (check all naming conventions)
         channels_found = False
         for channel_set in self.REQUIRED_CHANNELS:
-            if all(ch in self.data.columns for ch in channel_set):
+            if all(ch in columns or ch in self.channel_names for ch in channel_set):
                 channels_found = True
                 qc_results['detected_channels'] = channel_set
                 break
@@ -411,39 +625,78 @@ class FCSParser(BaseParser):
             )
         
         # Check 3: Check for negative FSC/SSC values (should be rare)
-        fsc_cols = [col for col in self.data.columns if 'FSC' in col and '-A' in col]
-        ssc_cols = [col for col in self.data.columns if 'SSC' in col and '-A' in col]
-        
-        for col in fsc_cols + ssc_cols:
-            neg_count = (self.data[col] < 0).sum()
-            if neg_count > len(self.data) * 0.01:  # More than 1% negative
+        for col, neg_count in neg_counts.items():
+            if neg_count > event_count * 0.01:  # More than 1% negative
                 qc_results['warnings'].append(
-                    f"High negative {col} values: {neg_count} events ({neg_count/len(self.data)*100:.1f}%)"
+                    f"High negative {col} values: {neg_count} events ({neg_count/event_count*100:.1f}%)"
                 )
         
         # Check 4: Data completeness (no NaN)
-        nan_count = self.data.isnull().sum().sum()
         if nan_count > 0:
             qc_results['warnings'].append(
                 f"Missing values detected: {nan_count} NaN entries"
             )
         
         # Check 5: Extreme outliers (beyond typical flow cytometry range)
-        for col in self.channel_names:
-            if col in self.data.columns:
-                max_val = self.data[col].max()
-                # Typical max for flow cytometry is 2^18 (262144) or 2^20 (1048576)
-                if max_val > 1048576:
-                    qc_results['warnings'].append(
-                        f"Unusually high values in {col}: max={max_val:.0f}"
-                    )
+        for col, max_val in max_vals.items():
+            # Typical max for flow cytometry is 2^18 (262144) or 2^20 (1048576)
+            if max_val > 1048576:
+                qc_results['warnings'].append(
+                    f"Unusually high values in {col}: max={max_val:.0f}"
+                )
         
         # Check 6: Event count consistency
         expected_events = int(self.metadata.get('$TOT', 0))
-        actual_events = len(self.data)
+        actual_events = event_count
         if expected_events > 0 and abs(expected_events - actual_events) > 10:
             qc_results['warnings'].append(
                 f"Event count mismatch: expected {expected_events}, got {actual_events}"
             )
         
         return qc_results
+    
+    def to_parquet(
+        self,
+        output_path: Path,
+        compression: str = 'snappy',
+        metadata: Optional[Dict[str, Any]] = None,
+        metadata_columns: bool = True
+    ) -> None:
+        """
+        Convert events to Parquet with embedded metadata.
+        
+        After parse() this writes self.data in one go (BaseParser.to_parquet).
+        Otherwise iter_batches() is streamed through ParquetWriter.write_batches,
+        one row group per block: Arrow buffers are filled directly from the
+        memory map and the file is never fully in memory.
+        
+        The per-file values (sample_id, file_name, ...) are always stored
+        once in the key-value metadata under FILE_METADATA_KEY.
+        
+        Args:
+            output_path: Path for output Parquet file
+            compression: Compression codec (snappy, gzip, zstd, none)
+            metadata: Additional metadata to embed in Parquet file
+            metadata_columns: Also write METADATA_COLUMNS as (dictionary-
+                              encoded) columns. With False only channels are
+                              stored; ParquetWriter.read_with_metadata()
+                              reattaches the per-file values on read.
+        """
+        exclude = None if metadata_columns else self.METADATA_COLUMNS
+        if self.data is not None:
+            super().to_parquet(output_path, compression=compression, metadata=metadata, exclude_columns=exclude)
+            return
+        if self.open() is None:
+            self.parse()
+            super().to_parquet(output_path, compression=compression, metadata=metadata, exclude_columns=exclude)
+            return
+        
+        # Schema from an empty batch, so files without events get all columns
+        schema = self._record_batch(0, 0, None, metadata_columns).schema
+        ParquetWriter.write_batches(
+            self.iter_batches(metadata_columns=metadata_columns),
+            Path(output_path),
+            schema=schema,
+            metadata=self._schema_metadata(metadata),
+            compression=compression
+        )
@@ -1,10 +1,18 @@
 ﻿"""
 NTA Parser for ZetaView Nanoparticle Tracking Analysis Files
 Supports size distribution, zeta potential, and 11-position uniformity measurements
+
+Data sections are located with one scan over the lines and handed to
+pandas' C CSV reader as a block; header keywords are matched against a
+pattern set compiled once per process. parse_nta_files() parses many
+exports on a thread pool.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Iterable, Optional, List, Sequence, Tuple, Union
+import io
+import os
 import pandas as pd
 import numpy as np
 import re
@@ -24,6 +32,45 @@ class NTAParser(BaseParser):
         '11pos': r'_11pos',    # 11-position uniformity measurements
     }
     
+    # Header keyword patterns, compiled once and shared by all parsers/threads
+    METADATA_PATTERNS: List[Tuple[re.Pattern, str]] = [
+        (re.compile(pattern, re.IGNORECASE), key) for pattern, key in [
+            (r'Original File:\s*(.+)', 'original_file'),
+            (r'Operator:\s*(.+)', 'operator'),
+            (r'Experiment:\s*(\S+)', 'experiment'),
+            (r'ZetaView S/N:\s*(.+)', 'instrument_serial'),
+            (r'Cell S/N:\s*(.+)', 'cell_serial'),
+            (r'Software:\s*ZetaView \(version\s+([^\)]+)\)', 'software_version'),
+            (r'SOP:\s*(.+)', 'sop'),
+            (r'Sample:\s*(.+)', 'sample_name'),
+            (r'Electrolyte:\s*(.+)', 'electrolyte'),
+            (r'pH:\s*([0-9.]+)', 'ph'),
+            (r'Conductivity:\s*([0-9.]+)', 'conductivity'),
+            (r'Temperature:\s*([0-9.]+)', 'temperature'),
+            (r'Viscosity:\s*([0-9.]+)', 'viscosity'),
+            (r'Date:\s*([0-9\-]+)', 'date'),
+            (r'Time:\s*([0-9:]+)', 'time'),
+            (r'Scattering Intensity:\s*([0-9.]+)', 'scattering_intensity'),
+            (r'Detected Particles:\s*([0-9]+)', 'detected_particles'),
+            (r'Cell Check Result:\s*(.+)', 'cell_check_result'),
+            (r'Type of Measurement:\s*(.+)', 'measurement_type'),
+            (r'Positions:\s*([0-9]+)', 'num_positions'),
+            (r'Number of Traces:\s*([0-9]+)', 'num_traces'),
+            (r'Average Number of Particles:\s*([0-9.]+)', 'avg_particles'),
+            (r'Dilution::\s*([0-9.]+)', 'dilution'),
+            (r'Concentration Correction Factor:\s*([0-9.]+)', 'conc_correction'),
+            (r'Minimum Brightness:\s*([0-9]+)', 'min_brightness'),
+            (r'Minimum Area:\s*([0-9]+)', 'min_area'),
+            (r'Maximum Area:\s*([0-9]+)', 'max_area'),
+            (r'Sensitivity:\s*([0-9.]+)', 'sensitivity'),
+            (r'Shutter:\s*([0-9.]+)', 'shutter'),
+            (r'Laser Wavelength nm:\s*([0-9.]+)', 'laser_wavelength'),
+        ]
+    ]
+    
+    # Sample ID from filename: YYYYMMDD_####_<sample>_size|_prof|_11pos
+    SAMPLE_ID_PATTERN = re.compile(r'^\d{8}_\d{4}_(.+?)(?:_size|_prof|_11pos)')
+    
     def __init__(self, file_path: Path | str):
         """
         Initialize NTA parser.
@@ -151,44 +198,13 @@ class NTAParser(BaseParser):
         """
         metadata = {}
         
-        # Metadata patterns
-        patterns = [
-            (r'Original File:\s*(.+)', 'original_file'),
-            (r'Operator:\s*(.+)', 'operator'),
-            (r'Experiment:\s*(\S+)', 'experiment'),
-            (r'ZetaView S/N:\s*(.+)', 'instrument_serial'),
-            (r'Cell S/N:\s*(.+)', 'cell_serial'),
-            (r'Software:\s*ZetaView \(version\s+([^\)]+)\)', 'software_version'),
-            (r'SOP:\s*(.+)', 'sop'),
-            (r'Sample:\s*(.+)', 'sample_name'),
-            (r'Electrolyte:\s*(.+)', 'electrolyte'),
-            (r'pH:\s*([0-9.]+)', 'ph'),
-            (r'Conductivity:\s*([0-9.]+)', 'conductivity'),
-            (r'Temperature:\s*([0-9.]+)', 'temperature'),
-            (r'Viscosity:\s*([0-9.]+)', 'viscosity'),
-            (r'Date:\s*([0-9\-]+)', 'date'),
-            (r'Time:\s*([0-9:]+)', 'time'),
-            (r'Scattering Intensity:\s*([0-9.]+)', 'scattering_intensity'),
-            (r'Detected Particles:\s*([0-9]+)', 'detected_particles'),
-            (r'Cell Check Result:\s*(.+)', 'cell_check_result'),
-            (r'Type of Measurement:\s*(.+)', 'measurement_type'),
-            (r'Positions:\s*([0-9]+)', 'num_positions'),
-            (r'Number of Traces:\s*([0-9]+)', 'num_traces'),
-            (r'Average Number of Particles:\s*([0-9.]+)', 'avg_particles'),
-            (r'Dilution::\s*([0-9.]+)', 'dilution'),
-            (r'Concentration Correction Factor:\s*([0-9.]+)', 'conc_correction'),
-            (r'Minimum Brightness:\s*([0-9]+)', 'min_brightness'),
-            (r'Minimum Area:\s*([0-9]+)', 'min_area'),
-            (r'Maximum Area:\s*([0-9]+)', 'max_area'),
-            (r'Sensitivity:\s*([0-9.]+)', 'sensitivity'),
-            (r'Shutter:\s*([0-9.]+)', 'shutter'),
-            (r'Laser Wavelength nm:\s*([0-9.]+)', 'laser_wavelength'),
-        ]
-        
-        # Extract metadata from first 200 lines
+        # Extract metadata from first 200 lines (every pattern needs a ':');
+        # a later match overrides an earlier one
         for line in lines[:200]:
-            for pattern, key in patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
+            if ':' not in line:
+                continue
+            for pattern, key in self.METADATA_PATTERNS:
+                match = pattern.search(line)
                 if match:
                     metadata[key] = match.group(1).strip()
         
@@ -210,8 +226,7 @@ class NTAParser(BaseParser):
         filename = self.file_path.stem
         
         # Remove date prefix (YYYYMMDD_####_)
-        pattern = r'^\d{8}_\d{4}_(.+?)(?:_size|_prof|_11pos)'
-        match = re.search(pattern, filename)
+        match = self.SAMPLE_ID_PATTERN.search(filename)
         if match:
             return match.group(1)
         
@@ -236,10 +251,60 @@ class NTAParser(BaseParser):
                 except (ValueError, TypeError):
                     pass
     
+    @staticmethod
+    def _read_section(
+        lines: List[str],
+        header_idx: int,
+        end_idx: int,
+        sep: str,
+        text_columns: Sequence[str] = ()
+    ) -> pd.DataFrame:
+        """
+        Read a delimited data block with pandas' C parser.
+        
+        Column names come from lines[header_idx] (stripped, empty names
+        dropped); rows are lines[header_idx + 1:end_idx]. Blank rows are
+        skipped and short rows padded with NaN.
+        
+        Args:
+            lines: File content split by newlines
+            header_idx: Index of the column header line
+            end_idx: Index one past the last data row
+            sep: Field delimiter ('\t' or a regex such as r'\s{2,}')
+            text_columns: Columns kept as strings; all others are numeric
+                          (unparseable values become NaN)
+            
+        Returns:
+            DataFrame of the section
+        """
+        headers = [h.strip() for h in re.split(sep, lines[header_idx]) if h.strip()]
+        block = '\n'.join(line.strip(' \r') for line in lines[header_idx + 1:end_idx])
+        if not headers or not block.strip():
+            return pd.DataFrame()
+        
+        # Single-character delimiters use the C engine; regexes need 'python'
+        options = {'engine': 'c', 'float_precision': 'round_trip'} if len(sep) == 1 else {'engine': 'python'}
+        df = pd.read_csv(
+            io.StringIO(block),
+            sep=sep,
+            header=None,
+            names=headers,
+            index_col=False,
+            dtype={c: str for c in text_columns if c in headers},
+            **options,
+        )
+        for col in df.columns:
+            if col not in text_columns and not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+        return df
+    
     def _parse_size_distribution(self, lines: List[str]) -> pd.DataFrame:
         """
         Parse size distribution data section.
         
+        The section runs from the header after "Size Distribution" to the
+        first blank, '---' or negative-size ('-1.') line.
+        
         Args:
             lines: File content split by newlines
             
@@ -259,58 +324,33 @@ class NTAParser(BaseParser):
             logger.warning("Could not find 'Size Distribution' section")
             return pd.DataFrame()
         
-        # Get header line
-        header_line = lines[data_start_idx]
-        
         # Detect delimiter
-        if '\t' in header_line:
-            delimiter = '\t'
-        else:
-            delimiter = r'\s{2,}'  # Multiple spaces
-        
-        # Parse headers
-        headers = [h.strip() for h in re.split(delimiter, header_line) if h.strip()]
+        delimiter = '\t' if '\t' in lines[data_start_idx] else r'\s{2,}'  # Tabs or multiple spaces
         
-        # Parse data rows
-        data_rows = []
+        # Locate the end of the section, dropping comment lines
+        section = lines[:data_start_idx + 1]
         for line in lines[data_start_idx + 1:]:
-            line = line.strip()
-            
-            # Stop at end markers or negative size
-            if not line or line.startswith('---') or line.startswith('-1.'):
+            stripped = line.strip()
+            if not stripped or stripped.startswith('---') or stripped.startswith('-1.'):
                 break
-            
-            # Skip comment lines
-            if line.startswith('#'):
-                continue
-            
-            # Split by delimiter
-            values = [v.strip() for v in re.split(delimiter, line) if v.strip()]
-            
-            # Check if we have the right number of values
-            if len(values) == len(headers):
-                data_rows.append(values)
+            if not stripped.startswith('#'):
+                section.append(line)
         
-        if not data_rows:
+        df = self._read_section(section, data_start_idx, len(section), delimiter)
+        if df.empty:
             logger.warning("No size distribution data found")
-            return pd.DataFrame()
-        
-        # Create DataFrame
-        df = pd.DataFrame(data_rows, columns=headers)  # type: ignore[call-overload]
-        
-        # Convert to numeric
-        for col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+            return df
         
         # Standardize column names
-        df = self._standardize_column_names(df, data_type='size')
-        
-        return df
+        return self._standardize_column_names(df, data_type='size')
     
     def _parse_profile_data(self, lines: List[str]) -> pd.DataFrame:
         """
         Parse zeta potential profile data section.
         
+        The section runs from the header after "ZP Profile:" to the first
+        '---' or short (< 5 character) line; blank lines are skipped.
+        
         Args:
             lines: File content split by newlines
             
@@ -329,56 +369,32 @@ class NTAParser(BaseParser):
             logger.warning("Could not find 'ZP Profile' section")
             return pd.DataFrame()
         
-        # Get header line
-        header_line = lines[data_start_idx]
-        
-        # Use tab delimiter for profile data
-        headers = [h.strip() for h in header_line.split('\t') if h.strip()]
-        
-        # Parse data rows
-        data_rows = []
-        for line in lines[data_start_idx + 1:]:
-            # Skip empty lines
-            if not line or not line.strip():
-                continue
-            
-            # Stop at next section or end
-            if line.strip().startswith('---') or len(line.strip()) < 5:
+        end_idx = len(lines)
+        for i in range(data_start_idx + 1, len(lines)):
+            stripped = lines[i].strip()
+            if stripped and (stripped.startswith('---') or len(stripped) < 5):
+                end_idx = i
                 break
-            
-            # Split by tabs or multiple spaces
-            if '\t' in line:
-                values = [v.strip() for v in line.split('\t') if v.strip()]
-            else:
-                values = [v.strip() for v in re.split(r'\s+', line.strip()) if v.strip()]
-            
-            # Only accept rows with correct number of columns
-            if len(values) >= len(headers) - 1:  # Allow missing last column
-                # Pad with None if needed
-                while len(values) < len(headers):
-                    values.append(None)  # type: ignore[arg-type]
-                data_rows.append(values[:len(headers)])
-        
-        if not data_rows:
-            logger.warning("No profile data found")
-            return pd.DataFrame()
         
-        # Create DataFrame
-        df = pd.DataFrame(data_rows, columns=headers)  # type: ignore[call-overload]
-        
-        # Convert to numeric
-        for col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        # Tab-delimited; whitespace-separated rows are an older export format
+        rows = [line for line in lines[data_start_idx + 1:end_idx] if line.strip()]
+        delimiter = '\t' if not rows or '\t' in rows[0] else r'\s+'
+        df = self._read_section(lines, data_start_idx, end_idx, delimiter)
+        if df.empty:
+            logger.warning("No profile data found")
+            return df
         
         # Standardize column names
-        df = self._standardize_column_names(df, data_type='profile')
-        
-        return df
+        return self._standardize_column_names(df, data_type='profile')
     
     def _parse_11pos_data(self, lines: List[str]) -> pd.DataFrame:
         """
         Parse 11-position uniformity measurement data.
         
+        The tab-separated table ends at the Mean / St.Dev / Rel.St.Dev
+        summary rows. Empty fields are kept, so rows without a 'Use' mark
+        or 'Removal' reason stay aligned with the header.
+        
         Args:
             lines: File content split by newlines
             
@@ -398,50 +414,21 @@ class NTAParser(BaseParser):
             logger.warning("Could not find 11-position data header")
             return pd.DataFrame()
         
-        # Get header line
-        header_line = lines[data_start_idx]
-        
-        # Split headers by tabs - 11pos files use tab delimiter
-        headers = [h.strip() for h in header_line.split('\t') if h.strip()]
-        
-        # Parse data rows
-        data_rows = []
-        for line in lines[data_start_idx + 1:]:
-            # Skip empty lines
-            if not line or not line.strip():
-                continue
-            
-            # Stop at summary rows (Mean, St.Dev, Rel.St.Dev)
-            if any(line.strip().startswith(s) for s in ['Mean', 'St.Dev', 'Rel.St.Dev']):
+        # Stop at summary rows (Mean, St.Dev, Rel.St.Dev)
+        end_idx = len(lines)
+        for i in range(data_start_idx + 1, len(lines)):
+            if lines[i].strip().startswith(('Mean', 'St.Dev', 'Rel.St.Dev')):
+                end_idx = i
                 break
-            
-            # Split by tabs
-            values = [v.strip() for v in line.split('\t') if v.strip()]
-            
-            # Accept rows with correct number of columns (or close to it)
-            if len(values) >= len(headers) - 1:
-                # Pad with None if needed
-                while len(values) < len(headers):
-                    values.append(None)  # type: ignore[arg-type]
-                data_rows.append(values[:len(headers)])
-        
-        if not data_rows:
-            logger.warning("No 11-position data found")
-            return pd.DataFrame()
-        
-        # Create DataFrame
-        df = pd.DataFrame(data_rows, columns=headers)  # type: ignore[call-overload]
         
-        # Convert numeric columns
-        for col in df.columns:
-            if col not in ['Use', 'Removal']:  # Keep these as strings
-                # Try to convert to numeric
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        # 'Use' (X = used) and 'Removal' (reason) stay strings
+        df = self._read_section(lines, data_start_idx, end_idx, '\t', text_columns=['Use', 'Removal'])
+        if df.empty:
+            logger.warning("No 11-position data found")
+            return df
         
         # Standardize column names
-        df = self._standardize_column_names(df, data_type='11pos')
-        
-        return df
+        return self._standardize_column_names(df, data_type='11pos')
     
     def _standardize_column_names(self, df: pd.DataFrame, data_type: str) -> pd.DataFrame:
         """
@@ -505,28 +492,34 @@ class NTAParser(BaseParser):
         return df
     
     def _add_metadata_columns(self) -> None:
-        """Add metadata columns to the parsed data."""
+        """Add metadata columns to the parsed data (one concat, not per-column inserts)."""
         if self.data is None or self.data.empty:
             return
         
-        # Add essential metadata
-        self.data['sample_id'] = self.sample_id
-        self.data['file_name'] = self.file_path.name
-        self.data['instrument_type'] = 'nta'
-        self.data['measurement_type'] = self.measurement_type
-        self.data['parse_timestamp'] = pd.Timestamp.now()
-        
-        # Add measurement parameters as columns
+        # Essential metadata, then measurement parameters
+        columns: Dict[str, Any] = {
+            'sample_id': self.sample_id,
+            'file_name': self.file_path.name,
+            'instrument_type': 'nta',
+            'measurement_type': self.measurement_type,
+            'parse_timestamp': pd.Timestamp.now(),
+        }
         for key, value in self.measurement_params.items():
-            self.data[f'param_{key}'] = value
+            columns[f'param_{key}'] = value
         
         # Add date/time if available
         if 'date' in self.raw_metadata and 'time' in self.raw_metadata:
             try:
                 dt_str = f"{self.raw_metadata['date']} {self.raw_metadata['time']}"
-                self.data['measurement_datetime'] = pd.to_datetime(dt_str)
-            except:
+                columns['measurement_datetime'] = pd.to_datetime(dt_str)
+            except (ValueError, TypeError):
                 pass
+        
+        constants = pd.DataFrame(
+            {name: [value] * len(self.data) for name, value in columns.items()},
+            index=self.data.index,
+        )
+        self.data = pd.concat([self.data.drop(columns=list(columns), errors='ignore'), constants], axis=1)
     
     def extract_metadata(self) -> Dict[str, Any]:
         """
@@ -606,3 +599,63 @@ class NTAParser(BaseParser):
                 stats['std_zeta_potential'] = zp_data.std()
         
         return stats
+
+
+def _parse_or_error(path: Path) -> Dict[str, Any]:
+    """Parse one NTA file, capturing the error instead of raising."""
+    try:
+        parser = NTAParser(path)
+        parser.parse()
+        return {'file_name': path.name, 'file_path': str(path), 'parser': parser, 'error': None}
+    except Exception as e:
+        return {'file_name': path.name, 'file_path': str(path), 'parser': None, 'error': str(e)}
+
+
+def parse_nta_files(
+    paths: Union[str, Path, Iterable[Union[str, Path]]],
+    max_workers: Optional[int] = None,
+    pattern: str = '*.txt'
+) -> List[Dict[str, Any]]:
+    """
+    Parse many NTA text files on a thread pool.
+    
+    All workers share NTAParser's compiled metadata patterns; section
+    tables are read by pandas' C parser, which releases the GIL. Files that
+    fail to parse appear in the result with an 'error' message and no
+    parser.
+    
+    Args:
+        paths: A directory (searched recursively for `pattern`) or an
+               iterable of file paths
+        max_workers: Thread pool size (default: min(32, CPU count + 4))
+        pattern: Glob pattern used when `paths` is a directory
+        
+    Returns:
+        List of dicts with 'file_name', 'file_path', 'parser' (a parsed
+        NTAParser or None) and 'error', in input order (sorted path order
+        for directories)
+        
+    Example:
+        >>> results = parse_nta_files(Path("NTA"))
+        >>> frames = [r['parser'].data for r in results if not r['error']]
+    """
+    if isinstance(paths, (str, Path)) and Path(paths).is_dir():
+        files = sorted(Path(paths).rglob(pattern))
+    elif isinstance(paths, (str, Path)):
+        files = [Path(paths)]
+    else:
+        files = [Path(p) for p in paths]
+    
+    if not files:
+        return []
+    
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=min(workers, len(files))) as executor:
+        results = list(executor.map(_parse_or_error, files))
+    
+    n_failed = sum(1 for r in results if r['error'])
+    logger.info(
+        f"Parsed {len(results) - n_failed}/{len(results)} NTA files"
+        + (f", {n_failed} failed" if n_failed else "")
+    )
+    return results
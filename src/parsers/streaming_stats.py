@@ -0,0 +1,412 @@
+"""
+Single-pass, mergeable channel statistics.
+
+Computes the per-channel statistics of FCSParser.get_statistics() in one
+scan over event chunks and lets partial results from different chunks or
+workers be merged:
+
+- up to `exact_limit` values per channel are simply buffered in their
+  source precision (float32 FCS data stays float32: 4 MB per 1M events),
+  and every statistic is computed exactly from them in float64, matching
+  pandas;
+- beyond that, memory stays bounded: count, mean, variance, skewness and
+  kurtosis come from merged central moments (Welford/Chan updates extended
+  to the 3rd and 4th moment, Pébay 2008), min/max stay exact, and
+  quantiles come from a KLL sketch with bounded *rank* error. Unlike a
+  relative-error sketch, this stays accurate for narrow distributions far
+  from zero (e.g. a bead peak at 1e5 +/- 5).
+
+Quantiles follow pandas' linear interpolation between order statistics.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import math
+
+import numpy as np
+import pandas as pd
+
+
+QUANTILES = (0.10, 0.25, 0.50, 0.75, 0.90, 0.95)
+DEFAULT_EXACT_LIMIT = 1_000_000
+# Used when events are streamed from disk, so memory stays small per channel
+STREAMING_EXACT_LIMIT = 100_000
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded *rank* error (KLL).
+
+    Values are kept in a stack of compactors; an item at level h stands for
+    2^h input values. When the sketch outgrows its capacity, the lowest full
+    level is sorted and every other item is promoted to the next level, so
+    the sketch holds O(k) items however many values it has seen. Each
+    returned order statistic has a rank within a small fraction of n of the
+    true one (roughly 1/k; about 0.3% of n at the default k=400),
+    independently of the values' magnitude or offset.
+
+    Compaction alternates its offset per level instead of drawing it at
+    random, so results are reproducible for the same input.
+
+    Example:
+        >>> sketch = QuantileSketch()
+        >>> for chunk in chunks:
+        ...     sketch.add(chunk)
+        >>> sketch.quantile(0.5)
+    """
+
+    def __init__(self, k: int = 400):
+        """
+        Initialize sketch.
+
+        Args:
+            k: Size of the top compactor; rank error shrinks as ~1/k
+        """
+        if k < 8:
+            raise ValueError(f"k must be at least 8, got {k}")
+        self.k = k
+        self.count = 0
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._offsets: List[int] = [0]
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2.0 / 3.0) ** depth)))
+
+    def _compress(self) -> None:
+        """Compact full levels until the sketch fits its total capacity."""
+        while sum(len(items) for items in self._levels) > sum(
+            self._capacity(h) for h in range(len(self._levels))
+        ):
+            level = next(
+                h for h in range(len(self._levels)) if len(self._levels[h]) >= self._capacity(h)
+            )
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+                self._offsets.append(0)
+
+            items = np.sort(self._levels[level])
+            keep = items[:len(items) % 2]
+            pairs = items[len(keep):]
+            offset = self._offsets[level]
+            self._offsets[level] ^= 1
+            self._levels[level] = keep
+            self._levels[level + 1] = np.concatenate([self._levels[level + 1], pairs[offset::2]])
+
+    def add(self, values: np.ndarray) -> None:
+        """Add finite values (NaN/inf must be filtered by the caller)."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) == 0:
+            return
+        self.count += len(values)
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add another sketch's items (must use the same k)."""
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with different k ({self.k} vs {other.k})")
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+            self._offsets.append(0)
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def _order_statistics(self, ranks: np.ndarray) -> np.ndarray:
+        """Approximate values of the given 0-based order statistics."""
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(len(level_items), 2 ** level, dtype=np.int64)
+            for level, level_items in enumerate(self._levels)
+        ])
+        order = np.argsort(items, kind='stable')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, ranks, side='right')
+        return items[np.minimum(index, len(items) - 1)]
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """
+        Quantiles with pandas' 'linear' interpolation.
+
+        Args:
+            qs: Quantile levels in [0, 1]
+
+        Returns:
+            Array of quantile values (NaN if the sketch is empty)
+        """
+        n = self.count
+        qs = np.asarray(qs, dtype=float)
+        if n == 0:
+            return np.full(len(qs), np.nan)
+        positions = qs * (n - 1)
+        lower = np.floor(positions).astype(np.int64)
+        upper = np.minimum(lower + 1, n - 1)
+        values = self._order_statistics(np.concatenate([lower, upper]))
+        lo, hi = values[:len(qs)], values[len(qs):]
+        return lo + (positions - lower) * (hi - lo)
+
+    def quantile(self, q: float) -> float:
+        return float(self.quantiles([q])[0])
+
+
+class ChannelAccumulator:
+    """
+    One-pass statistics for a single channel.
+
+    Values are buffered (float32 input stays float32, anything else is
+    stored as float64) as long as the channel holds at most `exact_limit`
+    of them, and every statistic is then computed exactly from the buffer -
+    identical however the values were chunked. Beyond that the buffer is
+    folded into streaming central moments and a QuantileSketch, and memory
+    stays bounded.
+
+    Example:
+        >>> acc = ChannelAccumulator()
+        >>> for chunk in parser.iter_chunks():
+        ...     acc.update(chunk['VFSC-H'].to_numpy())
+        >>> acc.to_dict()['median']
+    """
+
+    def __init__(self, exact_limit: int = DEFAULT_EXACT_LIMIT, k: int = 400):
+        """
+        Initialize accumulator.
+
+        Args:
+            exact_limit: Largest value count kept in memory for exact statistics
+            k: Sketch size used once exact_limit is exceeded
+        """
+        self.exact_limit = exact_limit
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = QuantileSketch(k)
+        self._buffer: Optional[List[np.ndarray]] = []
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether all values are still buffered (statistics are exact)."""
+        return self._buffer is not None
+
+    @staticmethod
+    def _moments(x: np.ndarray) -> Tuple[int, float, float, float, float]:
+        """Count, mean and central moment sums M2..M4 of a block."""
+        mean = float(x.mean())
+        d = x - mean
+        d2 = d * d
+        return len(x), mean, float(d2.sum()), float((d2 * d).sum()), float((d2 * d2).sum())
+
+    def _combine(self, n_b: int, mean_b: float, m2_b: float, m3_b: float, m4_b: float) -> None:
+        """Merge the central moments of another partition into this one."""
+        n_a = self.n
+        if n_b == 0:
+            return
+        if n_a == 0:
+            self.n, self.mean, self.m2, self.m3, self.m4 = n_b, mean_b, m2_b, m3_b, m4_b
+            return
+
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        delta_n = delta / n
+        m2_a, m3_a = self.m2, self.m3
+
+        self.m4 = (
+            self.m4 + m4_b
+            + delta * delta_n ** 3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+            + 6 * delta_n ** 2 * (n_a * n_a * m2_b + n_b * n_b * m2_a)
+            + 4 * delta_n * (n_a * m3_b - n_b * m3_a)
+        )
+        self.m3 = (
+            m3_a + m3_b
+            + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+            + 3 * delta_n * (n_a * m2_b - n_b * m2_a)
+        )
+        self.m2 = m2_a + m2_b + delta * delta_n * n_a * n_b
+        self.mean += delta_n * n_b
+        self.n = n
+
+    def _accumulate(self, x: np.ndarray) -> None:
+        """Fold a NaN-free block into the streaming moments and sketch."""
+        if len(x) == 0:
+            return
+        x = x.astype(np.float64, copy=False)
+        self._combine(*self._moments(x))
+        self.min = min(self.min, float(x.min()))
+        self.max = max(self.max, float(x.max()))
+        self.sketch.add(x[np.isfinite(x)])
+
+    def _buffered(self) -> np.ndarray:
+        return np.concatenate(self._buffer) if self._buffer else np.empty(0)
+
+    def _spill(self) -> None:
+        """Leave exact mode: move the buffered values into moments and sketch."""
+        if self._buffer is None:
+            return
+        x = self._buffered()
+        self._buffer = None
+        self.n = 0
+        self._accumulate(x)
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a block of values (NaNs are skipped, like pandas)."""
+        x = np.asarray(values).ravel()
+        if x.dtype != np.float32:
+            x = x.astype(np.float64, copy=False)
+        x = x[~np.isnan(x)]
+        if len(x) == 0:
+            return
+        if self._buffer is not None and self.n + len(x) <= self.exact_limit:
+            self._buffer.append(x)
+            self.n += len(x)
+            return
+        self._spill()
+        self._accumulate(x)
+
+    def merge(self, other: "ChannelAccumulator") -> None:
+        """Fold in another accumulator (e.g. from a different chunk or worker)."""
+        if self._buffer is not None and other._buffer is not None \
+                and self.n + other.n <= self.exact_limit:
+            self._buffer.extend(other._buffer)
+            self.n += other.n
+            return
+        self._spill()
+        if other._buffer is not None:
+            self._accumulate(other._buffered())
+            return
+        self._combine(other.n, other.mean, other.m2, other.m3, other.m4)
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+
+    @staticmethod
+    def _skewness(n: int, mean: float, m2: float, m3: float) -> float:
+        """Bias-corrected sample skewness (pandas Series.skew)."""
+        if n < 3:
+            return float('nan')
+        if m2 <= 1e-14 * max(1.0, mean * mean) * n:
+            return 0.0
+        g1 = math.sqrt(n) * m3 / m2 ** 1.5
+        return g1 * math.sqrt(n * (n - 1)) / (n - 2)
+
+    @staticmethod
+    def _kurtosis(n: int, mean: float, m2: float, m4: float) -> float:
+        """Bias-corrected excess kurtosis (pandas Series.kurtosis)."""
+        if n < 4:
+            return float('nan')
+        if m2 <= 1e-14 * max(1.0, mean * mean) * n:
+            return 0.0
+        g2 = n * m4 / (m2 * m2) - 3.0
+        return ((n + 1) * g2 + 6.0) * (n - 1) / ((n - 2) * (n - 3))
+
+    def to_dict(self) -> Dict[str, float]:
+        """Statistics in the get_statistics() per-channel schema."""
+        if self.n == 0:
+            nan = float('nan')
+            return {key: nan for key in (
+                'mean', 'median', 'std', 'min', 'max', 'q10', 'q25', 'q50', 'q75',
+                'q90', 'q95', 'cv', 'iqr', 'skewness', 'kurtosis'
+            )}
+
+        if self._buffer is not None:
+            # Exact mode: evaluate the whole buffer as one block
+            x = self._buffered().astype(np.float64, copy=False)
+            n, mean, m2, m3, m4 = self._moments(x)
+            minimum, maximum = float(x.min()), float(x.max())
+            q10, q25, q50, q75, q90, q95 = np.quantile(x, QUANTILES, method='linear')
+        else:
+            n, mean, m2, m3, m4 = self.n, self.mean, self.m2, self.m3, self.m4
+            minimum, maximum = self.min, self.max
+            q10, q25, q50, q75, q90, q95 = np.clip(self.sketch.quantiles(QUANTILES), minimum, maximum)
+
+        std = math.sqrt(m2 / (n - 1)) if n > 1 else float('nan')
+        return {
+            'mean': float(mean),
+            'median': float(q50),
+            'std': float(std),
+            'min': float(minimum),
+            'max': float(maximum),
+            'q10': float(q10),
+            'q25': float(q25),
+            'q50': float(q50),
+            'q75': float(q75),
+            'q90': float(q90),
+            'q95': float(q95),
+            'cv': float(std / mean) if mean != 0 else 0,
+            'iqr': float(q75 - q25),
+            'skewness': float(self._skewness(n, mean, m2, m3)),
+            'kurtosis': float(self._kurtosis(n, mean, m2, m4)),
+        }
+
+
+class StreamingStatistics:
+    """
+    One-pass, mergeable statistics for several channels.
+
+    Example:
+        >>> stats = StreamingStatistics(parser.channel_names)
+        >>> for chunk in parser.iter_chunks():
+        ...     stats.update(chunk)
+        >>> stats.to_dict()['VFSC-H']['q90']
+
+        >>> # Across workers: each returns its StreamingStatistics, then
+        >>> total = partials[0]
+        >>> for part in partials[1:]:
+        ...     total.merge(part)
+    """
+
+    def __init__(self, channels: Iterable[str], exact_limit: int = DEFAULT_EXACT_LIMIT, k: int = 400):
+        """
+        Initialize accumulators.
+
+        Args:
+            channels: Channel (column) names to track
+            exact_limit: Per-channel value count kept for exact statistics
+            k: Quantile sketch size used beyond exact_limit
+        """
+        self.channels: List[str] = list(channels)
+        self.exact_limit = exact_limit
+        self.k = k
+        self.accumulators: Dict[str, ChannelAccumulator] = {
+            name: ChannelAccumulator(exact_limit, k) for name in self.channels
+        }
+
+    @property
+    def n_events(self) -> int:
+        """Rows seen (the largest per-channel count, since NaNs are skipped)."""
+        return max((acc.n for acc in self.accumulators.values()), default=0)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Add a block of events; tracked channels missing from it are skipped."""
+        for name, acc in self.accumulators.items():
+            if name in chunk.columns:
+                acc.update(chunk[name].to_numpy())
+
+    def merge(self, other: "StreamingStatistics") -> None:
+        """Fold in another partial result (channels are unioned)."""
+        for name, acc in other.accumulators.items():
+            if name not in self.accumulators:
+                self.channels.append(name)
+                self.accumulators[name] = ChannelAccumulator(self.exact_limit, self.k)
+            self.accumulators[name].merge(acc)
+
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: Iterable[pd.DataFrame],
+        channels: Iterable[str],
+        exact_limit: int = DEFAULT_EXACT_LIMIT,
+        k: int = 400
+    ) -> "StreamingStatistics":
+        """Accumulate statistics over a chunk stream (e.g. FCSParser.iter_chunks())."""
+        stats = cls(channels, exact_limit, k)
+        for chunk in chunks:
+            stats.update(chunk)
+        return stats
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Per-channel statistics in the get_statistics() schema."""
+        return {name: self.accumulators[name].to_dict() for name in self.channels}
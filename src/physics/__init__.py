@@ -0,0 +1,33 @@
+"""
+Physics Layer
+=============
+
+Purpose: Convert flow cytometry light scatter to physical particle sizes
+
+Components:
+- mie_scatter.py: Mie theory calculator, lookup-table inversion, FCMPASS calibration
+- mie_cache.py: Content-addressed on-disk cache of Mie lookup tables
+- parallel.py: Multi-process chunked executor for exact batch Mie calculations
+- detector_scatter.py: FSC/SSC integrated over detector collection angles
+- ratio_index.py: Sorted O(log n) index mapping FSC/SSC ratios to diameters
+- calibration_store.py: Per-instrument, per-date FCMPASS calibration artifacts
+- benchmark.py: Throughput/memory benchmark harness with regression history
+"""
+
+from .mie_scatter import (
+    MieScatterResult,
+    MieScatterCalculator,
+    MieLookupTable,
+    FCMPASSCalibrator,
+)
+from .mie_cache import MieTableCache
+from .parallel import MieBatchExecutor
+from .detector_scatter import DetectorGeometry, DetectorScatterModel
+from .ratio_index import RatioSizingIndex
+from .calibration_store import CalibrationStore
+
+__all__ = [
+    'MieScatterResult', 'MieScatterCalculator', 'MieLookupTable', 'FCMPASSCalibrator',
+    'MieTableCache', 'MieBatchExecutor', 'DetectorGeometry', 'DetectorScatterModel',
+    'RatioSizingIndex', 'CalibrationStore',
+]
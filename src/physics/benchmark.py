@@ -0,0 +1,362 @@
+"""
+Physics Benchmark Harness
+=========================
+
+Purpose: Track the speed and memory of the sizing hot paths across code and
+         library upgrades, and fail loudly when they regress.
+
+Each benchmark case runs on synthetic event arrays (1e3-1e6 events) and
+records best-of-N wall time, throughput (events/s) and peak traced memory.
+Runs are appended to a JSON history together with the environment
+(Python, NumPy, miepython versions, host); BenchmarkHistory.compare() checks a run
+against the median of recent runs on the same host.
+
+Cases:
+- calculate_scattering_efficiency: exact per-particle Mie (scalar API)
+- diameter_from_scatter: per-particle Brent inversion (scalar API)
+- batch_calculate: exact serial batch forward model
+- diameter_from_scatter_batch: lookup-table inversion
+- predict_batch: FCMPASS calibration + lookup-table inversion
+
+Per-particle cases are capped (max_events) so a full run stays in minutes.
+
+Author: CRMIT Backend Team
+"""
+
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any
+import json
+import platform
+import socket
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+import miepython
+from loguru import logger
+
+from .mie_scatter import MieScatterCalculator, FCMPASSCalibrator
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    One benchmarked operation.
+
+    Attributes:
+        name: Case identifier (stable across runs - used as history key)
+        setup: Called once with n; returns the argument passed to run
+                (excluded from timing)
+        run: The timed operation
+        max_events: Largest array size this case is run at
+    """
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+    max_events: int = DEFAULT_SIZES[-1]
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and memory for one case at one array size."""
+    case: str
+    n_events: int
+    seconds: float
+    events_per_sec: float
+    peak_memory_mb: float
+    repeats: int
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than the allowed threshold."""
+    case: str
+    n_events: int
+    metric: str
+    baseline: float
+    current: float
+    change_pct: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.case} @ {self.n_events:,}: {self.metric} {self.current:,.3g} "
+            f"vs baseline {self.baseline:,.3g} ({self.change_pct:+.1f}%)"
+        )
+
+
+@dataclass
+class BenchmarkRun:
+    """All results of one harness invocation plus its environment."""
+    timestamp: str
+    environment: Dict[str, Any]
+    results: List[BenchmarkResult] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "environment": self.environment,
+            "results": [asdict(r) for r in self.results],
+        }
+
+
+def environment_info() -> Dict[str, Any]:
+    """Versions and host details stored with every run."""
+    return {
+        "host": socket.gethostname(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "miepython": getattr(miepython, '__version__', 'unknown'),
+    }
+
+
+def default_cases(
+    wavelength_nm: float = 488.0,
+    n_particle: float = 1.40,
+    n_medium: float = 1.33,
+    seed: int = 0
+) -> List[BenchmarkCase]:
+    """
+    Benchmark cases for the sizing hot paths.
+
+    Args:
+        wavelength_nm: Laser wavelength (nm)
+        n_particle: EV refractive index used for the calculator cases
+        n_medium: Medium refractive index
+        seed: RNG seed for synthetic events
+
+    Returns:
+        List of BenchmarkCase
+    """
+    rng = np.random.default_rng(seed)
+    calc = MieScatterCalculator(wavelength_nm=wavelength_nm, n_particle=n_particle, n_medium=n_medium)
+    calibrator = FCMPASSCalibrator(wavelength_nm=wavelength_nm, n_particle=1.59, n_medium=n_medium)
+    calibrator.fit_from_beads({100: 15000, 200: 58000, 300: 125000})
+
+    # Build lookup tables outside the timed region
+    calc.get_lookup_table()
+    calibrator.mie_calc.get_lookup_table()
+
+    def diameters(n: int) -> np.ndarray:
+        return rng.uniform(30.0, 200.0, n)
+
+    def scatter(n: int) -> np.ndarray:
+        return calc.get_lookup_table().scatter_at(diameters(n))
+
+    return [
+        BenchmarkCase(
+            "calculate_scattering_efficiency",
+            setup=diameters,
+            run=lambda d: [calc.calculate_scattering_efficiency(x, validate=False) for x in d],
+            max_events=10_000,
+        ),
+        BenchmarkCase(
+            "diameter_from_scatter",
+            setup=scatter,
+            run=lambda v: [calc.diameter_from_scatter(x) for x in v],
+            max_events=1_000,
+        ),
+        BenchmarkCase(
+            "batch_calculate",
+            setup=diameters,
+            run=calc.batch_calculate,
+            max_events=10_000,
+        ),
+        BenchmarkCase(
+            "diameter_from_scatter_batch",
+            setup=scatter,
+            run=calc.diameter_from_scatter_batch,
+        ),
+        BenchmarkCase(
+            "predict_batch",
+            setup=lambda n: rng.uniform(5_000.0, 150_000.0, n),
+            run=calibrator.predict_batch,
+        ),
+    ]
+
+
+def measure(case: BenchmarkCase, n_events: int, repeats: int = 3) -> BenchmarkResult:
+    """
+    Time one case at one array size.
+
+    After a small untimed warm-up, wall time is the best of `repeats`
+    untraced runs; peak memory comes from one extra run under tracemalloc
+    (which also sees NumPy allocations).
+
+    Returns:
+        BenchmarkResult
+    """
+    # Untimed warm-up on a small array (imports, JIT, cold caches)
+    case.run(case.setup(min(n_events, 100)))
+    data = case.setup(n_events)
+
+    times = []
+    for _ in range(max(1, repeats)):
+        start = time.perf_counter()
+        case.run(data)
+        times.append(time.perf_counter() - start)
+    best = min(times)
+
+    tracemalloc.start()
+    try:
+        case.run(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        case=case.name,
+        n_events=int(n_events),
+        seconds=best,
+        events_per_sec=n_events / best if best > 0 else float('inf'),
+        peak_memory_mb=peak / 1e6,
+        repeats=max(1, repeats),
+    )
+
+
+def run_benchmarks(
+    cases: Optional[List[BenchmarkCase]] = None,
+    sizes: Optional[List[int]] = None,
+    repeats: int = 3,
+    only: Optional[List[str]] = None
+) -> BenchmarkRun:
+    """
+    Run every case at every size up to its max_events.
+
+    Args:
+        cases: Cases to run (default: default_cases())
+        sizes: Event array sizes (default: 1e3, 1e4, 1e5, 1e6)
+        repeats: Timed repetitions per measurement (best is kept)
+        only: Restrict to these case names
+
+    Returns:
+        BenchmarkRun
+    """
+    cases = cases if cases is not None else default_cases()
+    sizes = list(sizes or DEFAULT_SIZES)
+    if only:
+        unknown = set(only) - {c.name for c in cases}
+        if unknown:
+            raise ValueError(f"Unknown benchmark case(s): {sorted(unknown)}")
+        cases = [c for c in cases if c.name in only]
+
+    run = BenchmarkRun(
+        timestamp=datetime.now().isoformat(timespec="seconds"),
+        environment=environment_info(),
+    )
+    for case in cases:
+        for n in sizes:
+            if n > case.max_events:
+                continue
+            result = measure(case, n, repeats)
+            run.results.append(result)
+            logger.info(
+                f"  {case.name:<32} n={n:>9,}  {result.events_per_sec:>14,.0f} events/s  "
+                f"peak {result.peak_memory_mb:>8.1f} MB"
+            )
+    return run
+
+
+class BenchmarkHistory:
+    """
+    Append-only JSON history of benchmark runs.
+
+    Example:
+        >>> history = BenchmarkHistory(Path("data/benchmarks/physics.json"))
+        >>> run = run_benchmarks(sizes=[1_000, 100_000])
+        >>> regressions = history.compare(run, threshold=0.25)
+        >>> history.append(run)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def load(self) -> List[Dict[str, Any]]:
+        """All stored runs, oldest first."""
+        if not self.path.exists():
+            return []
+        return json.loads(self.path.read_text()).get("runs", [])
+
+    def append(self, run: BenchmarkRun) -> None:
+        """Add a run to the history file."""
+        runs = self.load()
+        runs.append(run.to_dict())
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({"runs": runs}, indent=2))
+
+    def baseline(
+        self,
+        host: Optional[str] = None,
+        window: int = 5
+    ) -> Dict[tuple, Dict[str, float]]:
+        """
+        Median metrics of the last `window` runs per (case, n_events).
+
+        Args:
+            host: Only use runs from this host (timings are machine-specific)
+            window: Number of most recent runs to take the median over
+
+        Returns:
+            Dict mapping (case, n_events) to {"events_per_sec", "peak_memory_mb"}
+        """
+        samples: Dict[tuple, Dict[str, List[float]]] = {}
+        for run in self.load():
+            if host is not None and run.get("environment", {}).get("host") != host:
+                continue
+            for r in run["results"]:
+                entry = samples.setdefault((r["case"], r["n_events"]), {"events_per_sec": [], "peak_memory_mb": []})
+                entry["events_per_sec"].append(r["events_per_sec"])
+                entry["peak_memory_mb"].append(r["peak_memory_mb"])
+
+        return {
+            key: {metric: statistics.median(values[-window:]) for metric, values in entry.items()}
+            for key, entry in samples.items()
+        }
+
+    def compare(
+        self,
+        run: BenchmarkRun,
+        threshold: float = 0.25,
+        memory_threshold: Optional[float] = None,
+        window: int = 5
+    ) -> List[Regression]:
+        """
+        Find metrics in `run` that regressed against the history baseline.
+
+        Args:
+            run: New run (not yet appended)
+            threshold: Allowed fractional throughput drop (0.25 = 25% slower)
+            memory_threshold: Allowed fractional peak-memory growth
+                              (default: same as threshold)
+            window: Baseline median window
+
+        Returns:
+            List of Regression (empty if nothing regressed or no baseline)
+        """
+        if memory_threshold is None:
+            memory_threshold = threshold
+        baseline = self.baseline(host=run.environment.get("host"), window=window)
+
+        regressions = []
+        for r in run.results:
+            base = baseline.get((r.case, r.n_events))
+            if base is None:
+                continue
+            if r.events_per_sec < base["events_per_sec"] * (1 - threshold):
+                regressions.append(Regression(
+                    r.case, r.n_events, "events_per_sec", base["events_per_sec"], r.events_per_sec,
+                    100 * (r.events_per_sec / base["events_per_sec"] - 1)
+                ))
+            # Ignore sub-MB noise for tiny arrays
+            if r.peak_memory_mb > base["peak_memory_mb"] * (1 + memory_threshold) + 1.0:
+                regressions.append(Regression(
+                    r.case, r.n_events, "peak_memory_mb", base["peak_memory_mb"], r.peak_memory_mb,
+                    100 * (r.peak_memory_mb / max(base["peak_memory_mb"], 1e-9) - 1)
+                ))
+        return regressions
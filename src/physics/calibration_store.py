@@ -0,0 +1,309 @@
+"""
+Calibration Store
+=================
+
+Purpose: Persist fitted FCMPASS bead calibrations as artifacts, one per
+         instrument and bead-run date, so the API and batch scripts load a
+         ready calibration instead of refitting on every run.
+
+Layout:
+    <root>/<instrument>/<YYYY-MM-DD>.json
+
+Each artifact holds the bead table, fitted polynomial, get_diagnostics()
+output, the precomputed inverse curve and a fingerprint of the inputs. The
+inverse curve maps calibrated Mie scatter → diameter, i.e. measured FSC
+after the bead polynomial (predict_batch() applies both); raw FSC must not
+be looked up in it. get_or_fit() only refits when the fingerprint changes,
+i.e. when a new bead run arrives.
+
+Author: CRMIT Backend Team
+"""
+
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Union
+import hashlib
+import json
+import os
+import re
+
+from loguru import logger
+
+from .mie_scatter import FCMPASSCalibrator
+from .mie_cache import MieTableCache
+
+
+DateLike = Union[date, str, None]
+
+
+class CalibrationStore:
+    """
+    Per-instrument, per-date store of FCMPASS calibration artifacts.
+
+    Example:
+        >>> store = CalibrationStore.default()
+        >>> # New bead run: fits once, then reuses the stored artifact
+        >>> cal = store.get_or_fit("ZE5-01", {100: 15000, 200: 58000, 300: 125000},
+        ...                        run_date="2025-11-18")
+        >>> # Later runs: latest calibration on or before a date, no refit
+        >>> cal = store.load("ZE5-01", run_date="2025-12-01")
+        >>> diameters, in_range = cal.predict_batch(fsc_values)
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        table_cache: Optional[MieTableCache] = None
+    ):
+        """
+        Initialize store.
+
+        Args:
+            root: Store directory (created if missing). Defaults to
+                  configured_dir().
+            table_cache: MieTableCache handed to loaded calibrators for events
+                         outside their inverse curve
+        """
+        if root is None:
+            root = self.configured_dir()
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.table_cache = table_cache
+        # path -> (mtime_ns, artifact header, calibrator): repeated loads skip JSON parsing
+        self._loaded: Dict[Path, Tuple[int, Dict[str, Any], FCMPASSCalibrator]] = {}
+
+    @staticmethod
+    def configured_dir() -> Path:
+        """
+        Settings.calibration_dir: $CRMIT_CALIBRATION_DIR, else the .env
+        file, else data/calibrations - the same directory the API uses.
+        """
+        from src.api.config import get_settings
+        return Path(get_settings().calibration_dir)
+
+    @classmethod
+    def default(cls) -> "CalibrationStore":
+        """Store and Mie table cache at their configured directories."""
+        return cls(table_cache=MieTableCache.default())
+
+    @staticmethod
+    def _date_str(run_date: DateLike) -> str:
+        """Normalize a date (or ISO string, default today) to YYYY-MM-DD."""
+        if run_date is None:
+            return date.today().isoformat()
+        if isinstance(run_date, (date, datetime)):
+            return run_date.strftime("%Y-%m-%d")
+        return date.fromisoformat(str(run_date)[:10]).isoformat()
+
+    @staticmethod
+    def _instrument_dir_name(instrument: str) -> str:
+        """Filesystem-safe directory name for an instrument ID."""
+        name = re.sub(r"[^A-Za-z0-9._-]+", "_", instrument.strip())
+        if not name.strip("._"):
+            raise ValueError(f"Invalid instrument name: {instrument!r}")
+        return name
+
+    @staticmethod
+    def fingerprint(
+        bead_measurements: Dict[float, float],
+        wavelength_nm: float,
+        n_particle: float,
+        n_medium: float,
+        poly_degree: int,
+        min_diameter: float,
+        max_diameter: float
+    ) -> str:
+        """Hash of everything that determines a fitted calibration."""
+        spec = {
+            "beads": sorted([round(float(d), 6), round(float(f), 6)] for d, f in bead_measurements.items()),
+            "wavelength_nm": round(float(wavelength_nm), 6),
+            "n_particle": round(float(n_particle), 6),
+            "n_medium": round(float(n_medium), 6),
+            "poly_degree": int(poly_degree),
+            "diameter_range": [round(float(min_diameter), 6), round(float(max_diameter), 6)],
+        }
+        return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:24]
+
+    def path_for(self, instrument: str, run_date: DateLike = None) -> Path:
+        """Artifact path for an instrument and bead-run date."""
+        return self.root / self._instrument_dir_name(instrument) / f"{self._date_str(run_date)}.json"
+
+    def list_calibrations(self, instrument: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List stored calibrations.
+
+        Args:
+            instrument: Restrict to one instrument (default: all)
+
+        Returns:
+            List of dicts with instrument, run_date and path, oldest first
+        """
+        if instrument is not None:
+            dirs = [self.root / self._instrument_dir_name(instrument)]
+        else:
+            dirs = sorted(p for p in self.root.iterdir() if p.is_dir())
+
+        entries = []
+        for directory in dirs:
+            for path in sorted(directory.glob("*.json")):
+                entries.append({
+                    "instrument": directory.name,
+                    "run_date": path.stem,
+                    "path": str(path),
+                })
+        return entries
+
+    def save(
+        self,
+        calibrator: FCMPASSCalibrator,
+        instrument: str,
+        run_date: DateLike = None,
+        fingerprint: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Path:
+        """
+        Write a fitted calibrator as an artifact (atomic).
+
+        Args:
+            calibrator: Fitted calibrator (build_inverse_curve() first for
+                        instant predictions after loading)
+            instrument: Instrument ID
+            run_date: Bead-run date (default: today)
+            fingerprint: Input fingerprint (see fingerprint())
+            metadata: Extra JSON-serializable info (operator, bead lot, ...)
+
+        Returns:
+            Path of the written artifact
+        """
+        path = self.path_for(instrument, run_date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        artifact = {
+            "format_version": self.FORMAT_VERSION,
+            "instrument": instrument,
+            "run_date": self._date_str(run_date),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "fingerprint": fingerprint,
+            "metadata": metadata or {},
+            "calibration": calibrator.to_dict(),
+        }
+
+        tmp_path = path.with_suffix(f".tmp-{os.getpid()}")
+        tmp_path.write_text(json.dumps(artifact))
+        os.replace(tmp_path, path)
+        self._loaded.pop(path, None)
+
+        logger.info(f"💾 Saved calibration: {instrument} @ {artifact['run_date']} → {path}")
+        return path
+
+    def _read(self, path: Path) -> Tuple[Dict[str, Any], FCMPASSCalibrator]:
+        """Parse an artifact, reusing the in-memory copy while the file is unchanged."""
+        mtime = path.stat().st_mtime_ns
+        cached = self._loaded.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        artifact = json.loads(path.read_text())
+        if artifact.get("format_version") != self.FORMAT_VERSION:
+            raise ValueError(f"Unsupported calibration format in {path}: {artifact.get('format_version')}")
+        calibrator = FCMPASSCalibrator.from_dict(artifact.pop("calibration"), table_cache=self.table_cache)
+        self._loaded[path] = (mtime, artifact, calibrator)
+        return artifact, calibrator
+
+    def load(
+        self,
+        instrument: str,
+        run_date: DateLike = None,
+        exact: bool = False
+    ) -> Optional[FCMPASSCalibrator]:
+        """
+        Load a calibration without refitting.
+
+        Args:
+            instrument: Instrument ID
+            run_date: Date of the data being sized. Returns the most recent
+                      calibration on or before this date (default: latest).
+            exact: Only accept a calibration from exactly run_date
+
+        Returns:
+            FCMPASSCalibrator, or None if no matching calibration exists
+        """
+        if exact:
+            path = self.path_for(instrument, run_date)
+            if not path.exists():
+                return None
+        else:
+            entries = self.list_calibrations(instrument)
+            if run_date is not None:
+                cutoff = self._date_str(run_date)
+                entries = [e for e in entries if e["run_date"] <= cutoff]
+            if not entries:
+                return None
+            path = Path(entries[-1]["path"])
+
+        _, calibrator = self._read(path)
+        logger.debug(f"Loaded calibration {path}")
+        return calibrator
+
+    def get_or_fit(
+        self,
+        instrument: str,
+        bead_measurements: Dict[float, float],
+        run_date: DateLike = None,
+        wavelength_nm: float = 488.0,
+        n_particle: float = 1.59,
+        n_medium: float = 1.33,
+        poly_degree: int = 2,
+        min_diameter: float = 30.0,
+        max_diameter: float = 200.0,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> FCMPASSCalibrator:
+        """
+        Return the stored calibration for a bead run, fitting it only if new.
+
+        The artifact for (instrument, run_date) is reused when its
+        fingerprint matches the bead table and optics; otherwise the beads
+        are fitted, the inverse curve built, and the artifact (re)written.
+
+        Args:
+            instrument: Instrument ID
+            bead_measurements: Dict mapping bead diameter (nm) to measured FSC
+            run_date: Bead-run date (default: today)
+            wavelength_nm: Laser wavelength (nm)
+            n_particle: Bead refractive index (polystyrene: 1.59)
+            n_medium: Medium refractive index
+            poly_degree: Calibration polynomial degree
+            min_diameter: Inverse-curve minimum diameter (nm)
+            max_diameter: Inverse-curve maximum diameter (nm)
+            metadata: Extra info stored with a new artifact
+
+        Returns:
+            Fitted FCMPASSCalibrator with an inverse curve
+        """
+        fingerprint = self.fingerprint(
+            bead_measurements, wavelength_nm, n_particle, n_medium,
+            poly_degree, min_diameter, max_diameter
+        )
+        path = self.path_for(instrument, run_date)
+        if path.exists():
+            try:
+                artifact, calibrator = self._read(path)
+                if artifact.get("fingerprint") == fingerprint:
+                    logger.info(f"✓ Using stored calibration: {instrument} @ {artifact['run_date']}")
+                    return calibrator
+                logger.info(f"🔄 Bead run changed for {instrument} @ {artifact['run_date']} - refitting")
+            except (ValueError, KeyError) as e:
+                logger.warning(f"⚠️ Ignoring unreadable calibration {path}: {e}")
+
+        calibrator = FCMPASSCalibrator(
+            wavelength_nm=wavelength_nm,
+            n_particle=n_particle,
+            n_medium=n_medium,
+            table_cache=self.table_cache
+        )
+        calibrator.fit_from_beads(bead_measurements, poly_degree=poly_degree)
+        calibrator.build_inverse_curve(min_diameter=min_diameter, max_diameter=max_diameter)
+        self.save(calibrator, instrument, run_date, fingerprint=fingerprint, metadata=metadata)
+        return calibrator
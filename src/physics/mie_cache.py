@@ -0,0 +1,261 @@
+"""
+Mie Table Cache
+===============
+
+Purpose: Persist precomputed Mie lookup tables on disk so that every process
+         (API worker, Streamlit app, batch scripts) can load them with a
+         single memory-map instead of recomputing thousands of miepython calls.
+
+Layout:
+    <cache_dir>/<key>.npy   - float64 array, shape (7, n_points), rows in
+                              MieTableCache.ROWS order (memory-mapped on load)
+    <cache_dir>/<key>.json  - human-readable description of the entry
+
+The key is a content hash of the optical configuration (wavelength,
+refractive indices), the diameter grid spec, the cache format version and
+the miepython version, so a library upgrade never serves stale tables.
+
+Author: CRMIT Backend Team
+"""
+
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable
+import hashlib
+import json
+import os
+
+import numpy as np
+import miepython
+from loguru import logger
+
+from .mie_scatter import MieLookupTable
+
+
+class MieTableCache:
+    """
+    Content-addressed on-disk cache of MieLookupTable objects.
+
+    Example:
+        >>> cache = MieTableCache.default()
+        >>> table = cache.get_or_build(wavelength_nm=488, n_particle=1.40, n_medium=1.33)
+        >>> # Or let a calculator use it transparently:
+        >>> calc = MieScatterCalculator(wavelength_nm=488, table_cache=cache)
+        >>> diameters, ok = calc.diameter_from_scatter_batch(fsc_array)
+    """
+
+    FORMAT_VERSION = 1
+    ROWS = ('diameters_nm', 'Q_ext', 'Q_sca', 'Q_back', 'g', 'forward_scatter', 'side_scatter')
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory for cached tables (created if missing).
+                       Defaults to configured_dir().
+        """
+        if cache_dir is None:
+            cache_dir = self.configured_dir()
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def configured_dir() -> Path:
+        """
+        Settings.mie_cache_dir: $CRMIT_MIE_CACHE_DIR, else the .env file,
+        else data/cache/mie - the same directory the API uses.
+        """
+        from src.api.config import get_settings
+        return Path(get_settings().mie_cache_dir)
+
+    @classmethod
+    def default(cls) -> "MieTableCache":
+        """Cache at the configured directory (see configured_dir())."""
+        return cls()
+
+    @classmethod
+    def make_key(
+        cls,
+        wavelength_nm: float,
+        n_particle: float,
+        n_medium: float,
+        min_diameter: float,
+        max_diameter: float,
+        n_points: int,
+        variant: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Build the content hash for an optical configuration and grid spec.
+
+        Args:
+            variant: Extra JSON-serializable parameters that change the table
+                     contents (e.g. detector angle windows)
+
+        Returns:
+            24-character hex digest
+        """
+        spec = cls._spec(wavelength_nm, n_particle, n_medium, min_diameter, max_diameter, n_points, variant)
+        payload = json.dumps(spec, sort_keys=True).encode()
+        return hashlib.sha256(payload).hexdigest()[:24]
+
+    @classmethod
+    def _spec(
+        cls,
+        wavelength_nm: float,
+        n_particle: float,
+        n_medium: float,
+        min_diameter: float,
+        max_diameter: float,
+        n_points: int,
+        variant: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Canonical description of a cache entry (rounded to avoid float noise)."""
+        spec: Dict[str, Any] = {
+            "format_version": cls.FORMAT_VERSION,
+            "miepython_version": getattr(miepython, '__version__', 'unknown'),
+            "wavelength_nm": round(float(wavelength_nm), 6),
+            "n_particle": round(float(n_particle), 6),
+            "n_medium": round(float(n_medium), 6),
+            "min_diameter": round(float(min_diameter), 6),
+            "max_diameter": round(float(max_diameter), 6),
+            "n_points": int(n_points),
+        }
+        if variant:
+            spec["variant"] = variant
+        return spec
+
+    def path_for(self, key: str) -> Path:
+        """Path of the .npy file for a key."""
+        return self.cache_dir / f"{key}.npy"
+
+    def load(
+        self,
+        wavelength_nm: float,
+        n_particle: float,
+        n_medium: float,
+        min_diameter: float = 10.0,
+        max_diameter: float = 1000.0,
+        n_points: int = 2000,
+        variant: Optional[Dict[str, Any]] = None
+    ) -> Optional[MieLookupTable]:
+        """
+        Load a cached table (memory-mapped, read-only).
+
+        Returns:
+            MieLookupTable, or None if not cached or the file is unreadable
+        """
+        key = self.make_key(wavelength_nm, n_particle, n_medium, min_diameter, max_diameter, n_points, variant)
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+
+        try:
+            data = np.load(path, mmap_mode='r')
+            if data.shape != (len(self.ROWS), int(n_points)):
+                raise ValueError(f"unexpected shape {data.shape}")
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring corrupt Mie cache entry {path.name}: {e}")
+            return None
+
+        rows = {name: data[i] for i, name in enumerate(self.ROWS)}
+        logger.debug(f"Loaded Mie table from cache: {path.name}")
+
+        return MieLookupTable(
+            wavelength_nm, n_particle, n_medium,
+            rows['diameters_nm'], rows['Q_ext'], rows['Q_sca'], rows['Q_back'], rows['g'],
+            forward_scatter=rows['forward_scatter'],
+            side_scatter=rows['side_scatter']
+        )
+
+    def save(self, table: MieLookupTable, variant: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Write a table to the cache atomically.
+
+        Args:
+            table: Table to persist (grid spec is taken from its diameters)
+            variant: Extra key parameters, as passed to load()
+
+        Returns:
+            Path of the written .npy file
+        """
+        d = table.diameters_nm
+        spec_args = (
+            table.wavelength_nm, table.n_particle, table.n_medium,
+            float(d[0]), float(d[-1]), len(d), variant
+        )
+        key = self.make_key(*spec_args)
+        path = self.path_for(key)
+
+        data = np.vstack([np.asarray(getattr(table, name), dtype=np.float64) for name in self.ROWS])
+
+        # Write to a temp file and rename so concurrent readers never see partial data
+        tmp_path = path.with_suffix(f".tmp-{os.getpid()}")
+        with open(tmp_path, 'wb') as f:
+            np.save(f, data)
+        os.replace(tmp_path, path)
+
+        meta = self._spec(*spec_args)
+        meta["rows"] = list(self.ROWS)
+        path.with_suffix('.json').write_text(json.dumps(meta, indent=2))
+
+        logger.debug(f"Saved Mie table to cache: {path.name}")
+        return path
+
+    def get_or_build(
+        self,
+        wavelength_nm: float,
+        n_particle: float,
+        n_medium: float,
+        min_diameter: float = 10.0,
+        max_diameter: float = 1000.0,
+        n_points: int = 2000,
+        variant: Optional[Dict[str, Any]] = None,
+        builder: Optional[Callable[..., MieLookupTable]] = None
+    ) -> MieLookupTable:
+        """
+        Load a table from the cache, building and saving it on a miss.
+
+        Args:
+            variant: Extra key parameters for non-default tables
+            builder: Callable taking the same keyword arguments as
+                     MieLookupTable.build() (default: MieLookupTable.build)
+
+        Returns:
+            MieLookupTable
+        """
+        table = self.load(wavelength_nm, n_particle, n_medium, min_diameter, max_diameter, n_points, variant)
+        if table is not None:
+            return table
+
+        logger.info(
+            f"🔄 Building Mie table (λ={wavelength_nm:.1f}nm, n={n_particle:.3f}/{n_medium:.3f}, "
+            f"{min_diameter:.0f}-{max_diameter:.0f}nm × {n_points}) - will be cached"
+        )
+        build = builder or MieLookupTable.build
+        table = build(
+            wavelength_nm=wavelength_nm,
+            n_particle=n_particle,
+            n_medium=n_medium,
+            min_diameter=min_diameter,
+            max_diameter=max_diameter,
+            n_points=n_points
+        )
+        try:
+            self.save(table, variant)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write Mie cache to {self.cache_dir}: {e}")
+        return table
+
+    def clear(self) -> int:
+        """
+        Delete all cached tables.
+
+        Returns:
+            Number of tables removed
+        """
+        removed = 0
+        for path in self.cache_dir.glob("*.npy"):
+            path.unlink(missing_ok=True)
+            path.with_suffix('.json').unlink(missing_ok=True)
+            removed += 1
+        return removed
@@ -34,13 +34,19 @@ Flow Cytometry Application:
 - Multi-wavelength analysis enables particle characterization
 """
 
-from typing import Tuple, Optional, Dict, List, Any
+from typing import Tuple, Optional, Dict, List, Any, TYPE_CHECKING
+import threading
+import time
 import numpy as np
 from loguru import logger
 import miepython
 from scipy.optimize import minimize_scalar, OptimizeResult
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    from .mie_cache import MieTableCache
+    from .parallel import MieBatchExecutor
+
 
 @dataclass
 class MieScatterResult:
@@ -65,6 +71,58 @@ class MieScatterResult:
     size_parameter_x: float
 
 
+def _mie_efficiencies(
+    m: complex,
+    x: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Evaluate miepython.single_sphere over an array of size parameters.
+
+    Uses exactly the same call as calculate_scattering_efficiency() so that
+    tabulated values are bit-identical to the scalar path.
+
+    Args:
+        m: Relative refractive index (complex)
+        x: Array of size parameters (πd/λ)
+
+    Returns:
+        Tuple of (Q_ext, Q_sca, Q_back, g) arrays with the shape of x
+    """
+    x = np.asarray(x, dtype=float)
+    qext = np.zeros(x.shape)
+    qsca = np.zeros(x.shape)
+    qback = np.zeros(x.shape)
+    g = np.zeros(x.shape)
+
+    for idx, x_i in np.ndenumerate(x):
+        values = miepython.single_sphere(m, float(x_i), 0)
+        qext[idx], qsca[idx], qback[idx], g[idx] = [
+            float(v) if v is not None else 0.0 for v in values
+        ]
+
+    return qext, qsca, qback, g
+
+
+def _scatter_proxies(
+    diameters_nm: np.ndarray,
+    qsca: np.ndarray,
+    qback: np.ndarray,
+    g: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    FSC/SSC detector proxies from Mie efficiencies (array form).
+
+    Same definitions as calculate_scattering_efficiency():
+    FSC = Q_sca × area × (1+g), SSC = Q_back × area.
+    """
+    cross_section = np.pi * (np.asarray(diameters_nm, dtype=float) / 2.0) ** 2
+    return qsca * cross_section * (1.0 + g), qback * cross_section
+
+
+# Default ZE5 Bio-Rad laser lines (nm)
+ZE5_WAVELENGTHS = (405.0, 488.0, 561.0, 633.0)
+
+
 class MieScatterCalculator:
     """
     Production-quality Mie scattering calculator for flow cytometry applications.
@@ -107,7 +165,8 @@ class MieScatterCalculator:
         self,
         wavelength_nm: float = 488.0,
         n_particle: float = 1.40,
-        n_medium: float = 1.33
+        n_medium: float = 1.33,
+        table_cache: Optional["MieTableCache"] = None
     ):
         """
         Initialize Mie calculator for specific optical configuration.
@@ -124,6 +183,9 @@ class MieScatterCalculator:
                      PBS/water: 1.33
                      Saline: ~1.33
                      Air: 1.00 (for dry measurements)
+            table_cache: Optional on-disk MieTableCache. When given, lookup
+                        tables are loaded from / saved to disk instead of
+                        being recomputed in every process.
         
         Raises:
             ValueError: If any input parameter is invalid
@@ -155,7 +217,12 @@ class MieScatterCalculator:
         # Imaginary part = 0 for non-absorbing particles
         # For absorbing particles, use complex(real, imaginary)
         self.m = complex(n_particle / n_medium, 0.0)
-        
+
+        # Lookup tables built on demand, keyed by optical config + grid spec
+        self.table_cache = table_cache
+        self._lookup_tables: Dict[Tuple[float, ...], "MieLookupTable"] = {}
+        self._table_lock = threading.Lock()
+
         logger.info(
             f"✓ Mie Calculator initialized: λ={wavelength_nm:.1f}nm, "
             f"n_particle={n_particle:.4f}, n_medium={n_medium:.4f}, m={self.m.real:.4f}"
@@ -431,31 +498,90 @@ class MieScatterCalculator:
             # Default to ZE5 Bio-Rad flow cytometer lasers
             wavelengths = [405, 488, 561, 633]
         
-        # Store original configuration
-        original_wavelength = self.wavelength_nm
-        results = {}
+        # Stateless: no temporary mutation of self.wavelength_nm, so a shared
+        # calculator is safe to use from multiple threads
+        # Note: Refractive indices are wavelength-dependent in reality
+        # For now, assume constant (good approximation for visible range)
+        response = self.calculate_spectral_response(
+            np.array([diameter_nm], dtype=float),
+            wavelengths=wavelengths,
+            use_lookup=False
+        )[0]
+        
+        return {f'{int(wavelength)}nm': float(value) for wavelength, value in zip(wavelengths, response)}
+    
+    def calculate_spectral_response(
+        self,
+        diameters_nm: np.ndarray,
+        wavelengths: Optional[List[float]] = None,
+        channel: str = 'forward_scatter',
+        use_lookup: bool = False
+    ) -> np.ndarray:
+        """
+        Scatter response matrix for many diameters at many wavelengths.
         
-        try:
-            for wavelength in wavelengths:
-                # Temporarily update calculator for this wavelength
-                self.wavelength_nm = wavelength
-                # Note: Refractive indices are wavelength-dependent in reality
-                # For now, assume constant (good approximation for visible range)
-                
-                # Calculate scatter
-                result = self.calculate_scattering_efficiency(diameter_nm, validate=False)
-                results[f'{int(wavelength)}nm'] = result.forward_scatter
-                
-        finally:
-            # Always restore original wavelength (even if exception occurs)
-            self.wavelength_nm = original_wavelength
-        
-        return results
+        Stateless counterpart of calculate_wavelength_response(): returns a
+        (n_diameters × n_wavelengths) matrix in one call, e.g. the spectral
+        fingerprint of every sized event across all ZE5 lasers.
+        
+        By default every entry is an exact Mie result, evaluated with one
+        miepython call per (diameter, wavelength) pair - a Python-level loop,
+        so this costs about as much as the scalar path per entry. For large
+        event arrays pass use_lookup=True to interpolate instead.
+        
+        Args:
+            diameters_nm: Array of particle diameters (nm), shape (n,)
+            wavelengths: Wavelengths (nm). Default: ZE5 lasers 405/488/561/633
+            channel: 'forward_scatter' (FSC proxy) or 'side_scatter' (SSC proxy)
+            use_lookup: Approximate the response by cubic Hermite interpolation
+                       of cached per-wavelength lookup tables (10-1000 nm,
+                       O(n log M), ~1e-4 relative error). Diameters outside
+                       the table range are still evaluated exactly.
+        
+        Returns:
+            Array of shape (n_diameters, n_wavelengths)
+        
+        Example:
+            >>> calc = MieScatterCalculator(n_particle=1.40, n_medium=1.33)
+            >>> matrix = calc.calculate_spectral_response(event_diameters, use_lookup=True)
+            >>> blue_red = matrix[:, 0] / matrix[:, 3]   # 405nm / 633nm
+        """
+        if channel not in MieLookupTable.CHANNELS:
+            raise ValueError(f"Unknown channel '{channel}', expected one of {MieLookupTable.CHANNELS}")
+        
+        diameters = np.atleast_1d(np.asarray(diameters_nm, dtype=float))
+        wl = np.asarray(ZE5_WAVELENGTHS if wavelengths is None else wavelengths, dtype=float)
+        if np.any(wl <= 0):
+            raise ValueError(f"Wavelengths must be positive, got {wl.tolist()}")
+        
+        response = np.zeros((len(diameters), len(wl)))
+        exact = np.ones(len(diameters), dtype=bool)
+        
+        if use_lookup:
+            table_min, table_max = 10.0, 1000.0
+            exact = (diameters < table_min) | (diameters > table_max) | ~np.isfinite(diameters)
+            inside = ~exact
+            if np.any(inside):
+                for j, wavelength in enumerate(wl):
+                    table = self.get_lookup_table(
+                        min_diameter=table_min, max_diameter=table_max, wavelength_nm=float(wavelength)
+                    )
+                    response[inside, j] = table.scatter_at(diameters[inside], channel)
+        
+        if np.any(exact):
+            d = diameters[exact]
+            x = np.pi * d[:, None] / wl[None, :]
+            _, qsca, qback, g = _mie_efficiencies(self.m, x)
+            fsc, ssc = _scatter_proxies(d[:, None], qsca, qback, g)
+            response[exact] = fsc if channel == 'forward_scatter' else ssc
+        
+        return response
     
     def batch_calculate(
         self,
         diameters_nm: np.ndarray,
-        show_progress: bool = False
+        show_progress: bool = False,
+        executor: Optional["MieBatchExecutor"] = None
     ) -> np.ndarray:
         """
         Calculate FSC for array of diameters (optimized for performance).
@@ -471,6 +597,8 @@ class MieScatterCalculator:
                          Shape: (n_particles,)
             show_progress: If True, log progress every 1000 particles
                           Useful for very large datasets (>10K particles)
+            executor: Optional MieBatchExecutor to spread chunks over worker
+                     processes (results are identical to the serial path)
             
         Returns:
             NumPy array of forward scatter intensities
@@ -493,11 +621,17 @@ class MieScatterCalculator:
             >>> print(f"Mean FSC: {fsc_values.mean():.1f}")
         """
         n = len(diameters_nm)
-        fsc_values = np.zeros(n)
         
         if show_progress and n > 100:
             logger.info(f"🔄 Calculating Mie scatter for {n:,} particles...")
         
+        if executor is not None:
+            fsc_values = executor.batch_calculate(self, diameters_nm)
+            if show_progress and n > 100:
+                logger.info(f"✅ Batch calculation complete ({n:,} particles, {executor.max_workers} workers)")
+            return fsc_values
+        
+        fsc_values = np.zeros(n)
         for i, diameter in enumerate(diameters_nm):
             if show_progress and n > 1000 and i % 1000 == 0:
                 logger.info(f"  Progress: {i:,}/{n:,} ({100*i/n:.1f}%)")
@@ -507,9 +641,741 @@ class MieScatterCalculator:
         
         if show_progress and n > 100:
             logger.info(f"✅ Batch calculation complete ({n:,} particles)")
-        
+
         return fsc_values
 
+    def get_lookup_table(
+        self,
+        min_diameter: float = 10.0,
+        max_diameter: float = 1000.0,
+        n_points: int = 2000,
+        wavelength_nm: Optional[float] = None
+    ) -> "MieLookupTable":
+        """
+        Get (building on first use) the Mie lookup table for this configuration.
+
+        Tables are cached in memory per (wavelength, n_particle, n_medium,
+        grid spec) and, if a table_cache was given, on disk across processes.
+
+        Args:
+            min_diameter: Smallest tabulated diameter (nm)
+            max_diameter: Largest tabulated diameter (nm)
+            n_points: Number of grid points (default 2000 → ~0.5nm spacing)
+            wavelength_nm: Wavelength of the table (default: self.wavelength_nm)
+
+        Returns:
+            MieLookupTable for the requested optical configuration
+        """
+        if wavelength_nm is None:
+            wavelength_nm = self.wavelength_nm
+        key = (
+            float(wavelength_nm), float(self.n_particle), float(self.n_medium),
+            float(min_diameter), float(max_diameter), float(n_points)
+        )
+        table = self._lookup_tables.get(key)
+        if table is None:
+            with self._table_lock:
+                table = self._lookup_tables.get(key)
+                if table is None:
+                    build = MieLookupTable.build if self.table_cache is None else self.table_cache.get_or_build
+                    table = build(
+                        wavelength_nm=wavelength_nm,
+                        n_particle=self.n_particle,
+                        n_medium=self.n_medium,
+                        min_diameter=min_diameter,
+                        max_diameter=max_diameter,
+                        n_points=n_points
+                    )
+                    self._lookup_tables[key] = table
+        return table
+
+    def diameter_from_scatter_batch(
+        self,
+        fsc_intensities: np.ndarray,
+        min_diameter: float = 30.0,
+        max_diameter: float = 200.0,
+        refine: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized inverse Mie problem using the lookup table.
+
+        Array counterpart of diameter_from_scatter(): instead of one Brent
+        optimization per particle, the whole array is inverted against a
+        precomputed FSC(d) table in O(N log M).
+
+        Args:
+            fsc_intensities: Array of FSC intensities (Mie scatter units)
+            min_diameter: Minimum diameter to search (nm)
+            max_diameter: Maximum diameter to search (nm)
+            refine: Apply one Newton refinement step on the cubic interpolant
+
+        Returns:
+            Tuple of (diameters_nm, success_mask). Non-positive or non-finite
+            intensities give NaN diameters with success=False.
+
+        Example:
+            >>> calc = MieScatterCalculator(wavelength_nm=488, n_particle=1.40)
+            >>> fsc = calc.batch_calculate(np.array([50.0, 80.0, 120.0]))
+            >>> diameters, ok = calc.diameter_from_scatter_batch(fsc)
+        """
+        table = self.get_lookup_table(
+            min_diameter=min(10.0, min_diameter),
+            max_diameter=max(1000.0, max_diameter)
+        )
+        return table.diameter_from_scatter(
+            fsc_intensities,
+            min_diameter=min_diameter,
+            max_diameter=max_diameter,
+            refine=refine
+        )
+
+    def diameter_candidates_batch(
+        self,
+        scatter_values: np.ndarray,
+        min_diameter: float = 30.0,
+        max_diameter: float = 1000.0,
+        channel: str = 'forward_scatter'
+    ) -> np.ndarray:
+        """
+        All candidate diameters per event (one column per resonance branch).
+
+        See MieLookupTable.diameter_candidates().
+
+        Returns:
+            Array of shape (n_events, n_branches), NaN-padded
+        """
+        table = self.get_lookup_table(
+            min_diameter=min(10.0, min_diameter),
+            max_diameter=max(1000.0, max_diameter)
+        )
+        return table.diameter_candidates(
+            scatter_values, min_diameter=min_diameter, max_diameter=max_diameter, channel=channel
+        )
+
+    def diameter_from_fsc_ssc_batch(
+        self,
+        fsc_intensities: np.ndarray,
+        ssc_intensities: np.ndarray,
+        min_diameter: float = 30.0,
+        max_diameter: float = 1000.0,
+        primary_channel: str = 'forward_scatter'
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Size events over the full range, resolving multiple solutions with SSC/FSC.
+
+        The primary channel is inverted on every monotonic branch of its
+        curve; where several diameters fit, the one whose predicted other
+        channel best matches the measurement wins. No per-event optimization.
+
+        Args:
+            fsc_intensities: FSC values (Mie scatter units)
+            ssc_intensities: SSC values (Mie scatter units)
+            min_diameter: Minimum diameter to search (nm)
+            max_diameter: Maximum diameter to search (nm)
+            primary_channel: Channel to invert ('forward_scatter' or 'side_scatter')
+
+        Returns:
+            Tuple of (diameters_nm, n_candidates, success_mask)
+
+        Example:
+            >>> calc = MieScatterCalculator(wavelength_nm=488, n_particle=1.40)
+            >>> d, n_cand, ok = calc.diameter_from_fsc_ssc_batch(fsc, ssc, 30, 1000)
+            >>> ambiguous = n_cand > 1
+        """
+        table = self.get_lookup_table(
+            min_diameter=min(10.0, min_diameter),
+            max_diameter=max(1000.0, max_diameter)
+        )
+        if primary_channel == 'forward_scatter':
+            primary, secondary, other = fsc_intensities, ssc_intensities, 'side_scatter'
+        elif primary_channel == 'side_scatter':
+            primary, secondary, other = ssc_intensities, fsc_intensities, 'forward_scatter'
+        else:
+            raise ValueError(f"Unknown channel '{primary_channel}', expected one of {MieLookupTable.CHANNELS}")
+
+        return table.diameter_from_scatter_pair(
+            primary, secondary,
+            min_diameter=min_diameter,
+            max_diameter=max_diameter,
+            channel=primary_channel,
+            secondary_channel=other
+        )
+
+
+class MieLookupTable:
+    """
+    Dense Mie scatter table for vectorized diameter inversion.
+
+    The table holds Q_ext, Q_sca, Q_back, g and the FSC/SSC proxies on a fixed
+    diameter grid for one (wavelength, n_particle, n_medium). Inversion splits
+    the curve into monotonic segments (scatter oscillates with diameter in the
+    resonance regime, most visibly Q_back/SSC) and interpolates within the first segment that brackets the
+    measured value - the smallest-diameter solution - optionally followed by a
+    single Newton step on a cubic Hermite interpolant.
+
+    Cost: one-off M miepython calls to build, then O(N log M) per inversion
+    instead of 10-30 miepython calls per particle.
+
+    Example:
+        >>> table = MieLookupTable.build(wavelength_nm=488, n_particle=1.40, n_medium=1.33)
+        >>> diameters, success = table.diameter_from_scatter(fsc_array)
+        >>> report = table.accuracy_report(n_samples=25)
+        >>> print(f"Max error vs optimizer: {report['max_abs_diff_vs_optimizer_nm']:.4f} nm")
+    """
+
+    CHANNELS = ('forward_scatter', 'side_scatter')
+
+    def __init__(
+        self,
+        wavelength_nm: float,
+        n_particle: float,
+        n_medium: float,
+        diameters_nm: np.ndarray,
+        Q_ext: np.ndarray,
+        Q_sca: np.ndarray,
+        Q_back: np.ndarray,
+        g: np.ndarray,
+        forward_scatter: Optional[np.ndarray] = None,
+        side_scatter: Optional[np.ndarray] = None
+    ):
+        """
+        Create a table from precomputed efficiencies.
+
+        Use MieLookupTable.build() to compute the efficiencies with miepython,
+        or MieTableCache to load them from disk.
+
+        Args:
+            wavelength_nm: Laser wavelength (nm)
+            n_particle: Particle refractive index
+            n_medium: Medium refractive index
+            diameters_nm: Strictly increasing diameter grid (nm)
+            Q_ext, Q_sca, Q_back, g: Mie efficiencies on the grid
+            forward_scatter, side_scatter: Precomputed FSC/SSC proxies
+                (derived from the efficiencies if omitted)
+
+        Raises:
+            ValueError: If the grid is too short or not strictly increasing
+        """
+        diameters_nm = np.asarray(diameters_nm, dtype=float)
+        if diameters_nm.ndim != 1 or len(diameters_nm) < 2:
+            raise ValueError("Lookup table needs at least 2 diameter grid points")
+        if np.any(np.diff(diameters_nm) <= 0):
+            raise ValueError("Lookup table diameters must be strictly increasing")
+
+        self.wavelength_nm = float(wavelength_nm)
+        self.n_particle = float(n_particle)
+        self.n_medium = float(n_medium)
+        self.diameters_nm = diameters_nm
+        self.Q_ext = np.asarray(Q_ext, dtype=float)
+        self.Q_sca = np.asarray(Q_sca, dtype=float)
+        self.Q_back = np.asarray(Q_back, dtype=float)
+        self.g = np.asarray(g, dtype=float)
+
+        # Same detector proxies as calculate_scattering_efficiency()
+        if forward_scatter is None or side_scatter is None:
+            forward_scatter, side_scatter = _scatter_proxies(
+                diameters_nm, self.Q_sca, self.Q_back, self.g
+            )
+        self.forward_scatter = np.asarray(forward_scatter, dtype=float)
+        self.side_scatter = np.asarray(side_scatter, dtype=float)
+
+        # Node derivatives for cubic Hermite refinement (lazily per channel)
+        self._slopes: Dict[str, np.ndarray] = {}
+        # Monotonic branches per (channel, min_diameter, max_diameter)
+        self._branches: Dict[Tuple[str, float, float], List[Tuple[np.ndarray, np.ndarray]]] = {}
+
+    @classmethod
+    def build(
+        cls,
+        wavelength_nm: float = 488.0,
+        n_particle: float = 1.40,
+        n_medium: float = 1.33,
+        min_diameter: float = 10.0,
+        max_diameter: float = 1000.0,
+        n_points: int = 2000
+    ) -> "MieLookupTable":
+        """
+        Compute a lookup table on a uniform diameter grid with miepython.
+
+        Args:
+            wavelength_nm: Laser wavelength (nm)
+            n_particle: Particle refractive index
+            n_medium: Medium refractive index
+            min_diameter: Smallest tabulated diameter (nm)
+            max_diameter: Largest tabulated diameter (nm)
+            n_points: Number of grid points
+
+        Returns:
+            MieLookupTable
+
+        Raises:
+            ValueError: If the grid specification is invalid
+        """
+        if min_diameter <= 0 or max_diameter <= min_diameter:
+            raise ValueError(
+                f"Invalid diameter grid: [{min_diameter}, {max_diameter}] nm"
+            )
+        if n_points < 2:
+            raise ValueError(f"n_points must be >= 2, got {n_points}")
+
+        diameters = np.linspace(min_diameter, max_diameter, int(n_points))
+        m = complex(n_particle / n_medium, 0.0)
+        x = (np.pi * diameters) / wavelength_nm
+        qext, qsca, qback, g = _mie_efficiencies(m, x)
+
+        logger.debug(
+            f"Built Mie lookup table: λ={wavelength_nm:.1f}nm, m={m.real:.4f}, "
+            f"{min_diameter:.0f}-{max_diameter:.0f}nm, {int(n_points)} points"
+        )
+
+        return cls(wavelength_nm, n_particle, n_medium, diameters, qext, qsca, qback, g)
+
+    def _channel_values(self, channel: str) -> np.ndarray:
+        """Return tabulated values for a scatter channel."""
+        if channel not in self.CHANNELS:
+            raise ValueError(f"Unknown channel '{channel}', expected one of {self.CHANNELS}")
+        return getattr(self, channel)
+
+    def _channel_slopes(self, channel: str) -> np.ndarray:
+        """Return dValue/dDiameter at grid nodes for a scatter channel."""
+        slopes = self._slopes.get(channel)
+        if slopes is None:
+            slopes = np.gradient(self._channel_values(channel), self.diameters_nm)
+            self._slopes[channel] = slopes
+        return slopes
+
+    def monotonic_segments(
+        self,
+        channel: str = 'forward_scatter',
+        min_diameter: Optional[float] = None,
+        max_diameter: Optional[float] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Split the tabulated curve into monotonic segments.
+
+        Args:
+            channel: 'forward_scatter' or 'side_scatter'
+            min_diameter: Restrict to grid points >= this diameter (nm)
+            max_diameter: Restrict to grid points <= this diameter (nm)
+
+        Returns:
+            List of (start_index, end_index) pairs (inclusive, into the full
+            grid). Neighbouring segments share their turning-point node.
+        """
+        values = self._channel_values(channel)
+        lo = 0 if min_diameter is None else int(
+            np.searchsorted(self.diameters_nm, min_diameter, side='left')
+        )
+        hi = len(values) - 1 if max_diameter is None else int(
+            np.searchsorted(self.diameters_nm, max_diameter, side='right') - 1
+        )
+        return self._segments(values, lo, hi)
+
+    @staticmethod
+    def _segments(values: np.ndarray, lo: int, hi: int) -> List[Tuple[int, int]]:
+        """Monotonic segments of values[lo:hi+1] as inclusive index pairs."""
+        if hi - lo < 1:
+            return [(lo, hi)] if hi >= lo else []
+
+        direction = np.sign(np.diff(values[lo:hi + 1]))
+        # Flat steps continue the previous direction
+        for i in range(1, len(direction)):
+            if direction[i] == 0:
+                direction[i] = direction[i - 1]
+        turns = np.nonzero(direction[1:] * direction[:-1] < 0)[0] + 1
+
+        bounds = [lo] + [lo + int(t) for t in turns] + [hi]
+        return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1)]
+
+    def scatter_at(
+        self,
+        diameters_nm: np.ndarray,
+        channel: str = 'forward_scatter'
+    ) -> np.ndarray:
+        """
+        Interpolate scatter at arbitrary diameters (cubic Hermite).
+
+        Args:
+            diameters_nm: Diameters within the tabulated range (nm)
+            channel: 'forward_scatter' or 'side_scatter'
+
+        Returns:
+            Interpolated scatter values
+        """
+        values, _ = self._hermite(np.asarray(diameters_nm, dtype=float), channel)
+        return values
+
+    def _hermite(
+        self,
+        d: np.ndarray,
+        channel: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Cubic Hermite interpolant value and derivative at diameters d."""
+        grid = self.diameters_nm
+        values = self._channel_values(channel)
+        slopes = self._channel_slopes(channel)
+
+        k = np.clip(np.searchsorted(grid, d, side='right') - 1, 0, len(grid) - 2)
+        h = grid[k + 1] - grid[k]
+        t = (d - grid[k]) / h
+        t2 = t * t
+        t3 = t2 * t
+
+        y0, y1 = values[k], values[k + 1]
+        m0, m1 = slopes[k] * h, slopes[k + 1] * h
+
+        value = (
+            (2 * t3 - 3 * t2 + 1) * y0 + (t3 - 2 * t2 + t) * m0
+            + (-2 * t3 + 3 * t2) * y1 + (t3 - t2) * m1
+        )
+        derivative = (
+            (6 * t2 - 6 * t) * y0 + (3 * t2 - 4 * t + 1) * m0
+            + (-6 * t2 + 6 * t) * y1 + (3 * t2 - 2 * t) * m1
+        ) / h
+        return value, derivative
+
+    def _newton_step(
+        self,
+        d: np.ndarray,
+        target: np.ndarray,
+        channel: str
+    ) -> np.ndarray:
+        """One Newton step on the Hermite interpolant, kept inside d's grid cell."""
+        grid = self.diameters_nm
+        value, derivative = self._hermite(d, channel)
+
+        k = np.clip(np.searchsorted(grid, d, side='right') - 1, 0, len(grid) - 2)
+        safe = np.abs(derivative) > 0
+        step = np.zeros_like(d)
+        step[safe] = (value[safe] - target[safe]) / derivative[safe]
+        return np.clip(d - step, grid[k], grid[k + 1])
+
+    def diameter_from_scatter(
+        self,
+        scatter_values: np.ndarray,
+        min_diameter: float = 30.0,
+        max_diameter: float = 200.0,
+        refine: bool = True,
+        channel: str = 'forward_scatter'
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Invert an array of scatter intensities to diameters.
+
+        Each value is matched to the first (smallest-diameter) monotonic
+        segment of the curve within [min_diameter, max_diameter] that brackets
+        it. Values outside the curve's range are clamped to the diameter of
+        the nearest extreme, as the bounded optimizer would.
+
+        Args:
+            scatter_values: Measured scatter intensities (Mie scatter units)
+            min_diameter: Minimum diameter to search (nm)
+            max_diameter: Maximum diameter to search (nm)
+            refine: Apply one Newton step on the cubic Hermite interpolant
+            channel: 'forward_scatter' (default) or 'side_scatter'
+
+        Returns:
+            Tuple of (diameters_nm, success_mask). success follows the scalar
+            criterion: residual < 1% of the measured intensity. Non-positive or
+            non-finite inputs give NaN with success=False.
+
+        Raises:
+            ValueError: If the search range lies outside the tabulated grid
+        """
+        branches = self.branches(channel, min_diameter, max_diameter)
+
+        target = np.atleast_1d(np.asarray(scatter_values, dtype=float))
+        diameters = np.full(target.shape, np.nan)
+        valid = np.isfinite(target) & (target > 0)
+
+        assigned = ~valid
+        for seg_v, seg_d in branches:
+            hit = ~assigned & (target >= seg_v[0]) & (target <= seg_v[-1])
+            if np.any(hit):
+                diameters[hit] = np.interp(target[hit], seg_v, seg_d)
+                assigned |= hit
+
+        # Out-of-range values: clamp to the diameter of the nearest extreme
+        outside = ~assigned
+        if np.any(outside):
+            diameters[outside] = self._clamp_diameters(target[outside], branches)
+
+        if refine and np.any(valid):
+            refined = self._newton_step(diameters[valid], target[valid], channel)
+            diameters[valid] = np.clip(refined, min_diameter, max_diameter)
+
+        success = np.zeros(target.shape, dtype=bool)
+        if np.any(valid):
+            residual = np.abs(self.scatter_at(diameters[valid], channel) - target[valid])
+            success[valid] = residual < 0.01 * target[valid]
+
+        return diameters, success
+
+    def branches(
+        self,
+        channel: str = 'forward_scatter',
+        min_diameter: float = 30.0,
+        max_diameter: float = 200.0
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Monotonic branches of the curve restricted to [min_diameter, max_diameter].
+
+        Computed once per (channel, range) and cached.
+
+        Returns:
+            List of (values, diameters) arrays per branch in diameter order,
+            each sorted by increasing value for np.interp
+
+        Raises:
+            ValueError: If the range lies outside the tabulated grid
+        """
+        key = (channel, float(min_diameter), float(max_diameter))
+        cached = self._branches.get(key)
+        if cached is not None:
+            return cached
+
+        grid = self.diameters_nm
+        if min_diameter < grid[0] or max_diameter > grid[-1] or max_diameter <= min_diameter:
+            raise ValueError(
+                f"Search range [{min_diameter}, {max_diameter}] nm outside lookup table "
+                f"[{grid[0]:.1f}, {grid[-1]:.1f}] nm"
+            )
+
+        # Sub-table on [min_diameter, max_diameter] with exact end points
+        inner = (grid > min_diameter) & (grid < max_diameter)
+        sub_d = np.concatenate(([min_diameter], grid[inner], [max_diameter]))
+        sub_v = np.concatenate((
+            self.scatter_at(np.array([min_diameter]), channel),
+            self._channel_values(channel)[inner],
+            self.scatter_at(np.array([max_diameter]), channel)
+        ))
+
+        # Branch ends: range limits plus each turning point moved to the
+        # interpolant's extremum, which can lie between (and beyond) grid nodes
+        ends = [(sub_d[0], sub_v[0])]
+        for _, k in self._segments(sub_v, 0, len(sub_v) - 1)[:-1]:
+            pick = np.argmax if sub_v[k] >= sub_v[k - 1] else np.argmin
+            lo, hi = sub_d[k - 1], sub_d[k + 1]
+            for _ in range(3):  # Successive zoom: 32x narrower per pass
+                fine = np.linspace(lo, hi, 65)
+                values = self.scatter_at(fine, channel)
+                j = int(pick(values))
+                lo, hi = fine[max(j - 1, 0)], fine[min(j + 1, 64)]
+            ends.append((fine[j], values[j]))
+        ends.append((sub_d[-1], sub_v[-1]))
+
+        branches = []
+        for (d0, v0), (d1, v1) in zip(ends[:-1], ends[1:]):
+            inside = (sub_d > d0) & (sub_d < d1)
+            seg_d = np.concatenate(([d0], sub_d[inside], [d1]))
+            seg_v = np.concatenate(([v0], sub_v[inside], [v1]))
+            if seg_v[-1] < seg_v[0]:
+                seg_d, seg_v = seg_d[::-1], seg_v[::-1]
+            branches.append((seg_v, seg_d))
+
+        self._branches[key] = branches
+        return branches
+
+    @staticmethod
+    def _clamp_diameters(
+        target: np.ndarray,
+        branches: List[Tuple[np.ndarray, np.ndarray]]
+    ) -> np.ndarray:
+        """Diameter of the curve's lowest/highest point for values outside its range."""
+        v = np.concatenate([seg_v for seg_v, _ in branches])
+        d = np.concatenate([seg_d for _, seg_d in branches])
+        return np.where(target < v.min(), d[np.argmin(v)], d[np.argmax(v)])
+
+    def diameter_candidates(
+        self,
+        scatter_values: np.ndarray,
+        min_diameter: float = 30.0,
+        max_diameter: float = 1000.0,
+        refine: bool = True,
+        channel: str = 'forward_scatter'
+    ) -> np.ndarray:
+        """
+        All diameters consistent with each scatter value.
+
+        In the resonance regime a scatter intensity can be produced by
+        several diameters (one per monotonic branch that brackets it). This
+        returns every such solution instead of only the smallest.
+
+        Args:
+            scatter_values: Measured scatter intensities (Mie scatter units)
+            min_diameter: Minimum diameter to search (nm)
+            max_diameter: Maximum diameter to search (nm)
+            refine: Apply one Newton step on the cubic Hermite interpolant
+            channel: 'forward_scatter' or 'side_scatter'
+
+        Returns:
+            Array of shape (n_values, n_branches): column j holds the solution
+            on branch j (diameter order), NaN where that branch does not
+            bracket the value. Rows of non-positive, non-finite or
+            out-of-range values are all NaN.
+        """
+        branches = self.branches(channel, min_diameter, max_diameter)
+
+        target = np.atleast_1d(np.asarray(scatter_values, dtype=float)).ravel()
+        candidates = np.full((len(target), len(branches)), np.nan)
+        valid = np.isfinite(target) & (target > 0)
+
+        for j, (seg_v, seg_d) in enumerate(branches):
+            hit = valid & (target >= seg_v[0]) & (target <= seg_v[-1])
+            if not np.any(hit):
+                continue
+            d = np.interp(target[hit], seg_v, seg_d)
+            if refine:
+                # Keep the refined solution on its own branch
+                d = np.clip(self._newton_step(d, target[hit], channel), seg_d.min(), seg_d.max())
+            candidates[hit, j] = d
+
+        return candidates
+
+    def diameter_from_scatter_pair(
+        self,
+        scatter_values: np.ndarray,
+        secondary_values: np.ndarray,
+        min_diameter: float = 30.0,
+        max_diameter: float = 1000.0,
+        refine: bool = True,
+        channel: str = 'forward_scatter',
+        secondary_channel: str = 'side_scatter'
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Invert one channel and pick among multiple solutions with the other.
+
+        Candidates come from diameter_candidates() on `channel`; when there is
+        more than one, the candidate whose predicted secondary signal is
+        closest (in log space) to the measured one is chosen. Both channels
+        must be in Mie scatter units.
+
+        Args:
+            scatter_values: Primary channel intensities
+            secondary_values: Secondary channel intensities for disambiguation
+            min_diameter: Minimum diameter to search (nm)
+            max_diameter: Maximum diameter to search (nm)
+            refine: Apply Newton refinement to the candidates
+            channel: Primary channel
+            secondary_channel: Channel used to choose between candidates
+
+        Returns:
+            Tuple of (diameters_nm, n_candidates, success_mask). Values with
+            no candidate fall back to diameter_from_scatter() clamping;
+            success requires a primary residual < 1% and at least one
+            candidate. Invalid primary values give NaN with success=False.
+        """
+        target = np.atleast_1d(np.asarray(scatter_values, dtype=float)).ravel()
+        secondary = np.atleast_1d(np.asarray(secondary_values, dtype=float)).ravel()
+        if secondary.shape != target.shape:
+            raise ValueError(
+                f"Primary and secondary arrays differ in length: {len(target)} vs {len(secondary)}"
+            )
+
+        candidates = self.diameter_candidates(target, min_diameter, max_diameter, refine, channel)
+        n_candidates = np.sum(np.isfinite(candidates), axis=1)
+
+        # Log-space mismatch of the secondary channel for every candidate
+        predicted = self.scatter_at(np.nan_to_num(candidates, nan=min_diameter), secondary_channel)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mismatch = np.abs(np.log(predicted) - np.log(secondary)[:, None])
+        mismatch[~np.isfinite(mismatch)] = np.finfo(float).max
+        # Without a usable secondary value, keep the smallest-diameter solution
+        mismatch[~(np.isfinite(secondary) & (secondary > 0))] = 0.0
+        mismatch[~np.isfinite(candidates)] = np.inf
+
+        diameters = np.full(len(target), np.nan)
+        found = n_candidates > 0
+        if np.any(found):
+            best = np.argmin(mismatch[found], axis=1)
+            diameters[found] = candidates[found, best]
+
+        valid = np.isfinite(target) & (target > 0)
+        clamp = valid & ~found
+        if np.any(clamp):
+            diameters[clamp] = self._clamp_diameters(
+                target[clamp], self.branches(channel, min_diameter, max_diameter)
+            )
+
+        success = np.zeros(len(target), dtype=bool)
+        if np.any(found):
+            residual = np.abs(self.scatter_at(diameters[found], channel) - target[found])
+            success[found] = residual < 0.01 * target[found]
+
+        return diameters, n_candidates, success
+
+    def accuracy_report(
+        self,
+        n_samples: int = 50,
+        min_diameter: float = 30.0,
+        max_diameter: float = 200.0,
+        refine: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Compare table inversion against the exact Brent optimizer.
+
+        Computes exact FSC for n_samples diameters spread over the range,
+        then inverts them with both diameter_from_scatter() paths.
+
+        Args:
+            n_samples: Number of test diameters
+            min_diameter: Lower bound of test/search range (nm)
+            max_diameter: Upper bound of test/search range (nm)
+            refine: Use Newton refinement for the table path
+
+        Returns:
+            Dict with error statistics (nm and %), timings and speedup
+        """
+        calc = MieScatterCalculator(
+            wavelength_nm=self.wavelength_nm,
+            n_particle=self.n_particle,
+            n_medium=self.n_medium
+        )
+
+        # Stay off the exact bounds where the optimizer is least reliable
+        span = max_diameter - min_diameter
+        true_d = np.linspace(min_diameter + 0.01 * span, max_diameter - 0.01 * span, n_samples)
+        fsc = calc.batch_calculate(true_d)
+
+        start = time.perf_counter()
+        exact_d = np.array([
+            calc.diameter_from_scatter(v, min_diameter, max_diameter)[0] for v in fsc
+        ])
+        optimizer_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table_d, success = self.diameter_from_scatter(
+            fsc, min_diameter, max_diameter, refine=refine
+        )
+        table_time = time.perf_counter() - start
+
+        err_true = np.abs(table_d - true_d)
+        err_exact = np.abs(table_d - exact_d)
+
+        report = {
+            "n_samples": int(n_samples),
+            "diameter_range_nm": [float(min_diameter), float(max_diameter)],
+            "grid_points": int(len(self.diameters_nm)),
+            "grid_spacing_nm": float(np.mean(np.diff(self.diameters_nm))),
+            "refine": refine,
+            "success_rate": float(success.mean()),
+            "max_abs_error_nm": float(err_true.max()),
+            "mean_abs_error_nm": float(err_true.mean()),
+            "max_rel_error_pct": float(100 * (err_true / true_d).max()),
+            "max_abs_diff_vs_optimizer_nm": float(err_exact.max()),
+            "mean_abs_diff_vs_optimizer_nm": float(err_exact.mean()),
+            "optimizer_time_s": optimizer_time,
+            "table_time_s": table_time,
+            "speedup": optimizer_time / table_time if table_time > 0 else float('inf')
+        }
+
+        logger.info(
+            f"📏 Lookup table accuracy: max error {report['max_abs_error_nm']:.4f}nm "
+            f"(vs optimizer {report['max_abs_diff_vs_optimizer_nm']:.4f}nm), "
+            f"speedup {report['speedup']:.0f}×"
+        )
+
+        return report
+
 
 class FCMPASSCalibrator:
     """
@@ -553,7 +1419,8 @@ class FCMPASSCalibrator:
         self,
         wavelength_nm: float = 488.0,
         n_particle: float = 1.59,
-        n_medium: float = 1.33
+        n_medium: float = 1.33,
+        table_cache: Optional["MieTableCache"] = None
     ):
         """
         Initialize FCMPASS calibrator.
@@ -564,6 +1431,7 @@ class FCMPASSCalibrator:
                        Polystyrene: 1.59 (most common)
                        Silica: 1.46 (alternative)
             n_medium: Refractive index of medium (PBS: 1.33)
+            table_cache: Optional on-disk MieTableCache for the inverse curve
         """
         self.wavelength_nm = wavelength_nm
         self.n_particle = n_particle
@@ -573,7 +1441,8 @@ class FCMPASSCalibrator:
         self.mie_calc = MieScatterCalculator(
             wavelength_nm=wavelength_nm,
             n_particle=n_particle,
-            n_medium=n_medium
+            n_medium=n_medium,
+            table_cache=table_cache
         )
         
         # Calibration curve parameters (fitted from reference beads)
@@ -586,6 +1455,10 @@ class FCMPASSCalibrator:
         self.bead_fsc_measured: np.ndarray = np.array([])
         self.bead_fsc_theoretical: np.ndarray = np.array([])
         
+        # Precomputed calibrated Mie scatter → diameter curve (see build_inverse_curve);
+        # measured FSC goes through fsc_to_mie_poly first
+        self.inverse_curve: Optional[Dict[str, Any]] = None
+        
         logger.info(f"✓ FCMPASS Calibrator initialized: λ={wavelength_nm:.1f}nm, n={n_particle:.2f}")
     
     def fit_from_beads(
@@ -615,12 +1488,10 @@ class FCMPASSCalibrator:
         diameters = np.array(sorted(bead_measurements.keys()))
         fsc_measured = np.array([bead_measurements[d] for d in diameters])
         
-        # Calculate theoretical Mie scatter for each bead
-        fsc_theoretical = []
-        for diameter in diameters:
-            result = self.mie_calc.calculate_scattering_efficiency(diameter)
-            fsc_theoretical.append(result.forward_scatter)
-        fsc_theoretical = np.array(fsc_theoretical)
+        # Theoretical Mie scatter for all beads in one batched evaluation
+        x = (np.pi * diameters) / self.wavelength_nm
+        _, qsca, qback, g = _mie_efficiencies(self.mie_calc.m, x)
+        fsc_theoretical, _ = _scatter_proxies(diameters, qsca, qback, g)
         
         # Store for diagnostics
         self.bead_diameters = diameters
@@ -630,6 +1501,7 @@ class FCMPASSCalibrator:
         # Fit polynomial: measured_FSC → theoretical_Mie_scatter
         # This maps instrument units to physical Mie scatter
         self.fsc_to_mie_poly = np.polyfit(fsc_measured, fsc_theoretical, poly_degree)
+        self.inverse_curve = None  # Stale after a refit
         
         # Calculate fit quality
         fsc_pred = np.polyval(self.fsc_to_mie_poly, fsc_measured)
@@ -718,16 +1590,24 @@ class FCMPASSCalibrator:
         fsc_intensities: np.ndarray,
         min_diameter: float = 30.0,
         max_diameter: float = 200.0,
-        show_progress: bool = False
+        show_progress: bool = False,
+        use_lookup: bool = True
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Batch prediction for large datasets (optimized).
         
+        The calibration polynomial is evaluated once over the whole array and
+        the resulting Mie scatter values are inverted through the calculator's
+        cached lookup table - no per-event Python loop. Diameters agree with
+        predict_diameter() to within 0.01 nm inside the search bounds.
+        
         Args:
             fsc_intensities: Array of measured FSC values
             min_diameter: Minimum valid diameter (nm)
             max_diameter: Maximum valid diameter (nm)
             show_progress: Show progress for large arrays
+            use_lookup: If False, fall back to per-event predict_diameter()
+                       (exact optimizer, slow - for validation only)
         
         Returns:
             Tuple of (diameters, in_range_mask):
@@ -737,20 +1617,57 @@ class FCMPASSCalibrator:
         if not self.calibrated:
             raise RuntimeError("Calibrator not fitted. Call fit_from_beads() first.")
         
+        if self.fsc_to_mie_poly is None:
+            raise RuntimeError("Calibration polynomial is None. Re-fit calibrator.")
+        
+        fsc_intensities = np.asarray(fsc_intensities, dtype=float)
         n = len(fsc_intensities)
-        diameters = np.zeros(n)
-        in_range = np.zeros(n, dtype=bool)
         
         if show_progress and n > 1000:
             logger.info(f"🔄 Predicting diameters for {n:,} particles...")
         
-        for i, fsc in enumerate(fsc_intensities):
-            if show_progress and n > 10000 and i % 10000 == 0:
-                logger.info(f"  Progress: {i:,}/{n:,} ({100*i/n:.1f}%)")
+        if not use_lookup:
+            diameters = np.zeros(n)
+            in_range = np.zeros(n, dtype=bool)
+            for i, fsc in enumerate(fsc_intensities):
+                if show_progress and n > 10000 and i % 10000 == 0:
+                    logger.info(f"  Progress: {i:,}/{n:,} ({100*i/n:.1f}%)")
+                diameters[i], in_range[i] = self.predict_diameter(fsc, min_diameter, max_diameter)
+        else:
+            # Measured FSC → theoretical Mie scatter for every event at once
+            mie_scatter_calibrated = np.polyval(self.fsc_to_mie_poly, fsc_intensities)
+            
+            curve = self.inverse_curve
+            if (
+                curve is not None
+                and curve["min_diameter"] == min_diameter
+                and curve["max_diameter"] == max_diameter
+            ):
+                # Precomputed curve for these bounds: no full-range Mie table needed
+                diameters, _ = curve["table"].diameter_from_scatter(
+                    mie_scatter_calibrated,
+                    min_diameter=min_diameter,
+                    max_diameter=max_diameter
+                )
+            else:
+                diameters, _ = self.mie_calc.diameter_from_scatter_batch(
+                    mie_scatter_calibrated,
+                    min_diameter=min_diameter,
+                    max_diameter=max_diameter
+                )
+            
+            # Negative extrapolation → minimum diameter (as in predict_diameter)
+            negative = mie_scatter_calibrated <= 0
+            if np.any(negative):
+                logger.warning(
+                    f"Calibration extrapolation gave negative Mie scatter for "
+                    f"{int(negative.sum()):,} events. Using minimum diameter."
+                )
+                diameters[negative] = min_diameter
             
-            diameter, in_range_i = self.predict_diameter(fsc, min_diameter, max_diameter)
-            diameters[i] = diameter
-            in_range[i] = in_range_i
+            fsc_min = float(self.bead_fsc_measured.min())
+            fsc_max = float(self.bead_fsc_measured.max())
+            in_range = (fsc_intensities >= fsc_min) & (fsc_intensities <= fsc_max) & ~negative
         
         if show_progress and n > 1000:
             pct_in_range = 100 * in_range.sum() / n
@@ -792,6 +1709,128 @@ class FCMPASSCalibrator:
             "wavelength_nm": self.wavelength_nm,
             "n_particle": self.n_particle
         }
+    
+    def build_inverse_curve(
+        self,
+        min_diameter: float = 30.0,
+        max_diameter: float = 200.0,
+        n_points: int = 512
+    ) -> Dict[str, Any]:
+        """
+        Precompute the Mie scatter → diameter curve for these search bounds.
+        
+        The curve is a MieLookupTable restricted to [min_diameter,
+        max_diameter]. predict_batch() with the same bounds inverts through
+        it instead of the calculator's full 10-1000 nm table, so a loaded
+        calibration sizes events without any further Mie calculation.
+        
+        Args:
+            min_diameter: Minimum valid diameter (nm)
+            max_diameter: Maximum valid diameter (nm)
+            n_points: Grid size (512 over 30-200 nm keeps diameters within
+                     0.01 nm of the full-table result)
+        
+        Returns:
+            The curve dict (also stored in self.inverse_curve)
+        
+        Raises:
+            RuntimeError: If calibrator not fitted yet
+        """
+        if not self.calibrated:
+            raise RuntimeError("Calibrator not fitted. Call fit_from_beads() first.")
+        
+        self.inverse_curve = {
+            "min_diameter": float(min_diameter),
+            "max_diameter": float(max_diameter),
+            "table": MieLookupTable.build(
+                wavelength_nm=self.wavelength_nm,
+                n_particle=self.n_particle,
+                n_medium=self.n_medium,
+                min_diameter=min_diameter,
+                max_diameter=max_diameter,
+                n_points=n_points
+            ),
+        }
+        return self.inverse_curve
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Serialize the fitted calibration (JSON-compatible).
+        
+        Includes the bead table, polynomial, get_diagnostics() output and the
+        inverse curve if one was built.
+        
+        Raises:
+            RuntimeError: If calibrator not fitted yet
+        """
+        if not self.calibrated or self.fsc_to_mie_poly is None:
+            raise RuntimeError("Calibrator not fitted. Call fit_from_beads() first.")
+        
+        data: Dict[str, Any] = {
+            "wavelength_nm": float(self.wavelength_nm),
+            "n_particle": float(self.n_particle),
+            "n_medium": float(self.n_medium),
+            "beads": [
+                {"diameter_nm": float(d), "fsc_measured": float(m), "fsc_theoretical": float(t)}
+                for d, m, t in zip(self.bead_diameters, self.bead_fsc_measured, self.bead_fsc_theoretical)
+            ],
+            "fsc_to_mie_poly": [float(c) for c in self.fsc_to_mie_poly],
+            "diagnostics": self.get_diagnostics(),
+            "inverse_curve": None,
+        }
+        if self.inverse_curve is not None:
+            table = self.inverse_curve["table"]
+            data["inverse_curve"] = {
+                "min_diameter": self.inverse_curve["min_diameter"],
+                "max_diameter": self.inverse_curve["max_diameter"],
+                "diameters_nm": table.diameters_nm.tolist(),
+                "Q_ext": table.Q_ext.tolist(),
+                "Q_sca": table.Q_sca.tolist(),
+                "Q_back": table.Q_back.tolist(),
+                "g": table.g.tolist(),
+            }
+        return data
+    
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        table_cache: Optional["MieTableCache"] = None
+    ) -> "FCMPASSCalibrator":
+        """
+        Restore a calibrator from to_dict() output without refitting.
+        
+        Args:
+            data: Serialized calibration
+            table_cache: Optional MieTableCache for events outside the inverse curve
+        
+        Returns:
+            Fitted FCMPASSCalibrator
+        """
+        calibrator = cls(
+            wavelength_nm=data["wavelength_nm"],
+            n_particle=data["n_particle"],
+            n_medium=data["n_medium"],
+            table_cache=table_cache
+        )
+        beads = data["beads"]
+        calibrator.bead_diameters = np.array([b["diameter_nm"] for b in beads], dtype=float)
+        calibrator.bead_fsc_measured = np.array([b["fsc_measured"] for b in beads], dtype=float)
+        calibrator.bead_fsc_theoretical = np.array([b["fsc_theoretical"] for b in beads], dtype=float)
+        calibrator.fsc_to_mie_poly = np.array(data["fsc_to_mie_poly"], dtype=float)
+        calibrator.calibrated = True
+        
+        curve = data.get("inverse_curve")
+        if curve is not None:
+            calibrator.inverse_curve = {
+                "min_diameter": float(curve["min_diameter"]),
+                "max_diameter": float(curve["max_diameter"]),
+                "table": MieLookupTable(
+                    calibrator.wavelength_nm, calibrator.n_particle, calibrator.n_medium,
+                    curve["diameters_nm"], curve["Q_ext"], curve["Q_sca"], curve["Q_back"], curve["g"]
+                ),
+            }
+        return calibrator
 
 
 # Demo and testing
@@ -0,0 +1,182 @@
+"""
+FSC/SSC Ratio Sizing Index
+==========================
+
+Purpose: Map measured FSC/SSC ratios to particle diameters against a
+         theoretical ratio curve in O(N log M) time and O(N) memory.
+
+The brute-force approach builds an (n_events × n_diameters) difference
+matrix and takes argmin - for 1M events against 1000 diameters that is
+8 GB of float64. This index instead keeps:
+
+- the ratio curve sorted by value, so the nearest theoretical ratio is found
+  with one np.searchsorted (bisection) per event; and
+- the curve's monotonic branches in diameter order, so a ratio can be
+  interpolated within the first branch that brackets it. The ratio curve is
+  non-monotonic in the Mie resonance region, so a single bisection over the
+  whole curve would be wrong there.
+
+Author: CRMIT Backend Team
+"""
+
+from typing import Tuple, List
+
+import numpy as np
+
+from .mie_scatter import MieLookupTable
+
+
+class RatioSizingIndex:
+    """
+    Sorted index over a theoretical FSC/SSC ratio curve.
+
+    Example:
+        >>> model = DetectorScatterModel(wavelength_nm=488, n_particle=1.40)
+        >>> diameters = np.linspace(30, 500, 1000)
+        >>> index = RatioSizingIndex(diameters, model.fsc_ssc_ratio(diameters))
+        >>> d_nearest, matched, idx = index.nearest(measured_ratios)
+        >>> d_interp, ok = index.invert(measured_ratios)
+    """
+
+    def __init__(self, diameters_nm: np.ndarray, ratios: np.ndarray):
+        """
+        Build the index.
+
+        Args:
+            diameters_nm: Diameter grid (nm), strictly increasing
+            ratios: Theoretical FSC/SSC ratio at each diameter. Non-finite
+                    entries are excluded from matching.
+
+        Raises:
+            ValueError: If shapes differ, the grid is not increasing, or no
+                        finite ratios remain
+        """
+        diameters = np.asarray(diameters_nm, dtype=float).ravel()
+        values = np.asarray(ratios, dtype=float).ravel()
+        if diameters.shape != values.shape:
+            raise ValueError(
+                f"diameters and ratios must have the same length, got {len(diameters)} and {len(values)}"
+            )
+        if len(diameters) > 1 and np.any(np.diff(diameters) <= 0):
+            raise ValueError("diameters must be strictly increasing")
+
+        finite = np.isfinite(values)
+        if not np.any(finite):
+            raise ValueError("No finite theoretical ratios to index")
+
+        self.diameters_nm = diameters
+        self.ratios = values
+        # Positions of usable entries in the caller's grid (reported as matched indices)
+        self._grid_index = np.nonzero(finite)[0]
+
+        usable = values[finite]
+        # Stable sort: within runs of equal ratios the smallest grid index comes first
+        self._order = np.argsort(usable, kind='stable')
+        self._sorted = usable[self._order]
+
+        self._branches: List[Tuple[int, int]] = MieLookupTable._segments(usable, 0, len(usable) - 1)
+
+    @property
+    def branches(self) -> List[Tuple[float, float]]:
+        """Diameter ranges (nm) of the monotonic branches of the ratio curve."""
+        d = self.diameters_nm[self._grid_index]
+        return [(float(d[start]), float(d[end])) for start, end in self._branches]
+
+    def _first_of_run(self, values: np.ndarray) -> np.ndarray:
+        """Usable-entry index of the first grid point holding each (existing) ratio value."""
+        return self._order[np.searchsorted(self._sorted, values, side='left')]
+
+    def nearest(
+        self,
+        measured_ratios: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Closest theoretical grid point for each measured ratio.
+
+        Gives the same result as argmin(|measured - theoretical|) over the
+        whole curve, including ties (lowest grid index wins).
+
+        Args:
+            measured_ratios: Array of measured FSC/SSC ratios
+
+        Returns:
+            Tuple of (diameters_nm, matched_ratios, matched_indices). Entries
+            for non-finite measurements are NaN.
+        """
+        measured = np.asarray(measured_ratios, dtype=float).ravel()
+        n = len(measured)
+        estimated = np.full(n, np.nan)
+        matched = np.full(n, np.nan)
+        indices = np.full(n, np.nan)
+
+        valid = np.isfinite(measured)
+        if not np.any(valid):
+            return estimated, matched, indices
+
+        target = measured[valid]
+        m = len(self._sorted)
+        pos = np.searchsorted(self._sorted, target, side='left')
+        below = self._sorted[np.clip(pos - 1, 0, m - 1)]
+        above = self._sorted[np.clip(pos, 0, m - 1)]
+
+        below_first = self._first_of_run(below)
+        above_first = self._first_of_run(above)
+        diff_below = np.where(pos > 0, np.abs(target - below), np.inf)
+        diff_above = np.where(pos < m, np.abs(target - above), np.inf)
+
+        best = np.where(
+            diff_below < diff_above, below_first,
+            np.where(diff_above < diff_below, above_first, np.minimum(below_first, above_first))
+        )
+
+        grid_best = self._grid_index[best]
+        estimated[valid] = self.diameters_nm[grid_best]
+        matched[valid] = self.ratios[grid_best]
+        indices[valid] = grid_best
+        return estimated, matched, indices
+
+    def invert(
+        self,
+        measured_ratios: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Interpolated diameter for each measured ratio.
+
+        Each ratio is bisected within the monotonic branches of the curve in
+        diameter order and linearly interpolated on the first (smallest
+        diameter) branch that brackets it. Ratios outside the whole curve
+        fall back to the nearest grid point.
+
+        Args:
+            measured_ratios: Array of measured FSC/SSC ratios
+
+        Returns:
+            Tuple of (diameters_nm, bracketed_mask). bracketed is False for
+            nearest-point fallbacks and non-finite inputs (diameter NaN).
+        """
+        measured = np.asarray(measured_ratios, dtype=float).ravel()
+        diameters = np.full(len(measured), np.nan)
+        bracketed = np.zeros(len(measured), dtype=bool)
+
+        valid = np.isfinite(measured)
+        grid_d = self.diameters_nm[self._grid_index]
+        grid_r = self.ratios[self._grid_index]
+
+        for start, end in self._branches:
+            open_ = valid & ~bracketed
+            if not np.any(open_):
+                break
+            seg_d = grid_d[start:end + 1]
+            seg_r = grid_r[start:end + 1]
+            if seg_r[-1] < seg_r[0]:
+                seg_d, seg_r = seg_d[::-1], seg_r[::-1]
+            hit = open_ & (measured >= seg_r[0]) & (measured <= seg_r[-1])
+            if np.any(hit):
+                diameters[hit] = np.interp(measured[hit], seg_r, seg_d)
+                bracketed |= hit
+
+        fallback = valid & ~bracketed
+        if np.any(fallback):
+            diameters[fallback], _, _ = self.nearest(measured[fallback])
+
+        return diameters, bracketed
@@ -14,7 +14,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict
+from typing import Optional, Tuple, List, Dict, Any
 from loguru import logger
 
 # Set style for publication-quality plots
@@ -766,7 +766,8 @@ def calculate_particle_size(
     wavelength_nm: float = 488.0,
     n_particle: float = 1.40,
     n_medium: float = 1.33,
-    calibration_beads: Optional[Dict[float, float]] = None
+    calibration_beads: Optional[Dict[float, float]] = None,
+    calibrator: Optional[Any] = None
 ) -> pd.DataFrame:
     """
     Calculate particle size from FSC using rigorous Mie scattering theory.
@@ -791,6 +792,8 @@ def calculate_particle_size(
         calibration_beads: Optional dict of {diameter_nm: measured_fsc} for calibration
                           If None, uses default polystyrene bead calibration
                           Example: {100: 15000, 200: 58000, 300: 125000}
+        calibrator: Optional fitted FCMPASSCalibrator (e.g. from CalibrationStore.load()).
+                   Skips bead fitting entirely; calibration_beads is ignored.
         
     Returns:
         DataFrame with added 'particle_size_nm' column
@@ -807,8 +810,13 @@ def calculate_particle_size(
         >>> # Custom calibration for specific instrument
         >>> custom_beads = {100: 12500, 200: 51000, 300: 118000}
         >>> df = calculate_particle_size(data, calibration_beads=custom_beads)
+        >>> 
+        >>> # Stored calibration for an instrument (no refit)
+        >>> cal = CalibrationStore.default().load("ZE5-01")
+        >>> df = calculate_particle_size(data, calibrator=cal)
     """
     from src.physics.mie_scatter import MieScatterCalculator, FCMPASSCalibrator
+    from src.physics.mie_cache import MieTableCache
     
     df = data.copy()
     
@@ -837,7 +845,7 @@ def calculate_particle_size(
     logger.info(f"🔬 Calculating particle sizes using Mie theory (λ={wavelength_nm:.0f}nm)")
     
     # Set up calibration if provided, otherwise use default polystyrene beads
-    if calibration_beads is None:
+    if calibrator is None and calibration_beads is None:
         # Default calibration for typical ZE5 Bio-Rad with polystyrene beads
         # These values are instrument-specific and should be measured for each cytometer
         logger.info("Using default polystyrene bead calibration (ESTIMATE - measure for your instrument!)")
@@ -854,15 +862,16 @@ def calculate_particle_size(
             calibration_beads = {d: fsc * scale_factor for d, fsc in calibration_beads.items()}
             logger.info(f"  Scaled calibration by {scale_factor:.2f}× based on 95th percentile FSC={fsc_p95:.0f}")
     
-    # Create and fit calibrator
-    calibrator = FCMPASSCalibrator(
-        wavelength_nm=wavelength_nm,
-        n_particle=1.59 if calibration_beads else n_particle,  # Polystyrene for beads
-        n_medium=n_medium
-    )
-    
     try:
-        calibrator.fit_from_beads(calibration_beads, poly_degree=2)
+        if calibrator is None:
+            # Create and fit calibrator
+            calibrator = FCMPASSCalibrator(
+                wavelength_nm=wavelength_nm,
+                n_particle=1.59 if calibration_beads else n_particle,  # Polystyrene for beads
+                n_medium=n_medium,
+                table_cache=MieTableCache.default()  # Shared on-disk Mie tables across runs
+            )
+            calibrator.fit_from_beads(calibration_beads, poly_degree=2)
         
         # Batch predict diameters (fast with calibration)
         fsc_arr = np.asarray(fsc_values)
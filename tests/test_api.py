@@ -0,0 +1,554 @@
+"""
+API Tests
+=========
+
+Purpose: Test the upload endpoints and the job worker pool against a
+temporary SQLite database (aiosqlite) through httpx's ASGI transport.
+
+Author: CRMIT Backend Team
+Date: November 21, 2025
+"""
+
+import asyncio
+import contextlib
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, exc, select, text  # type: ignore[import-not-found]
+
+from src.api.config import get_settings
+from src.api.main import app
+from src.api.routers import upload
+from src.api.routers.upload import HEADER_CHECK_BYTES, fcs_header_ok, stream_to_disk
+from src.api.workers import JobWorkerPool, batch_summary, shutdown_worker_pool
+from src.database import connection
+from src.database.connection import DatabaseSession
+from src.database.crud import (
+    create_processing_job,
+    create_sample,
+    get_child_jobs,
+    get_job_by_id,
+    update_job_progress,
+    update_job_status,
+)
+from src.database.models import FCSResult, Sample
+from src.parsers.conversion_manifest import content_hash
+
+
+SAMPLE_FCS = Path(__file__).parent.parent / "nanoFACS" / "EXP 6-10-2025" / "water.fcs"
+
+pytestmark = pytest.mark.anyio
+
+
+def _sleep_job(job_id: str, seconds: float) -> dict:
+    """Job function that only takes time."""
+    time.sleep(seconds)
+    return {"slept": seconds}
+
+
+def _touch_job(job_id: str, marker: str) -> dict:
+    """Job function that leaves a marker file behind when it runs."""
+    Path(marker).touch()
+    return {"marker": marker}
+
+
+def _timed_job(job_id: str, file_path: str, parquet_dir: str) -> dict:
+    """Stand-in for run_fcs_job that records when it ran."""
+    started = time.time()
+    time.sleep(0.3)
+    return {"file_name": Path(file_path).name, "started": started, "finished": time.time()}
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def database(tmp_path, monkeypatch):
+    """Point the application at a fresh SQLite database and data dirs."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "database_url", f"sqlite+aiosqlite:///{tmp_path / 'crmit.sqlite'}")
+    monkeypatch.setattr(settings, "upload_dir", tmp_path / "uploads")
+    monkeypatch.setattr(settings, "parquet_dir", tmp_path / "parquet")
+    monkeypatch.setattr(settings, "max_workers", 1)
+    settings.upload_dir.mkdir()
+    settings.parquet_dir.mkdir()
+
+    await connection.close_connections()
+    await connection.init_database()
+    yield settings
+    await shutdown_worker_pool()
+    await connection.close_connections()
+
+
+@pytest.fixture
+async def client(database):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _new_job(job_type: str = "fcs_parse") -> str:
+    job_id = str(uuid.uuid4())
+    async with DatabaseSession() as db:
+        await create_processing_job(db, job_id=job_id, job_type=job_type)
+    return job_id
+
+
+async def _wait_for_job(client: httpx.AsyncClient, job_id: str, timeout: float = 60) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = await client.get(f"/api/v1/jobs/{job_id}")
+        assert response.status_code == 200
+        job = response.json()
+        if job["status"] in ("completed", "failed", "cancelled"):
+            return job
+        await asyncio.sleep(0.1)
+    pytest.fail(f"Job {job_id} did not finish within {timeout}s")
+
+
+class TestFCSUpload:
+    """Test upload → worker pool → stored results."""
+
+    async def test_upload_completes_with_result(self, client):
+        """An uploaded FCS file is parsed and its FCSResult row stored"""
+        with open(SAMPLE_FCS, "rb") as f:
+            response = await client.post(
+                "/api/v1/upload/fcs",
+                files={"file": ("water.fcs", f, "application/octet-stream")},
+                data={"treatment": "Control"},
+            )
+        assert response.status_code == 200, response.text
+        body = response.json()
+
+        job = await _wait_for_job(client, body["job_id"])
+        assert job["status"] == "completed", job.get("error_message")
+        assert job["progress_percent"] == 100
+
+        async with DatabaseSession() as db:
+            sample = (await db.execute(select(Sample).where(Sample.sample_id == body["sample_id"]))).scalar_one()
+            result = (await db.execute(select(FCSResult).where(FCSResult.sample_id == sample.id))).scalar_one()
+        assert sample.processing_status == "completed"
+        assert result.total_events == 18033
+
+
+class TestJobWorkerPool:
+    """Test job lifecycle rules of the worker pool."""
+
+    async def test_timeout_marks_job_failed(self, database):
+        """A job running past the timeout is marked failed"""
+        job_id = await _new_job()
+        pool = JobWorkerPool(max_workers=1, timeout_seconds=0.3)
+        try:
+            await (await pool.submit(job_id, _sleep_job, 1.0))
+        finally:
+            await pool.shutdown()
+
+        async with DatabaseSession() as db:
+            job = await get_job_by_id(db, job_id)
+        assert job.status == "failed"
+        assert "Timed out" in job.error_message
+
+    async def test_timeout_frees_worker(self, database, tmp_path):
+        """A timed-out job's worker is terminated, so the next job runs at once"""
+        stuck, following = await _new_job(), await _new_job()
+        marker = tmp_path / "ran"
+        pool = JobWorkerPool(max_workers=1, timeout_seconds=0.5)
+        started = time.monotonic()
+        try:
+            first = await pool.submit(stuck, _sleep_job, 60)
+            second = await pool.submit(following, _touch_job, str(marker))
+            await asyncio.gather(first, second)
+        finally:
+            await pool.shutdown()
+
+        assert time.monotonic() - started < 30
+        assert marker.exists()
+        async with DatabaseSession() as db:
+            assert (await get_job_by_id(db, stuck)).status == "failed"
+            assert (await get_job_by_id(db, following)).status == "completed"
+
+    async def test_jobs_on_terminated_worker_are_retried(self, database):
+        """A job sharing the pool with a timed-out job is rerun, not failed"""
+        stuck, sibling = await _new_job(), await _new_job()
+        pool = JobWorkerPool(max_workers=2, timeout_seconds=1.0)
+        try:
+            first = await pool.submit(stuck, _sleep_job, 60)
+            await asyncio.sleep(0.5)
+            second = await pool.submit(sibling, _sleep_job, 0.6)
+            await asyncio.gather(first, second)
+        finally:
+            await pool.shutdown()
+
+        async with DatabaseSession() as db:
+            assert (await get_job_by_id(db, stuck)).status == "failed"
+            job = await get_job_by_id(db, sibling)
+        assert job.status == "completed"
+        assert job.result_data == {"slept": 0.6}
+
+    async def test_cancelled_running_job_not_failed(self, database):
+        """A job cancelled while running stays cancelled when it times out"""
+        job_id = await _new_job()
+        pool = JobWorkerPool(max_workers=1, timeout_seconds=0.5)
+        try:
+            task = await pool.submit(job_id, _sleep_job, 60)
+            await asyncio.sleep(0.2)
+            async with DatabaseSession() as db:
+                assert (await get_job_by_id(db, job_id)).status == "running"
+                await update_job_status(db, job_id, "cancelled")
+            await task
+        finally:
+            await pool.shutdown()
+
+        async with DatabaseSession() as db:
+            job = await get_job_by_id(db, job_id)
+        assert job.status == "cancelled"
+        assert job.error_message is None
+
+    async def test_cancelled_job_is_skipped(self, database, tmp_path):
+        """A job cancelled before it starts never runs"""
+        job_id = await _new_job()
+        async with DatabaseSession() as db:
+            await update_job_status(db, job_id, "cancelled")
+
+        marker = tmp_path / "ran"
+        pool = JobWorkerPool(max_workers=1)
+        try:
+            await (await pool.submit(job_id, _touch_job, str(marker)))
+        finally:
+            await pool.shutdown()
+
+        assert not marker.exists()
+        async with DatabaseSession() as db:
+            job = await get_job_by_id(db, job_id)
+        assert job.status == "cancelled"
+
+    async def test_late_progress_keeps_job_finished(self, database):
+        """Progress reported after completion does not reopen the job"""
+        job_id = await _new_job()
+        async with DatabaseSession() as db:
+            await update_job_status(db, job_id, "completed", result_data={"ok": True})
+            await update_job_progress(db, job_id, 40, "Parsing")
+            job = await get_job_by_id(db, job_id)
+        assert job.status == "completed"
+        assert job.progress_percent == 100
+        assert job.current_step != "Parsing"
+
+
+class TestStreamUpload:
+    """Test stream_to_disk and POST /upload/fcs/stream."""
+
+    MB = 1024 * 1024
+
+    @pytest.fixture
+    def one_mb_limit(self, monkeypatch):
+        monkeypatch.setattr(get_settings(), "max_upload_size_mb", 1)
+
+    async def test_running_size_limit(self, tmp_path, one_mb_limit):
+        """Bytes past the limit are rejected and the partial file removed"""
+        destination = tmp_path / "big.fcs"
+        chunk = b"FCS3.1" + b" " * (self.MB // 2 - 6)
+        with pytest.raises(HTTPException) as exc:
+            await stream_to_disk(_chunks(chunk, chunk, chunk), destination, header_check=fcs_header_ok)
+        assert exc.value.status_code == 413
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_header_split_across_chunks(self, tmp_path):
+        """The header is checked once HEADER_CHECK_BYTES have arrived"""
+        destination = tmp_path / "bad.fcs"
+        with pytest.raises(HTTPException) as exc:
+            await stream_to_disk(_chunks(b"FC", b"X" * HEADER_CHECK_BYTES), destination, header_check=fcs_header_ok)
+        assert exc.value.status_code == 400
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_short_file_header_checked(self, tmp_path):
+        """Files shorter than HEADER_CHECK_BYTES are checked at the end"""
+        with pytest.raises(HTTPException) as exc:
+            await stream_to_disk(_chunks(b"garbage"), tmp_path / "short.fcs", header_check=fcs_header_ok)
+        assert exc.value.status_code == 400
+        assert list(tmp_path.iterdir()) == []
+
+        stored = await stream_to_disk(_chunks(b"FCS3.1"), tmp_path / "tiny.fcs", header_check=fcs_header_ok)
+        assert stored.path.read_bytes() == b"FCS3.1"
+        assert stored.size_bytes == 6
+
+    async def test_declared_length_rejected(self, client, database, one_mb_limit):
+        """A declared Content-Length over the limit is rejected up front"""
+        response = await client.post(
+            "/api/v1/upload/fcs/stream",
+            params={"filename": "big.fcs"},
+            content=b"FCS3.1" + b" " * (2 * self.MB),
+        )
+        assert response.status_code == 413
+        assert list(database.upload_dir.iterdir()) == []
+
+    async def test_chunked_body_size_limit(self, client, database, one_mb_limit):
+        """A chunked body without Content-Length is counted as it arrives"""
+        chunk = b"FCS3.1" + b" " * (self.MB // 2 - 6)
+        response = await client.post(
+            "/api/v1/upload/fcs/stream",
+            params={"filename": "big.fcs"},
+            content=_chunks(chunk, chunk, chunk),
+        )
+        assert response.status_code == 413
+        assert list(database.upload_dir.iterdir()) == []
+
+    @pytest.mark.parametrize("body", [b"NOTFCS" + b"\0" * 94, b"garbage"], ids=["bad-header", "short"])
+    async def test_invalid_header_rejected(self, client, database, body):
+        """Non-FCS bodies are rejected with 400 and nothing is stored"""
+        response = await client.post(
+            "/api/v1/upload/fcs/stream",
+            params={"filename": "bad.fcs"},
+            content=body,
+        )
+        assert response.status_code == 400
+        assert list(database.upload_dir.iterdir()) == []
+
+    async def test_content_hash_matches_manifest(self, client, database):
+        """The reported hash is ConversionManifest's hash of the stored file"""
+        response = await client.post(
+            "/api/v1/upload/fcs/stream",
+            params={"filename": "water.fcs"},
+            content=SAMPLE_FCS.read_bytes(),
+        )
+        assert response.status_code == 200, response.text
+
+        stored = list(database.upload_dir.iterdir())
+        assert len(stored) == 1 and stored[0].name.endswith("_water.fcs")
+        assert response.json()["content_hash"] == content_hash(stored[0]) == content_hash(SAMPLE_FCS)
+
+
+class TestBatchUpload:
+    """Test POST /upload/batch and batch job aggregation."""
+
+    @pytest.fixture
+    def timed_jobs(self, database, monkeypatch):
+        """Process FCS uploads with _timed_job on three workers."""
+        monkeypatch.setattr(database, "max_workers", 3)
+        monkeypatch.setitem(upload.UPLOAD_KINDS, "fcs", ("file_path_fcs", "fcs_parse", _timed_job, None))
+
+    @staticmethod
+    def _files(*names: str) -> list:
+        return [("files", (name, b"FCS3.1" + b" " * 100, "application/octet-stream")) for name in names]
+
+    async def test_children_gated_and_aggregated(self, client, timed_jobs):
+        """Each file gets a child job; max_concurrency caps them; status aggregates"""
+        response = await client.post(
+            "/api/v1/upload/batch",
+            params={"max_concurrency": 1},
+            files=self._files("a.fcs", "b.fcs", "c.fcs"),
+        )
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert body["uploaded"] == 3 and body["failed"] == 0
+        batch_id = body["batch_job_id"]
+
+        running = (await client.get(f"/api/v1/jobs/{batch_id}")).json()
+        assert running["status"] in ("pending", "running")
+        assert running["summary"]["total"] == 3
+        assert running["progress_percent"] < 100
+
+        await shutdown_worker_pool()
+        async with DatabaseSession() as db:
+            children = await get_child_jobs(db, batch_id)
+        assert [child.job_id for child in children] == body["job_ids"]
+        assert all(child.parent_job_id == batch_id for child in children)
+
+        # One file at a time despite three workers
+        spans = sorted((child.result_data["started"], child.result_data["finished"]) for child in children)
+        assert all(finished <= started for (_, finished), (started, _) in zip(spans, spans[1:]))
+
+        finished = (await client.get(f"/api/v1/jobs/{batch_id}")).json()
+        assert finished["status"] == "completed"
+        assert finished["progress_percent"] == 100
+        assert finished["summary"]["completed"] == 3
+        assert sorted(child["file_name"][-5:] for child in finished["children"]) == ["a.fcs", "b.fcs", "c.fcs"]
+
+    async def test_partial_save_failures(self, client, timed_jobs):
+        """Files that cannot be saved are reported; the rest are queued"""
+        files = self._files("good.fcs") + [
+            ("files", ("bad.fcs", b"NOTFCS" + b"\0" * 100, "application/octet-stream")),
+            ("files", ("notes.pdf", b"%PDF-1.4", "application/pdf")),
+        ]
+        response = await client.post("/api/v1/upload/batch", files=files)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert body["success"] is False
+        assert body["uploaded"] == 1 and body["failed"] == 2
+        assert [d["status"] for d in body["details"]] == ["queued", "failed", "failed"]
+        assert "Unsupported file type" in body["details"][2]["error"]
+
+        await shutdown_worker_pool()
+        finished = (await client.get(f"/api/v1/jobs/{body['batch_job_id']}")).json()
+        assert finished["status"] == "completed"
+        assert finished["summary"]["total"] == 1
+
+    async def test_cancelled_batch_stays_cancelled(self, client, timed_jobs):
+        """Cancelling a batch cancels waiting files and is not undone"""
+        response = await client.post(
+            "/api/v1/upload/batch",
+            params={"max_concurrency": 1},
+            files=self._files("a.fcs", "b.fcs", "c.fcs"),
+        )
+        batch_id = response.json()["batch_job_id"]
+
+        cancelled = await client.delete(f"/api/v1/jobs/{batch_id}")
+        assert cancelled.status_code == 200, cancelled.text
+
+        await shutdown_worker_pool()
+        finished = (await client.get(f"/api/v1/jobs/{batch_id}")).json()
+        assert finished["status"] == "cancelled"
+        assert finished["summary"]["cancelled"] >= 2
+        assert finished["summary"]["completed"] + finished["summary"]["cancelled"] == 3
+
+    def test_summary_of_cancelled_children(self):
+        """A batch whose children were all cancelled is cancelled"""
+        def child(status):
+            return type("Job", (), {"status": status, "progress_percent": 0})()
+
+        assert batch_summary([child("cancelled"), child("failed")])["status"] == "cancelled"
+        assert batch_summary([child("cancelled"), child("completed")])["status"] == "completed"
+        assert batch_summary([child("failed"), child("failed")])["status"] == "failed"
+
+
+class TestConnectionPool:
+    """Test engine pool wiring and checkout metrics."""
+
+    async def test_pool_sized_from_settings(self, database, monkeypatch):
+        """Pool size, overflow and timeout come from Settings; metrics count checkouts and timeouts"""
+        monkeypatch.setattr(database, "db_pool_size", 2)
+        monkeypatch.setattr(database, "db_max_overflow", 1)
+        monkeypatch.setattr(database, "db_pool_timeout_seconds", 0.2)
+        await connection.close_connections()
+        engine = connection.get_engine()
+        assert isinstance(engine.pool, connection.MeteredAsyncQueuePool)
+        assert engine.pool.size() == 2
+        assert engine.pool.timeout() == 0.2
+        connection.pool_metrics.reset()
+
+        async with contextlib.AsyncExitStack() as stack:
+            for _ in range(3):
+                conn = await stack.enter_async_context(engine.connect())
+                await conn.execute(text("SELECT 1"))
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+            status = connection.get_pool_status()
+
+        assert status["size"] == 2
+        assert status["checked_out"] == 3
+        assert status["overflow"] == 1
+        assert status["max_overflow"] == 1
+        assert status["checkouts"] == 3
+        assert status["timeouts"] == 1
+
+    @pytest.mark.parametrize("url, expected", [
+        ("postgresql+asyncpg://crmit:secret@db/crmit", {"prepared_statement_cache_size": 7}),
+        ("sqlite+aiosqlite:///crmit.sqlite", {}),
+    ])
+    def test_connect_args_only_for_asyncpg(self, monkeypatch, url, expected):
+        """The statement cache size is passed to asyncpg only"""
+        settings = get_settings()
+        monkeypatch.setattr(settings, "database_url", url)
+        monkeypatch.setattr(settings, "db_statement_cache_size", 7)
+        monkeypatch.setattr(connection, "_engine", None)
+        calls = []
+        monkeypatch.setattr(connection, "create_async_engine", lambda *args, **kwargs: calls.append(kwargs))
+
+        connection.get_engine()
+        assert calls[0]["connect_args"] == expected
+        assert calls[0]["poolclass"] is connection.MeteredAsyncQueuePool
+
+
+class TestListEndpoints:
+    """Test GET /jobs and GET /samples (filters, joins, query count)."""
+
+    @pytest.fixture
+    async def seeded(self, database):
+        """Three samples and five jobs, one of them without a sample."""
+        async with DatabaseSession() as db:
+            cd81 = await create_sample(db, "S1_CD81", treatment="CD81", file_path_fcs="s1.fcs")
+            iso = await create_sample(db, "S2_ISO", treatment="ISO", file_path_nta="s2.txt")
+            both = await create_sample(
+                db, "S3_CD81", treatment="CD81", file_path_fcs="s3.fcs", file_path_nta="s3.txt"
+            )
+            for job_id, job_type, sample, final in [
+                ("job-1", "fcs_parse", cd81, "completed"),
+                ("job-2", "nta_parse", iso, "failed"),
+                ("job-3", "batch_process", None, None),
+                ("job-4", "fcs_parse", both, "completed"),
+                ("job-5", "fcs_parse", cd81, "failed"),
+            ]:
+                await create_processing_job(db, job_id, job_type, sample_id=sample.id if sample else None)
+                if final:
+                    await update_job_status(db, job_id, final, error_message="boom" if final == "failed" else None)
+
+    @contextlib.contextmanager
+    def _count_statements(self):
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = connection.get_engine().sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    async def test_job_filters_apply_to_count_and_page(self, client, seeded):
+        """total and the page use the same filters; pagination only limits the page"""
+        body = (await client.get("/api/v1/jobs/", params={"job_type": "fcs_parse", "limit": 2})).json()
+        assert body["total"] == 3
+        assert len(body["jobs"]) == 2
+        assert all(job["job_type"] == "fcs_parse" for job in body["jobs"])
+
+        body = (await client.get(
+            "/api/v1/jobs/", params={"job_type": "fcs_parse", "status_filter": "failed"}
+        )).json()
+        assert body["total"] == 1
+        assert [job["job_id"] for job in body["jobs"]] == ["job-5"]
+        assert body["jobs"][0]["error_message"] == "boom"
+
+    async def test_job_sample_names_from_outer_join(self, client, seeded):
+        """Jobs carry their sample's name; jobs without a sample are still listed"""
+        body = (await client.get("/api/v1/jobs/")).json()
+        assert body["total"] == 5
+        names = {job["job_id"]: job["sample_id"] for job in body["jobs"]}
+        assert names == {
+            "job-1": "S1_CD81", "job-2": "S2_ISO", "job-3": None, "job-4": "S3_CD81", "job-5": "S1_CD81",
+        }
+
+    async def test_sample_filters_and_file_flags(self, client, seeded):
+        """Sample filters apply to total and page; has_* reflect stored file paths"""
+        body = (await client.get("/api/v1/samples/", params={"treatment": "CD81"})).json()
+        assert body["total"] == 2
+        flags = {s["sample_id"]: (s["has_fcs"], s["has_nta"], s["has_tem"]) for s in body["samples"]}
+        assert flags == {"S1_CD81": (True, False, False), "S3_CD81": (True, True, False)}
+
+        body = (await client.get("/api/v1/samples/", params={"skip": 1, "limit": 1})).json()
+        assert body["total"] == 3
+        assert [s["sample_id"] for s in body["samples"]] == ["S2_ISO"]
+        assert body["samples"][0]["has_nta"] is True and body["samples"][0]["has_fcs"] is False
+
+    @pytest.mark.parametrize("path", ["/api/v1/jobs/", "/api/v1/samples/"])
+    async def test_constant_statement_count(self, client, seeded, path):
+        """A list request runs one count and one page query, however many rows it returns"""
+        counts = []
+        for limit in (1, 100):
+            with self._count_statements() as statements:
+                response = await client.get(path, params={"limit": limit})
+            assert response.status_code == 200
+            counts.append(len(statements))
+        assert counts == [2, 2]
@@ -11,7 +11,17 @@ Tests cover:
 
 import pytest
 import numpy as np
-from src.physics.mie_scatter import MieScatterCalculator, MieScatterResult
+from src.physics.mie_scatter import (
+    MieScatterCalculator, MieScatterResult, MieLookupTable, FCMPASSCalibrator
+)
+from src.physics.mie_cache import MieTableCache
+from src.physics.parallel import MieBatchExecutor
+from src.physics.detector_scatter import DetectorGeometry, DetectorScatterModel
+from src.physics.ratio_index import RatioSizingIndex
+from src.physics.calibration_store import CalibrationStore
+from src.physics.benchmark import (
+    BenchmarkCase, BenchmarkHistory, BenchmarkResult, BenchmarkRun, measure, run_benchmarks
+)
 
 
 class TestMieScatterCalculator:
@@ -348,3 +358,556 @@ class TestPhysicalConsistency:
             # Check that we have some wavelength dependence
             assert max(q_sca_values) > min(q_sca_values), \
                 f"Should see wavelength dependence for {diameter}nm particle"
+
+
+@pytest.fixture(scope="module")
+def lookup_calculator():
+    """Calculator shared across tests so its lookup table is built once."""
+    return MieScatterCalculator(wavelength_nm=488.0, n_particle=1.40, n_medium=1.33)
+
+
+@pytest.fixture(scope="module")
+def fitted_calibrator():
+    """Polystyrene bead calibrator fitted on three reference beads."""
+    cal = FCMPASSCalibrator(wavelength_nm=488.0, n_particle=1.59, n_medium=1.33)
+    cal.fit_from_beads({100: 15000, 200: 58000, 300: 125000}, poly_degree=2)
+    return cal
+
+
+class TestMieLookupTable:
+    """Tests for vectorized lookup-table inversion."""
+
+    @pytest.fixture
+    def table(self, lookup_calculator):
+        return lookup_calculator.get_lookup_table()
+
+    def test_table_matches_scalar_path(self, lookup_calculator, table):
+        """Tabulated FSC equals calculate_scattering_efficiency at grid nodes."""
+        for i in [0, 500, 1999]:
+            result = lookup_calculator.calculate_scattering_efficiency(
+                table.diameters_nm[i], validate=False
+            )
+            assert table.forward_scatter[i] == pytest.approx(result.forward_scatter, rel=1e-12)
+            assert table.side_scatter[i] == pytest.approx(result.side_scatter, rel=1e-12)
+
+    def test_table_is_cached(self, lookup_calculator, table):
+        """Repeated requests reuse the same table."""
+        assert lookup_calculator.get_lookup_table() is table
+
+    def test_batch_inversion_matches_optimizer(self, lookup_calculator):
+        """Table inversion agrees with diameter_from_scatter within 0.01nm."""
+        diameters = np.array([40.0, 60.0, 80.0, 100.0, 150.0, 190.0])
+        fsc = lookup_calculator.batch_calculate(diameters)
+
+        recovered, success = lookup_calculator.diameter_from_scatter_batch(fsc)
+
+        assert np.all(success)
+        for i, value in enumerate(fsc):
+            exact, _ = lookup_calculator.diameter_from_scatter(value)
+            assert abs(recovered[i] - exact) < 0.01
+        assert np.max(np.abs(recovered - diameters)) < 0.01
+
+    def test_invalid_and_out_of_range_values(self, lookup_calculator):
+        """Invalid inputs give NaN; out-of-range values clamp to the bounds."""
+        fsc_max = lookup_calculator.calculate_scattering_efficiency(200.0).forward_scatter
+        values = np.array([0.0, -5.0, np.nan, fsc_max * 10, 1e-12])
+
+        recovered, success = lookup_calculator.diameter_from_scatter_batch(values)
+
+        assert np.all(np.isnan(recovered[:3]))
+        assert recovered[3] == pytest.approx(200.0)
+        assert recovered[4] == pytest.approx(30.0)
+        assert not np.any(success)
+
+    def test_non_monotonic_segments(self):
+        """SSC oscillates in the resonance regime, giving several branches."""
+        table = MieLookupTable.build(
+            wavelength_nm=488.0, n_particle=1.59, n_medium=1.33,
+            min_diameter=30.0, max_diameter=1000.0, n_points=1000
+        )
+        segments = table.monotonic_segments('side_scatter')
+
+        assert len(segments) > 1
+        assert segments[0][0] == 0 and segments[-1][1] == 999
+
+    def test_accuracy_report(self, table):
+        """Accuracy report stays sub-nanometre vs the exact optimizer."""
+        report = table.accuracy_report(n_samples=10)
+
+        assert report["success_rate"] == 1.0
+        assert report["max_abs_diff_vs_optimizer_nm"] < 0.01
+        assert report["max_rel_error_pct"] < 0.1
+
+
+class TestFCMPASSCalibratorBatch:
+    """Tests for vectorized FCMPASSCalibrator.predict_batch."""
+
+    def test_batch_matches_scalar_path(self, fitted_calibrator):
+        """Vectorized predictions match predict_diameter within 0.01nm."""
+        fsc = np.array([500.0, 9000.0, 15000.0, 30000.0, 58000.0, 90000.0, 200000.0])
+
+        diameters, in_range = fitted_calibrator.predict_batch(fsc)
+
+        for i, value in enumerate(fsc):
+            expected_d, expected_in_range = fitted_calibrator.predict_diameter(value)
+            assert abs(diameters[i] - expected_d) < 0.01, \
+                f"FSC={value}: batch {diameters[i]:.4f} vs scalar {expected_d:.4f}"
+            assert in_range[i] == expected_in_range
+
+    def test_batch_matches_exact_fallback(self, fitted_calibrator):
+        """use_lookup=False reproduces the per-event path."""
+        fsc = np.linspace(12000, 60000, 20)
+
+        fast_d, fast_in = fitted_calibrator.predict_batch(fsc)
+        exact_d, exact_in = fitted_calibrator.predict_batch(fsc, use_lookup=False)
+
+        assert np.max(np.abs(fast_d - exact_d)) < 0.01
+        assert np.array_equal(fast_in, exact_in)
+
+    def test_batch_requires_fit(self):
+        """Unfitted calibrator raises RuntimeError."""
+        cal = FCMPASSCalibrator()
+        with pytest.raises(RuntimeError, match="not fitted"):
+            cal.predict_batch(np.array([1000.0]))
+
+
+class TestMieTableCache:
+    """Tests for the on-disk Mie table cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Saved tables load back memory-mapped with identical values."""
+        cache = MieTableCache(tmp_path)
+        built = cache.get_or_build(488.0, 1.40, 1.33, 20.0, 300.0, 200)
+
+        loaded = cache.load(488.0, 1.40, 1.33, 20.0, 300.0, 200)
+
+        assert loaded is not None
+        assert not loaded.forward_scatter.flags.writeable  # read-only mmap view
+        np.testing.assert_array_equal(loaded.diameters_nm, built.diameters_nm)
+        np.testing.assert_array_equal(loaded.forward_scatter, built.forward_scatter)
+        np.testing.assert_array_equal(loaded.Q_back, built.Q_back)
+
+    def test_key_depends_on_configuration(self):
+        """Different optics or grids never share a cache entry."""
+        base = MieTableCache.make_key(488.0, 1.40, 1.33, 10.0, 1000.0, 2000)
+
+        assert base == MieTableCache.make_key(488, 1.4, 1.33, 10, 1000, 2000)
+        assert base != MieTableCache.make_key(405.0, 1.40, 1.33, 10.0, 1000.0, 2000)
+        assert base != MieTableCache.make_key(488.0, 1.59, 1.33, 10.0, 1000.0, 2000)
+        assert base != MieTableCache.make_key(488.0, 1.40, 1.33, 10.0, 1000.0, 1000)
+
+    def test_calculator_uses_cache(self, tmp_path):
+        """A second calculator loads the table from disk instead of rebuilding."""
+        cache = MieTableCache(tmp_path)
+        first = MieScatterCalculator(488.0, 1.40, 1.33, table_cache=cache)
+        first.get_lookup_table(n_points=300)
+        assert len(list(tmp_path.glob("*.npy"))) == 1
+
+        second = MieScatterCalculator(488.0, 1.40, 1.33, table_cache=cache)
+        fsc = first.batch_calculate(np.array([60.0, 120.0]))
+        recovered, success = second.diameter_from_scatter_batch(fsc)
+
+        assert np.all(success)
+        np.testing.assert_allclose(recovered, [60.0, 120.0], atol=0.05)
+
+    def test_corrupt_entry_is_rebuilt(self, tmp_path):
+        """Unreadable cache files are ignored and overwritten."""
+        cache = MieTableCache(tmp_path)
+        key = MieTableCache.make_key(488.0, 1.40, 1.33, 20.0, 300.0, 100)
+        cache.path_for(key).write_bytes(b"not a numpy file")
+
+        assert cache.load(488.0, 1.40, 1.33, 20.0, 300.0, 100) is None
+        table = cache.get_or_build(488.0, 1.40, 1.33, 20.0, 300.0, 100)
+        assert len(table.diameters_nm) == 100
+        assert cache.load(488.0, 1.40, 1.33, 20.0, 300.0, 100) is not None
+
+
+class TestSpectralResponse:
+    """Tests for the stateless multi-wavelength response matrix."""
+
+    def test_matrix_matches_per_wavelength_calculators(self, lookup_calculator):
+        """Each column equals a calculator configured for that wavelength."""
+        diameters = np.array([50.0, 80.0, 150.0, 400.0])
+        wavelengths = [405.0, 488.0, 561.0, 633.0]
+
+        matrix = lookup_calculator.calculate_spectral_response(diameters, wavelengths)
+
+        assert matrix.shape == (4, 4)
+        for j, wl in enumerate(wavelengths):
+            calc = MieScatterCalculator(wavelength_nm=wl, n_particle=1.40, n_medium=1.33)
+            for i, d in enumerate(diameters):
+                expected = calc.calculate_scattering_efficiency(d).forward_scatter
+                assert matrix[i, j] == pytest.approx(expected, rel=1e-12)
+
+    def test_lookup_matches_exact(self, lookup_calculator):
+        """Table interpolation agrees with exact Mie to 1e-4 relative."""
+        diameters = np.linspace(30, 900, 57)
+
+        for channel in ('forward_scatter', 'side_scatter'):
+            fast = lookup_calculator.calculate_spectral_response(
+                diameters, channel=channel, use_lookup=True
+            )
+            exact = lookup_calculator.calculate_spectral_response(diameters, channel=channel)
+            np.testing.assert_allclose(fast, exact, rtol=1e-4)
+
+    def test_shared_calculator_is_thread_safe(self, lookup_calculator):
+        """Concurrent calls neither mutate state nor disagree."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        expected = lookup_calculator.calculate_wavelength_response(80.0)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(
+                lambda _: lookup_calculator.calculate_wavelength_response(80.0), range(16)
+            ))
+
+        assert all(r == expected for r in results)
+        assert lookup_calculator.wavelength_nm == 488.0
+
+
+class TestMieBatchExecutor:
+    """Tests for the multi-process chunked executor."""
+
+    def test_parallel_matches_serial(self, lookup_calculator):
+        """Chunked multi-process results are identical to the serial loop."""
+        diameters = np.linspace(30, 900, 257)
+        serial = lookup_calculator.batch_calculate(diameters)
+
+        with MieBatchExecutor(max_workers=2, chunk_size=50) as executor:
+            parallel = lookup_calculator.batch_calculate(diameters, executor=executor)
+            # Pool is reused across calls; worker count/chunking don't matter
+            again = executor.batch_calculate(lookup_calculator, diameters[::-1])
+
+        np.testing.assert_array_equal(parallel, serial)
+        np.testing.assert_array_equal(again, serial[::-1])
+
+    def test_side_scatter_channel(self, lookup_calculator):
+        """SSC channel matches calculate_scattering_efficiency."""
+        diameters = np.array([60.0, 250.0])
+        with MieBatchExecutor(max_workers=1, chunk_size=1) as executor:
+            ssc = executor.batch_calculate(lookup_calculator, diameters, channel='side_scatter')
+
+        for i, d in enumerate(diameters):
+            expected = lookup_calculator.calculate_scattering_efficiency(d).side_scatter
+            assert ssc[i] == pytest.approx(expected, rel=1e-12)
+
+
+class TestDetectorScatterModel:
+    """Tests for detector-angle-integrated FSC/SSC."""
+
+    def test_full_sphere_equals_scattering_cross_section(self, lookup_calculator):
+        """Integrating over 0-180° recovers Q_sca × geometric area."""
+        model = DetectorScatterModel(
+            488.0, 1.40, 1.33,
+            geometry=DetectorGeometry((0.0, 180.0), (0.0, 180.0), n_angles=1001)
+        )
+        fsc, _ = model.collected_intensities(np.array([80.0, 300.0]))
+
+        for i, d in enumerate([80.0, 300.0]):
+            result = lookup_calculator.calculate_scattering_efficiency(d)
+            expected = result.Q_sca * np.pi * (d / 2.0) ** 2
+            assert fsc[i] == pytest.approx(expected, rel=1e-4)
+
+    def test_matches_miepython_phase_function(self):
+        """The vectorized amplitude sums equal miepython.i_unpolarized per diameter."""
+        import miepython
+        from scipy.integrate import trapezoid
+        model = DetectorScatterModel(405.0, 1.45, 1.33)
+        diameters = np.array([20.0, 95.0, 480.0, 2500.0])
+        fsc, ssc = model.collected_intensities(diameters)
+
+        for i, d in enumerate(diameters):
+            for angle_range, value in ((model.geometry.fsc_angle_range, fsc[i]),
+                                       (model.geometry.ssc_angle_range, ssc[i])):
+                theta, mu = model._window_quadrature(angle_range)
+                intensity = miepython.i_unpolarized(model.m, np.pi * d / 405.0, mu, norm='qsca')
+                expected = trapezoid(2 * np.pi * np.sin(theta) * intensity * np.pi * (d / 2) ** 2, theta)
+                assert value == pytest.approx(expected, rel=1e-10)
+
+    def test_table_matches_exact(self):
+        """Tabulated intensities interpolate the exact integrals."""
+        model = DetectorScatterModel(488.0, 1.40, 1.33)
+        table = model.get_table(min_diameter=30.0, max_diameter=300.0, n_points=120)
+        diameters = np.array([45.0, 110.0, 250.0])
+
+        exact_f, exact_s = model.collected_intensities(diameters)
+
+        np.testing.assert_allclose(table.scatter_at(diameters, 'forward_scatter'), exact_f, rtol=1e-3)
+        np.testing.assert_allclose(table.scatter_at(diameters, 'side_scatter'), exact_s, rtol=1e-3)
+
+    def test_tables_persist_per_geometry(self, tmp_path):
+        """Tables are cached on disk and keyed by the angle windows."""
+        cache = MieTableCache(tmp_path)
+        narrow = DetectorGeometry((1.0, 15.0), (85.0, 95.0), n_angles=31)
+        wide = DetectorGeometry((1.0, 30.0), (60.0, 120.0), n_angles=31)
+
+        DetectorScatterModel(geometry=narrow, table_cache=cache).get_table(30.0, 300.0, 40)
+        DetectorScatterModel(geometry=wide, table_cache=cache).get_table(30.0, 300.0, 40)
+        assert len(list(tmp_path.glob("*.npy"))) == 2
+
+        reloaded = DetectorScatterModel(geometry=narrow, table_cache=cache)
+        table = reloaded.get_table(30.0, 300.0, 40)
+        exact_f, _ = reloaded.collected_intensities(table.diameters_nm[:3])
+        np.testing.assert_allclose(table.forward_scatter[:3], exact_f)
+
+    def test_invalid_geometry(self):
+        """Angle windows must be ordered and within 0-180°."""
+        with pytest.raises(ValueError):
+            DetectorGeometry(fsc_angle_range=(15.0, 1.0))
+        with pytest.raises(ValueError):
+            DetectorGeometry(ssc_angle_range=(90.0, 200.0))
+
+
+class TestRatioSizingIndex:
+    """Tests for the sorted FSC/SSC ratio index."""
+
+    @staticmethod
+    def _curve():
+        """Non-monotonic ratio curve with a repeated value (tie)."""
+        diameters = np.linspace(30.0, 500.0, 400)
+        ratios = np.sin(diameters / 60.0) + diameters / 200.0
+        ratios[50] = ratios[10]
+        return diameters, ratios
+
+    def test_nearest_matches_argmin(self):
+        """Sorted lookup gives the same matches as the broadcast argmin."""
+        diameters, ratios = self._curve()
+        measured = np.random.default_rng(1).uniform(ratios.min() - 0.5, ratios.max() + 0.5, 5000)
+        measured = np.concatenate((measured, ratios, [np.nan, np.inf]))
+
+        d, matched, idx = RatioSizingIndex(diameters, ratios).nearest(measured)
+
+        finite = np.isfinite(measured)
+        expected = np.argmin(np.abs(measured[finite, None] - ratios[None, :]), axis=1)
+        np.testing.assert_array_equal(idx[finite], expected)
+        np.testing.assert_array_equal(d[finite], diameters[expected])
+        np.testing.assert_array_equal(matched[finite], ratios[expected])
+        assert np.all(np.isnan(d[~finite]))
+
+    def test_invert_uses_first_bracketing_branch(self):
+        """Interpolation happens on the smallest-diameter branch containing the ratio."""
+        diameters, ratios = self._curve()
+        index = RatioSizingIndex(diameters, ratios)
+        assert len(index.branches) > 1
+
+        first_start, first_end = index.branches[0]
+        truth = np.array([first_start + 5.0, 0.5 * (first_start + first_end)])
+        measured = np.interp(truth, diameters, ratios)
+
+        d, bracketed = index.invert(measured)
+
+        assert np.all(bracketed)
+        np.testing.assert_allclose(d, truth, atol=1e-6)
+
+    def test_invert_out_of_range_falls_back_to_nearest(self):
+        diameters, ratios = self._curve()
+        d, bracketed = RatioSizingIndex(diameters, ratios).invert(np.array([ratios.max() + 10.0]))
+
+        assert not bracketed[0]
+        assert d[0] == diameters[np.argmax(ratios)]
+
+    def test_non_finite_theoretical_ratios_ignored(self):
+        diameters = np.array([50.0, 100.0, 150.0])
+        ratios = np.array([1.0, np.nan, 3.0])
+
+        d, _, idx = RatioSizingIndex(diameters, ratios).nearest(np.array([1.9, 2.1]))
+
+        np.testing.assert_array_equal(idx, [0, 2])
+        np.testing.assert_array_equal(d, [50.0, 150.0])
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            RatioSizingIndex(np.array([1.0, 2.0]), np.array([1.0]))
+        with pytest.raises(ValueError):
+            RatioSizingIndex(np.array([2.0, 1.0]), np.array([1.0, 2.0]))
+        with pytest.raises(ValueError):
+            RatioSizingIndex(np.array([1.0, 2.0]), np.array([np.nan, np.nan]))
+
+
+class TestCalibrationStore:
+    """Tests for calibration artifacts and the per-instrument store."""
+
+    BEADS = {100: 15000, 200: 58000, 300: 125000}
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return CalibrationStore(tmp_path / "calibrations", table_cache=MieTableCache(tmp_path / "mie"))
+
+    def test_default_uses_settings(self, tmp_path, monkeypatch):
+        """default() resolves both directories through Settings, like the API."""
+        from src.api.config import get_settings
+        settings = get_settings()
+        monkeypatch.setattr(settings, "calibration_dir", tmp_path / "calibrations")
+        monkeypatch.setattr(settings, "mie_cache_dir", tmp_path / "mie")
+
+        store = CalibrationStore.default()
+        assert store.root == tmp_path / "calibrations"
+        assert store.table_cache.cache_dir == tmp_path / "mie"
+        assert MieTableCache.default().cache_dir == tmp_path / "mie"
+
+    def test_fit_matches_per_bead_theory(self, fitted_calibrator):
+        """Batched bead scatter equals the scalar calculation."""
+        for d, theoretical in zip(fitted_calibrator.bead_diameters, fitted_calibrator.bead_fsc_theoretical):
+            expected = fitted_calibrator.mie_calc.calculate_scattering_efficiency(d).forward_scatter
+            assert theoretical == pytest.approx(expected, rel=1e-12)
+
+    def test_roundtrip_predicts_identically(self):
+        """A restored calibrator sizes events like the original."""
+        cal = FCMPASSCalibrator(wavelength_nm=488.0, n_particle=1.59, n_medium=1.33)
+        cal.fit_from_beads(self.BEADS)
+        cal.build_inverse_curve()
+        fsc = np.random.default_rng(3).uniform(5000, 200000, 2000)
+
+        restored = FCMPASSCalibrator.from_dict(cal.to_dict())
+
+        d_orig, ok_orig = cal.predict_batch(fsc)
+        d_restored, ok_restored = restored.predict_batch(fsc)
+        np.testing.assert_array_equal(d_restored, d_orig)
+        np.testing.assert_array_equal(ok_restored, ok_orig)
+        assert restored.get_diagnostics() == cal.get_diagnostics()
+
+    def test_inverse_curve_matches_full_table(self):
+        cal = FCMPASSCalibrator(wavelength_nm=488.0, n_particle=1.59, n_medium=1.33)
+        cal.fit_from_beads(self.BEADS)
+        fsc = np.random.default_rng(4).uniform(1000, 300000, 5000)
+        d_table, ok_table = cal.predict_batch(fsc)
+
+        cal.build_inverse_curve()
+        d_curve, ok_curve = cal.predict_batch(fsc)
+
+        np.testing.assert_allclose(d_curve, d_table, atol=0.01)
+        np.testing.assert_array_equal(ok_curve, ok_table)
+
+    def test_get_or_fit_refits_only_for_new_bead_run(self, store, mocker):
+        fit = mocker.spy(FCMPASSCalibrator, "fit_from_beads")
+
+        store.get_or_fit("ZE5-01", self.BEADS, run_date="2025-11-18")
+        store.get_or_fit("ZE5-01", self.BEADS, run_date="2025-11-18")
+        assert fit.call_count == 1
+
+        changed = {**self.BEADS, 300: 126000}
+        store.get_or_fit("ZE5-01", changed, run_date="2025-11-18")
+        assert fit.call_count == 2
+
+        # A fresh store (new process) reuses the artifact on disk
+        reopened = CalibrationStore(store.root)
+        reopened.get_or_fit("ZE5-01", changed, run_date="2025-11-18")
+        assert fit.call_count == 2
+
+    def test_load_selects_latest_on_or_before_date(self, store):
+        store.get_or_fit("ZE5-01", self.BEADS, run_date="2025-11-01")
+        store.get_or_fit("ZE5-01", {**self.BEADS, 100: 16000}, run_date="2025-12-01")
+
+        november = store.load("ZE5-01", run_date="2025-11-20")
+        latest = store.load("ZE5-01")
+
+        assert november.bead_fsc_measured[0] == 15000
+        assert latest.bead_fsc_measured[0] == 16000
+        assert store.load("ZE5-01", run_date="2025-10-01") is None
+        assert store.load("ZE5-01", run_date="2025-11-20", exact=True) is None
+        assert store.load("other") is None
+        assert [e["run_date"] for e in store.list_calibrations()] == ["2025-11-01", "2025-12-01"]
+
+
+class TestMultiSolutionInversion:
+    """Tests for resonance-branch candidates and SSC/FSC disambiguation."""
+
+    @pytest.fixture
+    def events(self, lookup_calculator):
+        table = lookup_calculator.get_lookup_table()
+        diameters = np.random.default_rng(7).uniform(30.0, 1000.0, 20000)
+        return (
+            diameters,
+            table.scatter_at(diameters, 'forward_scatter'),
+            table.scatter_at(diameters, 'side_scatter'),
+        )
+
+    def test_true_diameter_among_candidates(self, lookup_calculator, events):
+        diameters, _, ssc = events
+        candidates = lookup_calculator.diameter_candidates_batch(ssc, 30.0, 1000.0, channel='side_scatter')
+
+        assert candidates.shape[1] > 1
+        closest = np.nanmin(np.abs(candidates - diameters[:, None]), axis=1)
+        assert np.max(closest) < 0.5
+
+    def test_disambiguation_recovers_full_range(self, lookup_calculator, events):
+        """SSC inverted on all branches, FSC picks the right one."""
+        diameters, fsc, ssc = events
+        estimated, n_candidates, success = lookup_calculator.diameter_from_fsc_ssc_batch(
+            fsc, ssc, 30.0, 1000.0, primary_channel='side_scatter'
+        )
+
+        assert np.mean(n_candidates > 1) > 0.5
+        assert np.all(success)
+        np.testing.assert_allclose(estimated, diameters, atol=0.5)
+
+    def test_monotonic_primary_single_candidate(self, lookup_calculator, events):
+        diameters, fsc, ssc = events
+        estimated, n_candidates, _ = lookup_calculator.diameter_from_fsc_ssc_batch(fsc, ssc, 30.0, 1000.0)
+        expected, _ = lookup_calculator.diameter_from_scatter_batch(fsc, 30.0, 1000.0)
+
+        assert np.all(n_candidates == 1)
+        np.testing.assert_allclose(estimated, expected, atol=1e-6)
+
+    def test_missing_secondary_keeps_smallest_candidate(self, lookup_calculator, events):
+        table = lookup_calculator.get_lookup_table()
+        _, _, ssc = events
+        candidates = table.diameter_candidates(ssc[:100], 30.0, 1000.0, channel='side_scatter')
+
+        estimated, _, _ = table.diameter_from_scatter_pair(
+            ssc[:100], np.full(100, np.nan), 30.0, 1000.0,
+            channel='side_scatter', secondary_channel='forward_scatter'
+        )
+
+        smallest = candidates[np.arange(100), np.argmax(np.isfinite(candidates), axis=1)]
+        np.testing.assert_array_equal(estimated, smallest)
+
+    def test_invalid_inputs(self, lookup_calculator):
+        table = lookup_calculator.get_lookup_table()
+        candidates = table.diameter_candidates(np.array([-1.0, np.nan]), 30.0, 1000.0)
+        assert np.all(np.isnan(candidates))
+
+        with pytest.raises(ValueError):
+            table.diameter_from_scatter_pair(np.ones(3), np.ones(2))
+        with pytest.raises(ValueError):
+            lookup_calculator.diameter_from_fsc_ssc_batch(np.ones(2), np.ones(2), primary_channel='bogus')
+
+
+class TestBenchmarkHarness:
+    """Tests for the physics benchmark harness (cheap synthetic cases)."""
+
+    @staticmethod
+    def _run(host, events_per_sec, peak_mb=10.0):
+        return BenchmarkRun(
+            timestamp="2025-11-18T00:00:00",
+            environment={"host": host},
+            results=[BenchmarkResult("case", 1000, 1000 / events_per_sec, events_per_sec, peak_mb, 1)]
+        )
+
+    def test_measure_and_size_cap(self):
+        case = BenchmarkCase("sum", setup=np.ones, run=np.sum, max_events=1_000)
+
+        result = measure(case, 1_000, repeats=2)
+        assert result.case == "sum" and result.n_events == 1_000
+        assert result.events_per_sec > 0 and result.peak_memory_mb >= 0
+
+        run = run_benchmarks([case], sizes=[100, 1_000, 10_000], repeats=1)
+        assert [r.n_events for r in run.results] == [100, 1_000]
+        with pytest.raises(ValueError):
+            run_benchmarks([case], sizes=[100], only=["missing"])
+
+    def test_history_flags_regressions(self, tmp_path):
+        history = BenchmarkHistory(tmp_path / "history.json")
+        assert history.compare(self._run("ci", 100.0)) == []
+
+        for rate in (100.0, 110.0, 90.0):
+            history.append(self._run("ci", rate))
+        history.append(self._run("laptop", 1.0))  # Other hosts never form the baseline
+
+        assert history.compare(self._run("ci", 80.0), threshold=0.25) == []
+
+        slower = history.compare(self._run("ci", 70.0), threshold=0.25)
+        assert [r.metric for r in slower] == ["events_per_sec"]
+        assert slower[0].baseline == pytest.approx(100.0)
+
+        bigger = history.compare(self._run("ci", 100.0, peak_mb=20.0), threshold=0.25)
+        assert [r.metric for r in bigger] == ["peak_memory_mb"]
@@ -10,9 +10,51 @@ Status: STUB - Implementation pending
 """
 
 import pytest
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from src.parsers.fcs_parser import FCSParser
+from src.parsers.fcs_reader import FCSReader, UnsupportedFCSFormat
+from src.parsers.fcs_scan import scan_fcs_header, scan_fcs_headers
+from src.parsers.nta_parser import NTAParser, parse_nta_files
+from src.parsers.streaming_stats import (
+    QUANTILES,
+    STREAMING_EXACT_LIMIT,
+    ChannelAccumulator,
+    QuantileSketch,
+    StreamingStatistics,
+)
+
+
+SAMPLE_FCS = Path(__file__).parent.parent / "nanoFACS" / "EXP 6-10-2025" / "water.fcs"
+
+
+def write_fcs(path: Path, events: np.ndarray, keywords: dict, delimiter: str = "/") -> Path:
+    """Write a minimal FCS 3.1 file: HEADER, TEXT (with given keywords) and DATA."""
+    def text_segment(data_start: int, data_end: int) -> bytes:
+        items = dict(keywords, **{"$BEGINDATA": str(data_start), "$ENDDATA": str(data_end)})
+        escaped = [str(x).replace(delimiter, delimiter * 2) for kv in items.items() for x in kv]
+        return (delimiter + delimiter.join(escaped) + delimiter).encode()
+
+    payload = events.tobytes()
+    text_start = 58
+    # Offsets appear inside TEXT, so iterate until the TEXT length is stable
+    text = text_segment(0, 0)
+    for _ in range(3):
+        data_start = text_start + len(text)
+        text = text_segment(data_start, data_start + len(payload) - 1)
+    data_start = text_start + len(text)
+
+    # Offsets beyond 99,999,999 bytes are written as 0 (they live in TEXT)
+    header = b"FCS3.1    " + b"".join(
+        f"{v if v <= 99_999_999 else 0:>8}".encode() for v in (
+            text_start, data_start - 1, data_start, data_start + len(payload) - 1, 0, 0
+        )
+    )
+    path.write_bytes(header + text + payload)
+    return path
+
 
 class TestFCSParser:
     """Tests for FCS parser."""
@@ -35,6 +77,693 @@ class TestFCSParser:
         pass
 
 
+class TestFCSReader:
+    """Tests for the native memory-mapped FCS reader."""
+
+    @staticmethod
+    def _keywords(n_events, datatype, byteord, bits, names, stains=None):
+        keywords = {
+            "$TOT": n_events, "$PAR": len(names), "$MODE": "L",
+            "$DATATYPE": datatype, "$BYTEORD": byteord,
+        }
+        for i, name in enumerate(names, start=1):
+            keywords[f"$P{i}N"] = name
+            keywords[f"$P{i}B"] = bits
+            keywords[f"$P{i}R"] = 2 ** 18
+            keywords[f"$P{i}E"] = "0,0"
+            if stains:
+                keywords[f"$P{i}S"] = stains[i - 1]
+        return keywords
+
+    @pytest.mark.skipif(not SAMPLE_FCS.exists(), reason="sample FCS file not available")
+    def test_matches_fcsparser(self):
+        """Columns, values and TEXT keywords agree with fcsparser."""
+        import fcsparser
+        meta, expected = fcsparser.parse(str(SAMPLE_FCS))
+
+        with FCSReader(SAMPLE_FCS) as fcs:
+            df = fcs.to_dataframe()
+            assert fcs.n_events == len(expected)
+            assert list(df.columns) == list(expected.columns)
+            np.testing.assert_array_equal(df.to_numpy(), expected.to_numpy())
+            for key, value in meta.items():
+                if key.startswith("$"):
+                    assert str(fcs.metadata[key]).strip() == str(value).strip()
+
+    def test_big_endian_integer_data(self, tmp_path):
+        """$DATATYPE I with big-endian $BYTEORD and escaped delimiters."""
+        events = np.zeros(500, dtype=[("FSC-A", ">u2"), ("SSC-A", ">u2"), ("Time", ">u4")])
+        events["FSC-A"] = np.arange(500)
+        events["SSC-A"] = 1000 - np.arange(500)
+        events["Time"] = np.arange(500) * 70_000
+        keywords = self._keywords(500, "I", "4,3,2,1", 16, ["FSC-A", "SSC-A", "Time"])
+        keywords["$P3B"] = 32
+        keywords["$SMNO"] = "Lot 5/F10"
+        path = write_fcs(tmp_path / "int.fcs", events, keywords)
+
+        fcs = FCSReader(path)
+        assert fcs.n_events == 500
+        assert fcs.metadata["$SMNO"] == "Lot 5/F10"
+        df = fcs.to_dataframe(["SSC-A", "Time"], start=10, stop=20)
+        assert df["SSC-A"].dtype == np.uint16 and df["SSC-A"].dtype.isnative
+        np.testing.assert_array_equal(df["SSC-A"], 1000 - np.arange(10, 20))
+        np.testing.assert_array_equal(df["Time"], np.arange(10, 20) * 70_000)
+
+    def test_column_is_zero_copy_view(self, tmp_path):
+        """column() returns a view onto the memory map, not a copy."""
+        events = np.zeros(1000, dtype=[("FSC-H", "<f4"), ("SSC-H", "<f4")])
+        events["FSC-H"] = np.linspace(0, 1, 1000)
+        path = write_fcs(tmp_path / "float.fcs", events,
+                         self._keywords(1000, "F", "1,2,3,4", 32, ["FSC-H", "SSC-H"]))
+
+        fcs = FCSReader(path)
+        fsc = fcs.column("FSC-H")
+        assert not fsc.flags.owndata
+        assert np.shares_memory(fsc, fcs.events)
+        np.testing.assert_array_equal(fsc, events["FSC-H"])
+        with pytest.raises(KeyError):
+            fcs.column("VFSC-H")
+
+    def test_channel_naming_follows_fcsparser(self, tmp_path):
+        """$PnS names by default, $PnN on request or when $PnS is not unique."""
+        events = np.zeros(10, dtype=[("a", "<f4"), ("b", "<f4")])
+        path = write_fcs(tmp_path / "names.fcs", events, self._keywords(
+            10, "F", "1,2,3,4", 32, ["FSC-H", "SSC-H"], stains=["VFSC-H", "VSSC1-H"]
+        ))
+        assert FCSReader(path).channel_names == ["VFSC-H", "VSSC1-H"]
+        assert FCSReader(path, channel_naming="$PnN").channel_names == ["FSC-H", "SSC-H"]
+
+        path = write_fcs(tmp_path / "dupes.fcs", events, self._keywords(
+            10, "F", "1,2,3,4", 32, ["FSC-H", "SSC-H"], stains=["CD81", "CD81"]
+        ))
+        assert FCSReader(path).channel_names == ["FSC-H", "SSC-H"]
+
+    def test_unsupported_layout(self, tmp_path):
+        """Packed bit widths raise UnsupportedFCSFormat (a ValueError)."""
+        events = np.zeros(10, dtype=[("FSC-A", "<u2")])
+        path = write_fcs(tmp_path / "packed.fcs", events,
+                         self._keywords(10, "I", "1,2", 10, ["FSC-A"]))
+        with pytest.raises(UnsupportedFCSFormat):
+            FCSReader(path)
+
+        (tmp_path / "bad.fcs").write_bytes(b"not an fcs file" * 10)
+        with pytest.raises(ValueError):
+            FCSReader(tmp_path / "bad.fcs")
+
+    def test_parser_uses_native_reader(self, tmp_path):
+        """FCSParser.parse() returns float32 channels from the memory map."""
+        events = np.zeros(200, dtype=[("FSC-A", "<u2"), ("SSC-A", "<u2")])
+        events["FSC-A"] = np.arange(200)
+        path = write_fcs(tmp_path / "P5_F10_CD81.fcs", events,
+                         self._keywords(200, "I", "1,2", 16, ["FSC-A", "SSC-A"]))
+
+        parser = FCSParser(path)
+        data = parser.parse()
+        assert parser.reader is not None
+        assert data["FSC-A"].dtype == np.float32
+        np.testing.assert_array_equal(data["FSC-A"], np.arange(200))
+        assert parser.biological_sample_id == "P5_F10"
+        assert parser.extract_metadata()["channel_names"] == ["FSC-A", "SSC-A"]
+
+
+class TestFCSChunkStreaming:
+    """Tests for FCSParser.iter_chunks() and the streaming consumers."""
+
+    @pytest.fixture
+    def fcs_path(self, tmp_path):
+        rng = np.random.default_rng(0)
+        events = np.zeros(2500, dtype=[("FSC-A", "<f4"), ("SSC-A", "<f4"), ("FL1-A", "<f4")])
+        for name in events.dtype.names:
+            events[name] = rng.lognormal(8, 1, 2500)
+        events["FSC-A"][:40] = -1.0
+        return write_fcs(tmp_path / "L5+F10+CD9.fcs", events, TestFCSReader._keywords(
+            2500, "F", "1,2,3,4", 32, ["FSC-A", "SSC-A", "FL1-A"]
+        ))
+
+    def test_chunks_reassemble_parse(self, fcs_path):
+        """Concatenated chunks equal parse(), with global indices and metadata columns."""
+        chunks = list(FCSParser(fcs_path, chunk_size=1000).iter_chunks())
+        assert [len(c) for c in chunks] == [1000, 1000, 500]
+        assert chunks[1].index[0] == 1000
+        assert (chunks[2]["biological_sample_id"] == "L5_F10").all()
+
+        expected = FCSParser(fcs_path).parse()
+        streamed = pd.concat(chunks)
+        pd.testing.assert_frame_equal(
+            streamed.drop(columns="parse_timestamp"), expected.drop(columns="parse_timestamp")
+        )
+
+        subset = next(FCSParser(fcs_path).iter_chunks(chunk_size=10, columns=["SSC-A"]))
+        assert list(subset.columns) == ["SSC-A"] + FCSParser.METADATA_COLUMNS
+
+    def test_invalid_chunk_size(self, fcs_path):
+        with pytest.raises(ValueError):
+            next(FCSParser(fcs_path).iter_chunks(chunk_size=0))
+
+    def test_streaming_matches_materialized(self, fcs_path, tmp_path):
+        """QC, statistics and Parquet output do not require parse()."""
+        parsed = FCSParser(fcs_path)
+        parsed.parse()
+        streamed = FCSParser(fcs_path, chunk_size=700)
+        streamed.open()
+
+        assert streamed.validate_quality() == parsed.validate_quality()
+        assert streamed.get_statistics() == parsed.get_statistics()
+        assert streamed.streaming_statistics().exact_limit == STREAMING_EXACT_LIMIT
+        assert streamed.n_events == 2500
+
+        streamed.to_parquet(tmp_path / "streamed.parquet")
+        assert streamed.data is None
+        import pyarrow.parquet as pq
+        parquet = pq.ParquetFile(tmp_path / "streamed.parquet")
+        assert parquet.metadata.num_row_groups == 4
+        assert parquet.schema_arrow.metadata[b"$TOT"] == b"2500"
+        assert parquet.schema_arrow.metadata[b"parser_version"] == FCSParser.PARSER_VERSION.encode()
+        df = parquet.read().to_pandas()
+        np.testing.assert_array_equal(df["FSC-A"], parsed.data["FSC-A"])
+
+    def test_compact_event_frames(self, fcs_path):
+        """Channels stay float32; per-file columns are 1-byte categoricals."""
+        data = FCSParser(fcs_path).parse()
+        assert (data[["FSC-A", "SSC-A", "FL1-A"]].dtypes == np.float32).all()
+        assert isinstance(data["file_name"].dtype, pd.CategoricalDtype)
+        assert (data["file_name"] == "L5+F10+CD9.fcs").all()
+        assert data["sample_id"].memory_usage(deep=True, index=False) < 2 * len(data) + 1000
+
+    def test_parquet_file_metadata_reattached(self, fcs_path, tmp_path):
+        """Without metadata columns, per-file values come back from key-value metadata."""
+        from src.parsers.parquet_writer import FILE_METADATA_KEY, ParquetWriter
+        import pyarrow.parquet as pq
+
+        parser = FCSParser(fcs_path)
+        parser.open()
+        out = tmp_path / "compact.parquet"
+        parser.to_parquet(out, metadata_columns=False)
+
+        parquet = pq.ParquetFile(out)
+        assert parquet.schema_arrow.names == ["FSC-A", "SSC-A", "FL1-A"]
+        column = parquet.metadata.row_group(0).column(0)
+        assert "BYTE_STREAM_SPLIT" in column.encodings
+        assert FILE_METADATA_KEY.encode() in parquet.schema_arrow.metadata
+
+        df, metadata = ParquetWriter.read_with_metadata(out, columns=["FSC-A"])
+        assert list(df.columns) == ["FSC-A"] + FCSParser.METADATA_COLUMNS
+        assert (df["biological_sample_id"] == "L5_F10").all()
+        assert df["parse_timestamp"].iloc[0] == parser.parse_timestamp
+        assert df["parse_timestamp"].dt.year.iloc[0] == parser.parse_timestamp.year
+        assert not df["is_baseline"].any()
+
+    def test_requires_open_or_parse(self, fcs_path):
+        with pytest.raises(ValueError):
+            FCSParser(fcs_path).validate_quality()
+
+    def test_record_batches_match_chunks(self, fcs_path):
+        """iter_batches() carries the same columns and values as iter_chunks()."""
+        batches = list(FCSParser(fcs_path, chunk_size=1000).iter_batches())
+        assert [b.num_rows for b in batches] == [1000, 1000, 500]
+        assert batches[0].schema.field("file_name").type.value_type == "string"
+
+        frame = pd.concat([b.to_pandas() for b in batches], ignore_index=True)
+        expected = pd.concat(FCSParser(fcs_path).iter_chunks(), ignore_index=True)
+        pd.testing.assert_frame_equal(
+            frame.drop(columns="parse_timestamp"), expected.drop(columns="parse_timestamp"),
+            check_categorical=False,
+        )
+
+        channels = next(FCSParser(fcs_path).iter_batches(columns=["SSC-A"], metadata_columns=False))
+        assert channels.schema.names == ["SSC-A"]
+
+    def test_write_batches(self, tmp_path):
+        """Metadata goes on the writer schema once; empty input needs a schema."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from src.parsers.parquet_writer import ParquetWriter
+        batch = pa.RecordBatch.from_arrays([pa.array(np.arange(10, dtype=np.float32))], names=["FSC-A"])
+
+        out = tmp_path / "batches.parquet"
+        assert ParquetWriter.write_batches([batch, batch], out, metadata={"source_file": "x.fcs"}) == 20
+        parquet = pq.ParquetFile(out)
+        assert parquet.metadata.num_row_groups == 2
+        assert parquet.schema_arrow.metadata[b"source_file"] == b"x.fcs"
+
+        assert ParquetWriter.write_batches([], tmp_path / "empty.parquet", schema=batch.schema) == 0
+        assert pq.read_schema(tmp_path / "empty.parquet").names == ["FSC-A"]
+        with pytest.raises(ValueError):
+            ParquetWriter.write_batches([], tmp_path / "none.parquet")
+
+
+class TestFCSHeaderScan:
+    """Tests for header-only FCS scanning."""
+
+    @pytest.fixture
+    def fcs_dir(self, tmp_path):
+        for name, n_events in (("small.fcs", 10), ("large.fcs", 300)):
+            events = np.zeros(n_events, dtype=[("FSC-A", "<f4"), ("SSC-A", "<f4")])
+            keywords = TestFCSReader._keywords(n_events, "F", "1,2,3,4", 32, ["FSC-A", "SSC-A"])
+            keywords.update({"$DATE": "09-Oct-2025", "$BTIM": "13:05:42", "$CYT": "CytoFLEX nano"})
+            write_fcs(tmp_path / name, events, keywords)
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "corrupt.fcs").write_bytes(b"garbage")
+        return tmp_path
+
+    def test_scan_header(self, fcs_dir):
+        summary = scan_fcs_header(fcs_dir / "large.fcs")
+        assert summary["total_events"] == 300
+        assert summary["channel_names"] == ["FSC-A", "SSC-A"]
+        assert summary["acquisition_date"] == "09-Oct-2025"
+        assert summary["acquisition_time"] == "13:05:42"
+        assert summary["cytometer"] == "CytoFLEX nano"
+        assert summary["operator"] is None
+
+    def test_scan_directory_keeps_errors(self, fcs_dir):
+        catalog = scan_fcs_headers(fcs_dir, max_workers=4)
+        by_name = {row["file_name"]: row for row in catalog}
+        assert set(by_name) == {"small.fcs", "large.fcs", "corrupt.fcs"}
+        assert by_name["corrupt.fcs"]["error"]
+        assert by_name["small.fcs"]["error"] is None
+        assert by_name["small.fcs"]["total_events"] == 10
+
+    def test_header_only_reader_and_metadata(self, fcs_dir):
+        """read_data=False and extract_metadata() never touch the DATA segment."""
+        reader = FCSReader(fcs_dir / "large.fcs", read_data=False)
+        assert reader.n_events == 300
+        with pytest.raises(ValueError):
+            reader.events
+
+        parser = FCSParser(fcs_dir / "large.fcs")
+        metadata = parser.extract_metadata()
+        assert metadata["total_events"] == 300
+        assert metadata["acquisition_date"] == "09-Oct-2025"
+        assert parser.reader is None and parser.data is None
+
+
+class TestStreamingStatistics:
+    """Tests for the one-pass statistics engine."""
+
+    @staticmethod
+    def _pandas_stats(series):
+        return {
+            'mean': series.mean(), 'median': series.median(), 'std': series.std(),
+            'min': series.min(), 'max': series.max(),
+            'q10': series.quantile(0.10), 'q25': series.quantile(0.25), 'q50': series.quantile(0.50),
+            'q75': series.quantile(0.75), 'q90': series.quantile(0.90), 'q95': series.quantile(0.95),
+            'skewness': series.skew(), 'kurtosis': series.kurtosis(),
+        }
+
+    @pytest.mark.parametrize("values", [
+        np.random.default_rng(0).lognormal(8, 1.5, 50_000),
+        np.concatenate([np.random.default_rng(1).normal(0, 5, 20_000), np.zeros(100)]),
+        100_000 + np.random.default_rng(3).normal(0, 5, 50_000),
+    ])
+    def test_exact_matches_pandas(self, values):
+        """Within exact_limit every statistic matches pandas, however chunked."""
+        acc = ChannelAccumulator()
+        for chunk in np.array_split(values, 9):
+            acc.update(chunk)
+        assert acc.is_exact
+        result = acc.to_dict()
+        expected = self._pandas_stats(pd.Series(values))
+
+        for key in ('mean', 'std', 'min', 'max', 'skewness', 'kurtosis'):
+            assert result[key] == pytest.approx(expected[key], rel=1e-6, abs=1e-9)
+        for key in ('median', 'q10', 'q25', 'q50', 'q75', 'q90', 'q95'):
+            assert result[key] == expected[key]
+        assert set(result) == set(expected) | {'cv', 'iqr'}
+
+    @pytest.mark.parametrize("values", [
+        np.random.default_rng(0).lognormal(8, 1.5, 200_000),
+        100_000 + np.random.default_rng(3).normal(0, 5, 200_000),
+    ])
+    def test_sketch_rank_error(self, values):
+        """Past exact_limit, quantiles keep a small rank error even for narrow, offset data."""
+        acc = ChannelAccumulator(exact_limit=10_000)
+        for chunk in np.array_split(values, 20):
+            acc.update(chunk)
+        assert not acc.is_exact
+        result = acc.to_dict()
+        expected = self._pandas_stats(pd.Series(values))
+
+        for key in ('mean', 'std', 'min', 'max', 'skewness', 'kurtosis'):
+            assert result[key] == pytest.approx(expected[key], rel=1e-6, abs=1e-9)
+        ordered = np.sort(values)
+        for key, q in zip(('q10', 'q25', 'q50', 'q75', 'q90', 'q95'), QUANTILES):
+            rank = np.searchsorted(ordered, result[key]) / len(values)
+            assert abs(rank - q) < 0.005, key
+        true_iqr = expected['q75'] - expected['q25']
+        assert result['iqr'] == pytest.approx(true_iqr, rel=0.05)
+
+    def test_float32_buffered_in_source_precision(self):
+        """float32 input is buffered as float32 but evaluated in float64."""
+        values = np.random.default_rng(5).lognormal(8, 1.5, 20_000).astype(np.float32)
+        acc = ChannelAccumulator()
+        for chunk in np.array_split(values, 4):
+            acc.update(chunk)
+        assert all(part.dtype == np.float32 for part in acc._buffer)
+
+        expected = ChannelAccumulator()
+        expected.update(values.astype(np.float64))
+        assert acc.to_dict() == expected.to_dict()
+
+    def test_merge_across_workers(self):
+        """Partial results merge (after pickling) to the single-pass result."""
+        import pickle
+        rng = np.random.default_rng(2)
+        df = pd.DataFrame({"FSC-A": rng.lognormal(6, 1, 9000), "SSC-A": rng.lognormal(5, 2, 9000)})
+
+        single = StreamingStatistics.from_chunks([df], ["FSC-A", "SSC-A"]).to_dict()
+        partials = [
+            pickle.loads(pickle.dumps(StreamingStatistics.from_chunks([part], ["FSC-A", "SSC-A"])))
+            for part in (df.iloc[:3000], df.iloc[3000:6000], df.iloc[6000:])
+        ]
+        merged = partials[0]
+        for part in partials[1:]:
+            merged.merge(part)
+
+        assert merged.n_events == 9000
+        for channel in ["FSC-A", "SSC-A"]:
+            assert merged.to_dict()[channel] == single[channel]
+
+    def test_merge_past_exact_limit(self):
+        """Merging exact partials that overflow exact_limit switches to the sketch."""
+        values = 100_000 + np.random.default_rng(4).normal(0, 5, 30_000)
+        merged = ChannelAccumulator(exact_limit=20_000)
+        for part in np.array_split(values, 3):
+            acc = ChannelAccumulator(exact_limit=20_000)
+            acc.update(part)
+            merged.merge(acc)
+
+        assert not merged.is_exact and merged.n == 30_000
+        result = merged.to_dict()
+        assert result['mean'] == pytest.approx(values.mean(), rel=1e-12)
+        assert result['min'] == values.min() and result['max'] == values.max()
+        rank = np.searchsorted(np.sort(values), result['median']) / len(values)
+        assert abs(rank - 0.5) < 0.005
+
+    def test_nan_and_empty(self):
+        acc = ChannelAccumulator()
+        assert np.isnan(acc.to_dict()['mean'])
+        acc.update(np.array([1.0, np.nan, 3.0]))
+        result = acc.to_dict()
+        assert result['mean'] == 2.0 and acc.n == 2
+        assert np.isnan(result['skewness'])
+
+        with pytest.raises(ValueError):
+            QuantileSketch().merge(QuantileSketch(k=100))
+
+
+class TestEventStore:
+    """Tests for the row-group-tuned Parquet event store."""
+
+    @pytest.fixture
+    def store_path(self, tmp_path):
+        from src.parsers.parquet_writer import ParquetWriter
+        rng = np.random.default_rng(3)
+        n = 60_000
+        df = pd.DataFrame({
+            "VFSC-H": rng.lognormal(7, 1, n).astype(np.float32),
+            "VSSC1-H": rng.lognormal(6, 1, n).astype(np.float32),
+            "B531-H": rng.lognormal(5, 1, n).astype(np.float32),
+            "particle_size_nm": rng.uniform(30, 500, n).astype(np.float32),
+        })
+        path = tmp_path / "events.parquet"
+        ParquetWriter.write_events(df, path, sort_by="auto", row_group_mb=0.2, metadata={"instrument": "ZE5"})
+        return path, df
+
+    def test_default_keeps_event_order(self, store_path, tmp_path):
+        """Without sort_by, events are written in acquisition order."""
+        import pyarrow.parquet as pq
+        from src.parsers.parquet_writer import ParquetWriter
+        _, df = store_path
+        path = tmp_path / "unsorted.parquet"
+        ParquetWriter.write_events(df, path, row_group_mb=0.2)
+
+        parquet = pq.ParquetFile(path)
+        assert b"sorted_by" not in (parquet.schema_arrow.metadata or {})
+        pd.testing.assert_frame_equal(parquet.read().to_pandas(), df)
+
+    def test_layout(self, store_path):
+        """Sorted by size, several row groups, statistics on scatter/size only."""
+        import pyarrow.parquet as pq
+        path, _ = store_path
+        parquet = pq.ParquetFile(path)
+        meta = parquet.metadata
+        assert meta.num_row_groups == 5  # 60k rows x 16 B at 0.2 MB per group
+        assert parquet.schema_arrow.metadata[b"sorted_by"] == b"particle_size_nm"
+
+        names = parquet.schema_arrow.names
+        row_group = meta.row_group(0)
+        with_stats = {names[i] for i in range(row_group.num_columns) if row_group.column(i).is_stats_set}
+        assert with_stats == {"VFSC-H", "VSSC1-H", "particle_size_nm"}
+
+        maxima = [meta.row_group(i).column(names.index("particle_size_nm")).statistics.max
+                  for i in range(meta.num_row_groups)]
+        assert maxima == sorted(maxima)
+
+    def test_filtered_column_read(self, store_path):
+        """Column pruning plus BETWEEN filter returns exactly the matching events."""
+        import pyarrow.compute as pc
+        import pyarrow.dataset as ds
+        from src.parsers.parquet_writer import ParquetWriter, between
+        path, df = store_path
+
+        result = ParquetWriter.read_events(path, ["VFSC-H"], filters=between("particle_size_nm", 50, 200))
+        expected = df[(df["particle_size_nm"] >= 50) & (df["particle_size_nm"] <= 200)]
+        assert list(result.columns) == ["VFSC-H"]
+        np.testing.assert_array_equal(np.sort(result["VFSC-H"]), np.sort(expected["VFSC-H"]))
+
+        # Statistics let the reader skip row groups outside the range
+        fragment = next(ds.dataset(path).get_fragments())
+        size = pc.field("particle_size_nm")
+        assert len(fragment.split_by_row_group((size >= 50) & (size <= 200))) < 5
+
+        with pytest.raises(KeyError):
+            ParquetWriter.read_events(path, ["FL9-H"])
+
+
+class TestEventDataset:
+    """Tests for the Hive-partitioned event dataset."""
+
+    @staticmethod
+    def _fcs(tmp_path, name, date, n=3000, seed=0):
+        rng = np.random.default_rng(seed)
+        events = np.zeros(n, dtype=[("FSC-A", "<f4"), ("SSC-A", "<f4")])
+        for channel in events.dtype.names:
+            events[channel] = rng.lognormal(8, 1, n)
+        keywords = TestFCSReader._keywords(n, "F", "1,2,3,4", 32, ["FSC-A", "SSC-A"])
+        keywords["$DATE"] = date
+        return write_fcs(tmp_path / name, events, keywords)
+
+    @pytest.fixture
+    def dataset(self, tmp_path):
+        from src.parsers.event_dataset import EventDataset
+        dataset = EventDataset(tmp_path / "events")
+        for i, (name, date) in enumerate([
+            ("P5_F10_CD81.fcs", "04-NOV-2025"),
+            ("P5_F10_ISO.fcs", "04-NOV-2025"),
+            ("L5_F16_CD81.fcs", "21-Oct-2025"),
+            ("L5_F16_CD9.fcs", "12-Nov-2025"),
+        ]):
+            dataset.append_fcs(FCSParser(self._fcs(tmp_path, name, date, seed=i), chunk_size=1000))
+        return dataset
+
+    def test_acquisition_date(self):
+        from src.parsers.event_dataset import acquisition_date
+        assert acquisition_date("04-NOV-2025") == "2025-11-04"
+        assert acquisition_date("2025-11-04") == "2025-11-04"
+        assert acquisition_date(pd.Timestamp("2025-11-04 10:00")) == "2025-11-04"
+        assert acquisition_date("not a date") == acquisition_date(None) == "unknown"
+
+    def test_layout_and_summary(self, dataset):
+        """Files land in instrument/sample/date directories; _metadata lists them all."""
+        import pyarrow.parquet as pq
+        files = dataset.files()
+        assert len(files) == 4
+        assert any(
+            f.parent.as_posix().endswith(
+                "instrument_type=flow_cytometry/biological_sample_id=P5_F10/acquisition_date=2025-11-04"
+            )
+            for f in files
+        )
+        summary = pq.read_metadata(dataset.summary_path)
+        assert summary.num_rows == 4 * 3000
+        assert "instrument_type" not in dataset.schema.names
+
+        partitions = dataset.partitions()
+        assert len(partitions) == 3
+        assert partitions["n_rows"].sum() == 12_000
+
+    def test_append_does_not_rewrite(self, dataset, tmp_path):
+        before = {f: f.stat().st_mtime_ns for f in dataset.files()}
+        written = dataset.append_fcs(FCSParser(self._fcs(tmp_path, "P5_F10_CD9.fcs", "05-Nov-2025", seed=9)))
+        after = dataset.files()
+
+        assert len(written) == 1 and written[0] in after
+        assert all(f.stat().st_mtime_ns == mtime for f, mtime in before.items())
+        assert len(dataset.read(["FSC-A"])) == 15_000
+
+    def test_reappend_is_skipped(self, dataset, tmp_path):
+        """Re-running over the same files adds nothing; changed content is appended."""
+        source = tmp_path / "P5_F10_CD81.fcs"
+        assert dataset.contains(source)
+        assert dataset.append_fcs(FCSParser(source)) == []
+        assert len(dataset.read(["FSC-A"])) == 12_000
+        assert len(dataset.files()) == 4
+
+        self._fcs(tmp_path, "P5_F10_CD81.fcs", "04-NOV-2025", seed=7)
+        assert not dataset.contains(source)
+        assert len(dataset.append_fcs(FCSParser(source))) == 1
+        assert len(dataset.read(["FSC-A"])) == 15_000
+
+    def test_partition_pruned_query(self, dataset):
+        """'All CD81 runs in November' opens only November partitions."""
+        import pyarrow.compute as pc
+        november = [("acquisition_date", ">=", "2025-11-01"), ("acquisition_date", "<", "2025-12-01")]
+        assert len(dataset.files(november)) == 3
+
+        date = pc.field("acquisition_date")
+        result = dataset.read(
+            ["FSC-A", "file_name", "acquisition_date"],
+            filters=(date >= "2025-11-01") & (date < "2025-12-01")
+            & pc.match_substring(pc.field("file_name"), "CD81"),
+        )
+        assert set(result["file_name"]) == {"P5_F10_CD81.fcs"}
+        assert len(result) == 3000
+
+        with pytest.raises(KeyError):
+            dataset.read(["FL9-A"])
+
+    def test_schema_is_fixed(self, dataset):
+        frame = dataset.read(filters=[("biological_sample_id", "==", "P5_F10")]).head(10)
+        with pytest.raises(ValueError):
+            dataset.append(frame.assign(extra=1.0))
+
+        # Missing columns are filled with nulls
+        dataset.append(frame.drop(columns=["SSC-A"]), name="subset")
+        assert dataset.read(["SSC-A"])["SSC-A"].isna().sum() == 10
+        assert dataset.append(frame.iloc[:0]) == []
+
+    def test_rebuild_summary(self, dataset):
+        dataset.summary_path.unlink()
+        assert len(dataset.read(["FSC-A"])) == 12_000  # directory discovery
+        dataset.rebuild_summary()
+        assert dataset.summary_path.exists()
+        assert len(dataset.files()) == 4
+
+    def test_parquet_writer_partition_cols(self, tmp_path):
+        """ParquetWriter.write(partition_cols=...) appends to a partitioned dataset."""
+        import pyarrow.dataset as ds
+        from src.parsers.parquet_writer import ParquetWriter
+        df = pd.DataFrame({"x": [1.0, 2.0, 3.0], "sample": ["a", "b", "a"]})
+        ParquetWriter.write(df, tmp_path / "ds", partition_cols=["sample"])
+        ParquetWriter.write(df, tmp_path / "ds", partition_cols=["sample"])
+
+        assert sorted(p.name for p in (tmp_path / "ds").iterdir()) == ["sample=a", "sample=b"]
+        table = ds.dataset(tmp_path / "ds", partitioning="hive").to_table(filter=ds.field("sample") == "a")
+        assert table.num_rows == 4
+
+
+class TestConversionManifest:
+    """Tests for the content-hash conversion manifest."""
+
+    @pytest.fixture
+    def archive(self, tmp_path):
+        inputs = []
+        for name in ("a.fcs", "b.fcs", "c.fcs"):
+            path = tmp_path / "raw" / name
+            path.parent.mkdir(exist_ok=True)
+            path.write_bytes(name.encode() * 1000)
+            inputs.append(path)
+        return inputs
+
+    @staticmethod
+    def _convert(manifest, paths, out_dir):
+        out_dir.mkdir(exist_ok=True)
+        for path in paths:
+            output = out_dir / f"{path.stem}.parquet"
+            output.write_bytes(b"converted")
+            manifest.record_success(path, output)
+
+    def test_skips_unchanged_files(self, archive, tmp_path):
+        from src.parsers.conversion_manifest import ConversionManifest
+        out_dir = tmp_path / "out"
+        output_for = lambda p: out_dir / f"{p.stem}.parquet"
+        manifest = ConversionManifest(tmp_path / "manifest.sqlite", version="v1")
+
+        assert manifest.pending(archive, output_for=output_for) == archive
+        self._convert(manifest, archive, out_dir)
+        assert manifest.pending(archive, output_for=output_for) == []
+
+        # Modified content, deleted output and a version bump are reconverted
+        archive[0].write_bytes(b"new acquisition")
+        (out_dir / "b.parquet").unlink()
+        assert manifest.pending(archive, output_for=output_for) == archive[:2]
+        assert ConversionManifest(tmp_path / "manifest.sqlite", version="v2").pending(archive) == archive
+
+    def test_duplicate_content_settles(self, archive, tmp_path):
+        """Byte-identical copies at different paths keep their own records."""
+        from src.parsers.conversion_manifest import ConversionManifest
+        archive[1].write_bytes(archive[0].read_bytes())
+        out_dir = tmp_path / "out"
+        output_for = lambda p: out_dir / f"{p.stem}.parquet"
+        manifest = ConversionManifest(tmp_path / "manifest.sqlite", version="v1")
+
+        self._convert(manifest, manifest.pending(archive, output_for=output_for), out_dir)
+        assert manifest.pending(archive, output_for=output_for) == []
+        assert len(manifest.entries()) == 3
+
+    def test_migrates_content_keyed_manifest(self, archive, tmp_path):
+        """Manifests keyed on (content_hash, version) only are re-keyed in place."""
+        import sqlite3
+        from src.parsers.conversion_manifest import ConversionManifest, content_hash
+        db = tmp_path / "manifest.sqlite"
+        output = tmp_path / "a.parquet"
+        output.write_bytes(b"converted")
+        with sqlite3.connect(db) as conn:
+            conn.execute(
+                "CREATE TABLE conversions (content_hash TEXT NOT NULL, version TEXT NOT NULL, "
+                "file_path TEXT NOT NULL, output_path TEXT, status TEXT NOT NULL, error TEXT, "
+                "converted_at TEXT NOT NULL, PRIMARY KEY (content_hash, version))"
+            )
+            conn.execute(
+                "INSERT INTO conversions VALUES (?, 'v1', ?, ?, 'success', NULL, '2026-01-01T00:00:00')",
+                (content_hash(archive[0]), str(archive[0]), str(output)),
+            )
+        conn.close()
+
+        manifest = ConversionManifest(db, version="v1")
+        assert manifest.pending(archive) == archive[1:]
+
+    def test_resume_after_partial_run(self, archive, tmp_path):
+        """A crashed run keeps its completed files; failures stay pending."""
+        from src.parsers.conversion_manifest import ConversionManifest
+        db = tmp_path / "manifest.sqlite"
+        self._convert(ConversionManifest(db, version="v1"), archive[:1], tmp_path / "out")
+        ConversionManifest(db, version="v1").record_failure(archive[1], "truncated DATA segment")
+
+        manifest = ConversionManifest(db, version="v1")
+        assert manifest.pending(archive) == archive[1:]
+        statuses = {Path(e["file_path"]).name: e["status"] for e in manifest.entries()}
+        assert statuses == {"a.fcs": "success", "b.fcs": "error"}
+
+    def test_hashes_cached_by_stat(self, archive, tmp_path, monkeypatch):
+        import os
+        from src.parsers import conversion_manifest
+        manifest = conversion_manifest.ConversionManifest(tmp_path / "manifest.sqlite", version="v1")
+        first = manifest.fingerprints(archive)
+        assert first[archive[0]] == conversion_manifest.content_hash(archive[0])
+
+        hashed = []
+        real_hash = conversion_manifest.content_hash
+        monkeypatch.setattr(conversion_manifest, "content_hash", lambda p: hashed.append(p) or real_hash(p))
+        assert manifest.fingerprints(archive) == first
+        assert hashed == []
+
+        stat = archive[2].stat()
+        os.utime(archive[2], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        manifest.fingerprints(archive)
+        assert hashed == [archive[2]]
+
+
 class TestNTAParser:
     """Tests for NTA parser."""
     
@@ -48,6 +777,72 @@ class TestNTAParser:
         # TODO: Test with sample NTA file
         pass
 
+    NTA_HEADER = (
+        "Sample:\tEV_test_P1\n"
+        "Temperature:\t25.340000\tsensed\n"
+        "Date:\t2025-02-19\n"
+        "Time:\t12:26:19\n"
+        "Type of Measurement:\tSize Distribution\n"
+        "Positions:\t11\n"
+    )
+    
+    def _write_size(self, path: Path) -> Path:
+        path.write_text(
+            self.NTA_HEADER
+            + "Size Distribution\n"
+            + "Size / nm\tNumber\tConcentration / cm-3\tVolume / nm^3\tArea / nm^2\n"
+            + "5.000E+0\t1.000E+0\t2.500E+5\t6.545E+1\t7.854E+1\n"
+            + "# comment row\n"
+            + "1.500E+1\t3.000E+0\t7.500E+5\t1.767E+3\t7.069E+2\n"
+            + "-1.000E+0\t-1.000E+0\t-1.000E+0\t-1.000E+0\t0.000E+0\n"
+            + "9.000E+1\t9.000E+0\t9.000E+0\t9.000E+0\t9.000E+0\n"
+        )
+        return path
+    
+    def test_size_section_read(self, tmp_path):
+        """Size rows stop at the -1 marker; comment rows are skipped."""
+        parser = NTAParser(self._write_size(tmp_path / "20250219_0001_EV_test_size_488.txt"))
+        df = parser.parse()
+        
+        assert len(df) == 2
+        assert df['size_nm'].tolist() == [5.0, 15.0]
+        assert df['size_nm'].dtype == np.float64
+        assert (df['sample_id'] == parser.sample_id).all()
+        assert (df['instrument_type'] == 'nta').all()
+        assert df['measurement_datetime'].iloc[0] == pd.Timestamp("2025-02-19 12:26:19")
+        assert list(df.columns).count('sample_id') == 1
+    
+    def test_11pos_keeps_empty_fields_aligned(self, tmp_path):
+        """Rows with an empty 'Use' field do not shift into the next column."""
+        path = tmp_path / "20250219_0001_EV_test_size_488_11pos.txt"
+        path.write_text(
+            self.NTA_HEADER
+            + "Use\tPosition\tMean Int.\tAv. No of Particles\tConc. (p./mL)\tRemoval\n"
+            + "X\t0.10\t4.4\t20.0\t8.6E+6\t\n"
+            + "\t0.15\t4.9\t21.0\t9.0E+6\tMIN_TRACES\n"
+            + "Mean\t\t4.65\t20.5\t8.8E+6\t\n"
+        )
+        df = NTAParser(path).parse()
+        
+        assert len(df) == 2
+        assert df['Position'].tolist() == [0.10, 0.15]
+        assert df['Use'].iloc[0] == 'X' and pd.isna(df['Use'].iloc[1])
+        assert df['concentration_particles_ml'].tolist() == [8.6e6, 9.0e6]
+        assert pd.isna(df['qc_flag'].iloc[0]) and df['qc_flag'].iloc[1] == 'MIN_TRACES'
+    
+    def test_parse_nta_files(self, tmp_path):
+        """Directory ingest runs in sorted order and captures failures."""
+        for name in ("b_size_488.txt", "a_size_488.txt"):
+            self._write_size(tmp_path / name)
+        
+        results = parse_nta_files(tmp_path, max_workers=2)
+        assert [r['file_name'] for r in results] == ["a_size_488.txt", "b_size_488.txt"]
+        assert all(r['error'] is None and len(r['parser'].data) == 2 for r in results)
+        
+        missing = parse_nta_files([tmp_path / "a_size_488.txt", tmp_path / "missing_size.txt"])
+        assert missing[0]['error'] is None
+        assert missing[1]['parser'] is None and missing[1]['error']
+
 
 class TestDataIntegration:
     """Tests for data integration."""